@@ -10,14 +10,17 @@ from core.exception import AlertException
 from core.models import Board, BoardNew, Scrap, BoardFile, BoardGood
 from core.formclass import BoardForm
 from core.template import AdminTemplates
+from lib.cache import get_cache
 from lib.common import (
-    dynamic_create_write_table, FileCache, get_from_list,
+    dynamic_create_write_table, get_from_list,
     safe_int_convert, select_query, set_url_query_params
 )
 from lib.dependency.board import get_board
 from lib.dependency.dependencies import (
     common_search_query_params, validate_token
 )
+from lib.fulltext import create_search_index, drop_search_index
+from lib.g5_compatibility import TableColumnCache
 from lib.template_functions import (
     get_editor_select, get_group_select,
     get_member_level_select, get_paging, get_skin_select,
@@ -105,7 +108,7 @@ async def board_list_update(
             db.commit()
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            get_cache().delete_tag(f'latest-{board.bo_table}')
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -142,12 +145,15 @@ async def board_list_delete(
 
             # 게시판 테이블 삭제
             write_model = dynamic_create_write_table(table_name=board.bo_table, create_table=False)
+            drop_search_index(db, write_model)  # 전문 검색 인덱스(FTS 테이블) 삭제
             write_model.__table__.indexes.clear()  # 인덱스까지 삭제해야 동일한 table로 재생성시 에러가 안남
             write_model.__table__.drop(DBConnect().engine)
             _created_models.pop(board.bo_table, None)  # 동적 모델 캐싱 삭제
+            TableColumnCache.invalidate(write_model.__tablename__)  # 컬럼 정보 캐시 삭제
 
-            # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{board.bo_table}')
+            # 최신글, 본문 변환 캐시 삭제
+            get_cache().delete_tag(f'latest-{board.bo_table}')
+            get_cache().delete_tag(f'content-{board.bo_table}')
 
     url = "/admin/board_list"
     query_params = request.query_params
@@ -238,8 +244,9 @@ async def board_form_update(
         db.add(new_board)
         db.commit()
 
-        # 게시판 테이블 생성
-        dynamic_create_write_table(table_name=bo_table, create_table=True)
+        # 게시판 테이블, 전문 검색 인덱스 생성
+        write_model = dynamic_create_write_table(table_name=bo_table, create_table=True)
+        create_search_index(db, write_model)
 
     # 수정
     elif action == "u":
@@ -274,7 +281,7 @@ async def board_form_update(
             db.commit()
 
     # 최신글 캐시 삭제
-    FileCache().delete_prefix(f'latest-{bo_table}')
+    get_cache().delete_tag(f'latest-{bo_table}')
 
     url = f"/admin/board_form/{bo_table}"
     query_params = request.query_params
@@ -340,6 +347,9 @@ async def board_copy_update(
                                          bo_table, write.wr_id,
                                          target_table, write.wr_id)
 
+    # 복사된 게시글로 전문 검색 인덱스 생성
+    create_search_index(db, target_write_model)
+
     content = """
     <script>
         window.opener.location.href = "/admin/board_list";
@@ -7,6 +7,7 @@ from sse_starlette import EventSourceResponse
 
 from core.database import db_session
 from core.template import AdminTemplates
+from lib.cache import get_cache
 from lib.dependency.dependencies import validate_super_admin
 
 router = APIRouter(dependencies=[Depends(validate_super_admin)])
@@ -56,6 +57,11 @@ async def cache_file_deleting(request: Request, db: db_session):
                     yield f"data: ({count}) {filename} {file_dir} 삭제 \n\n"
             else:
                 yield f"data: {cache_directory} 디렉토리가 존재하지 않습니다. \n\n"
+
+            # 캐시 저장소 비우기
+            # 캐시 디렉토리의 태그 버전 파일이 삭제된 후에 실행해야 다른 워커의 캐시도 무효화됩니다.
+            get_cache().clear()
+            yield "data: 캐시 저장소를 비웠습니다. \n\n"
         except Exception as e:
             yield f"data: [끝]오류가 발생했습니다. {str(e)} \n\n"
             raise
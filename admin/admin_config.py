@@ -1,5 +1,4 @@
 """기본환경설정 관리 Template Router"""
-import re
 import socket
 from typing import List
 
@@ -13,7 +12,9 @@ from core.formclass import ConfigForm
 from core.models import Config
 from core.template import AdminTemplates
 from lib.common import get_client_ip, get_host_public_ip
+from lib.config_cache import ConfigCache
 from lib.dependency.dependencies import validate_super_admin, validate_token
+from lib.ip_matcher import get_ip_matcher
 from lib.template_functions import (
     get_editor_select, get_member_level_select, get_skin_select,
     get_member_id_select
@@ -68,14 +69,8 @@ async def config_form_update(
     # 차단 IP 리스트에 현재 접속 IP 가 있으면 접속이 불가하게 되므로 저장하지 않는다.
     if form_data.cf_intercept_ip:
         client_ip = get_client_ip(request)
-        ip_patterns = form_data.cf_intercept_ip.split("\n")
-        for pattern in ip_patterns:
-            if not pattern.strip():
-                continue
-            pattern = pattern.replace(".", r"\.")
-            pattern = pattern.replace("+", r"[0-9\.]+")
-            if re.match(fr"^{pattern}$", client_ip):
-                raise AlertException("현재 접속 IP : " + client_ip + " 가 차단될수 있으므로 다른 IP를 입력해 주세요.")
+        if get_ip_matcher(form_data.cf_intercept_ip).match(client_ip):
+            raise AlertException("현재 접속 IP : " + client_ip + " 가 차단될수 있으므로 다른 IP를 입력해 주세요.")
 
     # 본인인증 설정 체크
     if (form_data.cf_cert_use
@@ -94,5 +89,6 @@ async def config_form_update(
     for field, value in form_data.__dict__.items():
         setattr(config, field, value)
     db.commit()
+    ConfigCache.invalidate()
 
     return RedirectResponse("/admin/config_form", status_code=303)
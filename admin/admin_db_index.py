@@ -0,0 +1,47 @@
+from fastapi import APIRouter, Depends, Request
+
+from core.database import DBConnect, db_session
+from core.exception import AlertException
+from core.template import AdminTemplates
+from lib.db_index import create_missing_indexes, explain_hot_path_queries, get_index_status
+from lib.dependency.dependencies import validate_super_admin, validate_token
+from lib.fulltext import create_search_indexes
+
+router = APIRouter(dependencies=[Depends(validate_super_admin)])
+templates = AdminTemplates()
+
+DB_INDEX_MENU_KEY = "100910"
+
+
+@router.get("/db_index")
+async def db_index(request: Request):
+    """
+    DB 인덱스 점검 화면
+    """
+    request.session["menu_key"] = DB_INDEX_MENU_KEY
+    engine = DBConnect().engine
+
+    context = {
+        "request": request,
+        "indexes": get_index_status(engine),
+        "plans": explain_hot_path_queries(engine),
+    }
+    return templates.TemplateResponse("db_index.html", context)
+
+
+@router.post("/db_index_update", dependencies=[Depends(validate_token)])
+async def db_index_update(request: Request, db: db_session):
+    """
+    빠진 DB 인덱스 생성, 게시판 전문 검색 인덱스 생성(동기화)
+    """
+    created = create_missing_indexes(DBConnect().engine)
+    if created:
+        message = f"{len(created)}개의 인덱스를 생성했습니다. ({', '.join(created)})"
+    else:
+        message = "생성할 인덱스가 없습니다."
+
+    # 전문 검색(DB_FULLTEXT_SEARCH)을 사용하는 경우에만 실행됩니다.
+    search_tables = create_search_indexes(db)
+    if search_tables:
+        message += f"\\n{len(search_tables)}개 게시판의 전문 검색 인덱스를 생성(동기화)했습니다."
+    raise AlertException(message, url="/admin/db_index")
@@ -13,10 +13,11 @@ from core.database import db_session
 from core.exception import AlertException
 from core.database import db_connect
 from core.models import Group, Mail, Member
+from core.settings import settings
 from core.template import AdminTemplates
 from lib.common import get_admin_email, get_admin_email_name, select_query
 from lib.dependency.dependencies import common_search_query_params, validate_token
-from lib.mail import mailer
+from lib.mail import mailer, send_mail_now
 from lib.template_functions import get_group_select, get_paging
 
 router = APIRouter()
@@ -187,8 +188,12 @@ async def mail_test(
     mb_md5 = hashlib.md5(f"{mb_id}{email}{login_member.mb_datetime}".encode()).hexdigest()
     content = content + f'<p>더 이상 정보 수신을 원치 않으시면 [<a href="/bbs/email_stop/{mb_id}&mb_md5={mb_md5}" target="_blank">수신거부</a>] 해 주십시오.</p>' 
 
-    # 메일 발송
-    mailer(get_admin_email(request), email, subject, content, get_admin_email_name(request))
+    # 메일 발송 (발송 결과를 확인하기 위해 대기열을 사용하지 않고 바로 발송)
+    error = await asyncio.to_thread(
+        send_mail_now, get_admin_email(request), email, subject, content, get_admin_email_name(request)
+    )
+    if error:
+        raise AlertException(f"{nick}({email})님께 테스트 메일을 발송하지 못했습니다.\\n{error}")
 
     raise AlertException(f"{nick}({email})님께 테스트 메일을 발송하였습니다. 확인하여 주십시오.")
 
@@ -385,8 +390,9 @@ async def mail_select_send(
                 mailer(from_mail, mb_email, subject, content, from_name)
                 count += 1
 
-                # 10명마다 1초씩 쉬어줍니다.
-                if count % 10 == 0:
+                # 바로 발송하는 경우 10명마다 1초씩 쉬어줍니다.
+                # (발송 대기열을 사용하는 경우 등록만 하므로 쉬지 않습니다.)
+                if settings.MAIL_WORKERS <= 0 and count % 10 == 0:
                     await asyncio.sleep(sleepsec)  # 비동기 sleep 사용
 
                 # 발송 상태를 'yield'를 사용하여 전송합니다.
@@ -13,9 +13,9 @@ from core.models import Point, Member
 from core.template import AdminTemplates
 from lib.common import select_query, set_url_query_params
 from lib.dependency.dependencies import common_search_query_params, validate_token
+from lib.member import MemberCache
 from lib.template_functions import get_paging
-from service.member_service import MemberService
-from service.point_service import PointService
+from service.point_service import PointBalanceService, PointService
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -106,7 +106,6 @@ async def point_update(
 async def point_list_delete(
     request: Request,
     db: db_session,
-    member_service: Annotated[MemberService, Depends()],
     service: Annotated[PointService, Depends()],
     checks: List[int] = Form(None, alias="chk[]"),
     po_id: List[int] = Form(None, alias="po_id[]"),
@@ -129,21 +128,23 @@ async def point_list_delete(
         elif point.po_use_point > 0:
             service.insert_use_point(point.mb_id, point.po_use_point, point.po_id)
 
-        # 포인트 내역 삭제
+        # 포인트 내역 삭제, po_mb_point 반영, 회원 포인트 갱신을 한번에 commit합니다.
+        mb_id, point_id, po_point = point.mb_id, point.po_id, point.po_point
         db.delete(point)
-        db.commit()
 
         # po_mb_point에 반영
         db.execute(
             update(Point)
-            .values(po_mb_point=Point.po_mb_point - point.po_point)
-            .where(Point.mb_id == point.mb_id, Point.po_id > point.po_id)
+            .values(po_mb_point=Point.po_mb_point - po_point)
+            .where(Point.mb_id == mb_id, Point.po_id > point_id)
         )
-        db.commit()
 
         # 회원 포인트 갱신
-        sum_point = service.get_total_point(point.mb_id)
-        member_service.update_member_point(point.mb_id, sum_point)
+        if po_point:
+            PointBalanceService.add_balance(db, mb_id, -po_point)
+        db.commit()
+        if po_point:
+            MemberCache.invalidate(mb_id)
 
     url = "/admin/point_list"
     query_params = request.query_params
@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime
 
 from fastapi import APIRouter, Depends, Request, Form
@@ -7,7 +8,7 @@ from lib.common import (
     domain_mail_host, get_admin_email, get_admin_email_name
 )
 from lib.dependency.dependencies import validate_token
-from lib.mail import mailer
+from lib.mail import send_mail_now
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -48,11 +49,16 @@ async def sendmail_test_result(
     from_email = get_admin_email(request)
     from_name = get_admin_email_name(request)
     real_emails = to_email.split(',') if ',' in to_email else [to_email]
+    # 발송 결과를 확인하기 위해 대기열을 사용하지 않고 바로 발송
+    errors = {}
     for to_email in real_emails:
-        mailer(from_email, to_email, subject, body, from_name)
+        error = await asyncio.to_thread(send_mail_now, from_email, to_email, subject, body, from_name)
+        if error:
+            errors[to_email] = error
 
     context = {
         "request": request,
         "real_emails": real_emails,
+        "errors": errors,
     }
     return templates.TemplateResponse("sendmail_test_result.html", context)
@@ -1,17 +1,17 @@
 import re
 from datetime import datetime
-from typing import List
 
 from fastapi import APIRouter, Depends, Form, Query, Request
 from sqlalchemy import asc, cast, delete, desc, extract, func, select, String
 
 from core.database import db_session
 from core.exception import AlertException
-from core.models import Visit
+from core.models import Visit, VisitRollup
 from core.template import AdminTemplates
 from lib.dependency.dependencies import validate_super_admin, validate_token
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import async_validate_password
 from lib.template_functions import get_paging
+from service.visit_rollup_service import VisitRollupService, get_referer_domain
 
 router = APIRouter()
 templates = AdminTemplates()
@@ -112,7 +112,7 @@ async def visit_delete_update(
     """
     member = request.state.login_member
 
-    if not validate_password(admin_password, member.mb_password):
+    if not await async_validate_password(admin_password, member.mb_password):
         raise AlertException("관리자 비밀번호가 일치하지 않습니다.")
 
     if not year:
@@ -127,9 +127,11 @@ async def visit_delete_update(
     delete_date = datetime(year, month, 1)
 
     query = delete(Visit)
+    rollup_query = delete(VisitRollup)
     if method == "before":
         # 이전 자료 삭제
         query = query.where(Visit.vi_date < delete_date)
+        rollup_query = rollup_query.where(VisitRollup.vr_date < delete_date)
 
     elif method == "specific":
         # 당월 자료만 삭제
@@ -137,10 +139,17 @@ async def visit_delete_update(
             extract('year', Visit.vi_date) == year,
             extract('month', Visit.vi_date) == month
         )
+        rollup_query = rollup_query.where(
+            extract('year', VisitRollup.vr_date) == year,
+            extract('month', VisitRollup.vr_date) == month
+        )
     else:
         raise AlertException("잘못된 요청입니다.", 400)
 
+    VisitRollupService.create_table(db)
     result = db.execute(query)
+    # 방문자 집계도 같은 기간을 삭제합니다.
+    db.execute(rollup_query)
     db.commit()
 
     raise AlertException(
@@ -234,43 +243,18 @@ async def visit_domain(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    site_url = f"{request.base_url.scheme}://{request.base_url.hostname}"
-    if request.base_url.port:
-        site_url += f":{request.base_url.port}"
-    # referer에서 도메인 필터링
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        # http or https
-        match = re.search(r'^http[s]*\S+', visit.vi_referer)
-        if match:
-            match_group = match.group()
-            referer: str = re.sub(r"^(www\.|search\.|dirsearch\.|dir\.search\.|dir\.|kr\.search\.|myhome\.)(.*)",
-                                  "\\2", match_group)
-            filtered_visits.append({
-                "vi_referer": '직접' if referer.startswith(site_url) else referer,
-                "count": 1,
-            })
-        else:
-            filtered_visits.append({
-                "vi_referer": '직접',
-                "count": 1,
-            })
-        total_records += 1
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
 
-    visits = count_by_field(filtered_visits, "vi_referer")
-    visits = add_percent_field(visits)
+    # 유입 도메인이 없거나 사이트 도메인이면 직접 접속
+    site_domain = get_referer_domain(str(request.base_url))
+    is_direct = frame["vr_domain"].isin(["", site_domain])
+    domains = frame["vr_domain"].mask(is_direct, "직접")
+    visits = VisitRollupService.count_by(frame, domains, "vi_referer")
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
@@ -290,30 +274,13 @@ async def visit_browser(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 브라우저별 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "vi_browser": visit.vi_browser or get_browser(visit.vi_agent),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "vi_browser")
-    visits = add_percent_field(visits)
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    visits = VisitRollupService.count_by(frame, "vr_browser", "vi_browser")
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
@@ -333,30 +300,13 @@ async def visit_os(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # OS별 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "vi_os": visit.vi_os or get_os(visit.vi_agent),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "vi_os")
-    visits = add_percent_field(visits)
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    visits = VisitRollupService.count_by(frame, "vr_os", "vi_os")
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
@@ -376,30 +326,13 @@ async def visit_device(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속기기별 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "vi_device": visit.vi_device,
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "vi_device")
-    visits = add_percent_field(visits)
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    visits = VisitRollupService.count_by(frame, "vr_device", "vi_device")
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
@@ -417,32 +350,15 @@ async def visit_hour(
     시간별 접속자집계 목록
     """
     request.session["menu_key"] = VISIT_MENU_KEY
-    dialect = db.bind.dialect.name
     from_date, to_date = validate_time(from_date, to_date)
 
-    query = select().where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    # 합계
-    total_count = db.scalar(query.add_columns(func.count(Visit.vi_id)))
-    # 시간별 접속자집계
-    # TODO: postgresql는 테스트가 안되어 있음
-    if dialect == 'mysql':
-        query = query.add_columns(func.hour(Visit.vi_time).label('hour'))
-    elif dialect == 'postgresql':
-        query = query.add_columns(func.to_char(Visit.vi_time, 'HH24').label('hour'))
-    elif dialect == 'sqlite':
-        query = query.add_columns(func.strftime('%H', Visit.vi_time).label('hour'))
-    query_result = db.execute(
-        query.add_columns(func.count().label('hour_count'))
-        .group_by('hour')
-    ).all()
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    total_count = int(frame["vr_count"].sum())
 
     # 00 ~ 23 시간별 접속자집계
     visits = {f"{hour:02d}": {"count": 0, "rate": 0} for hour in range(24)}
-
-    for result in query_result:
-        result_hour = int(result.hour)
-        visits[f"{result_hour:02d}"]["count"] = result.hour_count
-        visits[f"{result_hour:02d}"]["rate"] = round(result.hour_count / total_count * 100, 2)
+    for result in VisitRollupService.count_by(frame, "vr_hour", "hour", sort_by_count=False):
+        visits[f"{int(result['hour']):02d}"].update(count=result["count"], rate=result["percent"])
 
     context = {
         "request": request,
@@ -465,45 +381,17 @@ async def visit_weekday(
     요일별 접속자집계 목록
     """
     request.session["menu_key"] = VISIT_MENU_KEY
-    dialect = db.bind.dialect.name
     from_date, to_date = validate_time(from_date, to_date)
 
-    query = select().where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    # 합계
-    total_count = db.scalar(query.add_columns(func.count(Visit.vi_id)))
-    # 요일별 접속자집계
-    # TODO: postgresql는 테스트가 안되어 있음
-    if dialect == 'mysql':
-        query = query.add_columns(func.dayofweek(Visit.vi_date).label('dow'))
-    elif dialect == 'postgresql':
-        query = query.add_columns(func.to_char(Visit.vi_date, 'D').label('dow'))
-    elif dialect == 'sqlite':
-        query = query.add_columns(func.strftime('%w', Visit.vi_date).label('dow'))
-    query_result = db.execute(
-        query.add_columns(Visit.vi_date, func.count().label('dow_count'))
-        .group_by(Visit.vi_date, 'dow')
-        # 데이터베이스 별로 요일(day of week)을 출력하는 기준이 다르기 때문에
-        # vi_date 가 필요하다.
-    ).all()
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    total_count = int(frame["vr_count"].sum())
 
-    # 요일별 접속자집계
-    day_of_week = {
-        "Mon": "월",
-        "Tue": "화",
-        "Wed": "수",
-        "Thu": "목",
-        "Fri": "금",
-        "Sat": "토",
-        "Sun": "일",
-    }
-    visits = {value: {"count": 0, "rate": 0} for value in day_of_week.values()}
-
-    for result in query_result:
-        # 데이터베이스 별로 요일(day of week)을 출력하는 기준이 다르기 때문에
-        # 요일을 python 기준으로 다시한번 변경한다.
-        dow = day_of_week[result.vi_date.strftime("%a")]
-        visits[dow]["count"] = result.dow_count
-        visits[dow]["rate"] = round(result.dow_count / total_count * 100, 2)
+    # 요일별 접속자집계 (0: 월요일 ~ 6: 일요일)
+    day_of_week = ["월", "화", "수", "목", "금", "토", "일"]
+    visits = {value: {"count": 0, "rate": 0} for value in day_of_week}
+    weekdays = frame["vr_date"].dt.dayofweek
+    for result in VisitRollupService.count_by(frame, weekdays, "dow", sort_by_count=False):
+        visits[day_of_week[int(result["dow"])]].update(count=result["count"], rate=result["percent"])
 
     context = {
         "request": request,
@@ -528,30 +416,14 @@ async def visit_date(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "visit_date": visit.vi_date.strftime("%Y-%m-%d"),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "visit_date")
-    visits = add_percent_field(visits)
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    dates = frame["vr_date"].dt.strftime("%Y-%m-%d")
+    visits = VisitRollupService.count_by(frame, dates, "visit_date", sort_by_count=False)
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
@@ -571,30 +443,14 @@ async def visit_month(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "visit_month": visit.vi_date.strftime("%Y-%m"),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "visit_month")
-    visits = add_percent_field(visits)
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    months = frame["vr_date"].dt.strftime("%Y-%m")
+    visits = VisitRollupService.count_by(frame, months, "visit_month", sort_by_count=False)
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
@@ -614,125 +470,20 @@ async def visit_year(
     request.session["menu_key"] = VISIT_MENU_KEY
     from_date, to_date = validate_time(from_date, to_date)
 
-    # 초기 쿼리 설정
-    visits = db.scalars(
-        select(Visit)
-        .where(Visit.vi_date.between(from_date, to_date + " 23:59:59"))
-    ).all()
-
-    # 접속자집계
-    filtered_visits = []
-    total_records = 0
-    for visit in visits:
-        filtered_visits.append({
-            "visit_year": visit.vi_date.strftime("%Y"),
-            "count": 1,
-        })
-
-        total_records += 1
-
-    visits = count_by_field(filtered_visits, "visit_year")
-    visits = add_percent_field(visits)
+    frame = VisitRollupService.load_frame(db, from_date, to_date)
+    years = frame["vr_date"].dt.strftime("%Y")
+    visits = VisitRollupService.count_by(frame, years, "visit_year", sort_by_count=False)
 
     context = {
         "request": request,
         "visits": visits,
-        "total_records": total_records,
+        "total_records": int(frame["vr_count"].sum()),
         "fr_date": from_date,
         "to_date": to_date,
     }
     return templates.TemplateResponse("visit_year.html", context)
 
 
-def count_by_field(list: list, field_name: str) -> list:
-    """기존 리스트를 field_name 기준으로 합산합니다.
-    Args:
-        list (list): 접속자 리스트
-    """
-    temp = {}
-    for item in list:
-        referer = item[field_name]
-        count = item["count"]
-
-        if referer in temp:
-            temp[referer] += count
-        else:
-            temp[referer] = count
-    return [{field_name: key, "count": value} for key, value in temp.items()]
-
-
-def add_percent_field(list: List[dict]) -> list:
-    """기존 리스트에 백분율을 계산하여 percent 필드를 추가합니다.
-    Args:
-        list (list): 접속자 리스트 (count 필드가 있어야 함)
-    """
-    key_exists = any('count' in key for key in list)
-    if not key_exists:
-        return list
-
-    total_count = sum([item["count"] for item in list])
-    for item in list:
-        item["percent"] = round(item["count"] / total_count * 100, 2)
-    return list
-
-
-def get_browser(user_agent):
-    """브라우저이름을 반환합니다.
-    """
-    user_agent = user_agent.lower()
-
-    browsers = {
-        'Chrome': r"chrome",
-        'FireFox': r"firefox",
-        'Safari': r"safari",
-        'Opera': r"opera",
-        'MSIE': r"msie ([1-9][0-9]\.[0-9]+)",
-        'Mozilla': r"mozilla",
-        'Robot': r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook",
-        'IE': r"internet explorer"
-    }
-
-    for browser_name, pattern in browsers.items():
-        if re.search(pattern, user_agent):
-            return browser_name
-
-    return "other"  # todo 다국어
-
-
-def get_os(user_agent):
-    user_agent = user_agent.lower()
-
-    os_patterns = {
-        "Android": r"android",
-        "IOS": r"IOS",
-        "iPad OS": r"iPad",
-        "Phone": r"phone",
-        "Windows10": r"windows nt 10\.0",
-        "Windows8.1": r"windows nt 6\.3",
-        "Windows8": r"windows nt 6\.2",
-        "Windows7": r"windows nt 6\.1",
-        "Vista": r"windows nt 6\.0",
-        "XP": r"windows nt 5\.1",
-        "2003": r"windows nt 5\.2",
-        "NT": r"windows nt 4\.[0-9]*",
-        "CE": r"windows ce",
-        "MAC": r"mac",
-        "Robot": r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook ",
-        "Linux": r"linux",
-        "Solrais": r"solrais",
-        "IE": r"internet explorer",
-        "Mozilla": r"mozilla",
-        "IRIX": r"irix"
-    }
-
-    # Iterate through the patterns and return the first matching OS
-    for os_name, pattern in os_patterns.items():
-        if re.search(pattern, user_agent):
-            return os_name
-
-    return "other"
-
-
 def validate_time(from_date, to_date):
     if from_date:
         from_date = re.sub(r'[^0-9 :\-]', '', from_date)
@@ -1,7 +1,10 @@
 """JWT 관련 작업을 처리하는 클래스입니다."""
+import threading
+import time
 from datetime import datetime, timedelta
 from enum import Enum
 
+from cachetools import LRUCache
 from fastapi import HTTPException, status
 from jwt import encode, decode, ExpiredSignatureError, InvalidTokenError
 
@@ -32,6 +35,10 @@ class TokenType(Enum):
 class JWT:
     """JWT 관련 작업을 처리하는 클래스입니다."""
     JWT_TYPE = "Bearer"
+    # 서명 검증이 끝난 토큰 (토큰, 암호화 키) => Payload
+    # 같은 토큰으로 반복 요청할 때 서명을 다시 검증하지 않습니다.
+    _verified_tokens = LRUCache(maxsize=4096)
+    _verified_tokens_lock = threading.Lock()
 
     @staticmethod
     def create_token(token_type: TokenType, data: dict = None) -> str:
@@ -82,14 +89,23 @@ class JWT:
             headers={"WWW-Authenticate": JWT.JWT_TYPE},
         )
 
+        cache_key = (token, secret_key)
+        with JWT._verified_tokens_lock:
+            payload = JWT._verified_tokens.get(cache_key)
+        # 만료된 토큰은 다시 디코딩하여 만료 예외를 발생시킵니다.
+        if payload is not None and (payload.exp is None or payload.exp > time.time()):
+            return payload
+
         try:
-            payload = decode(
+            payload = TokenPayload(**decode(
                 token,
                 secret_key,
                 algorithms=[api_settings.AUTH_ALGORITHM],
                 audience=api_settings.AUTH_AUDIENCE,
-            )
-            return TokenPayload(**payload)
+            ))
+            with JWT._verified_tokens_lock:
+                JWT._verified_tokens[cache_key] = payload
+            return payload
         except ExpiredSignatureError as e:
             http_exception.detail = f"Token has expired. {e}"
             raise http_exception from e
@@ -13,6 +13,7 @@ from api.v1.service.member import MemberServiceAPI, ValidateMemberAPI
 from api.v1.models.auth import TokenPayload
 from api.v1.models.member import CreateMember, UpdateMember
 from lib.common import is_none_datetime
+from lib.member import MemberCache
 from lib.pbkdf2 import validate_password
 
 
@@ -46,7 +47,11 @@ async def get_current_member(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    member = member_service.get_member(mb_id)
+    # 같은 토큰으로 반복 요청하는 경우 캐시된 회원 정보를 사용합니다.
+    member = MemberCache.get(member_service.db, mb_id, payload.iat)
+    if member is None:
+        member = member_service.get_member(mb_id)
+        MemberCache.set(member, payload.iat)
 
     return member
 
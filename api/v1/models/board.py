@@ -282,6 +282,8 @@ class ResponseBoardListModel(PaginationResponse):
     current_page: int
     prev_spt: Union[int, None]
     next_spt: Union[int, None]
+    prev_cursor: Union[str, None] = None
+    next_cursor: Union[str, None] = None
 
 
 class ResponseGroupModel(BaseModel):
@@ -345,6 +347,7 @@ class ResponseSearchModel(PaginationResponse):
     """검색 결과 모델"""
     onetable: Union[str, None]
     boards: List[ResponseSearchBoardModel]
+    timeout_boards: List[str] = Field([], description="검색 시간이 초과된 게시판 목록")
 
 
 class WriteTransportation(Enum):
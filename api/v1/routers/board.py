@@ -1,6 +1,6 @@
-from typing_extensions import Annotated, List
+from typing_extensions import Annotated, List, Optional
 from fastapi import (
-    APIRouter, Depends, Path, HTTPException, status, Body
+    APIRouter, Depends, Path, HTTPException, Query, status, Body
 )
 from fastapi.responses import FileResponse
 from fastapi.encoders import jsonable_encoder
@@ -8,6 +8,7 @@ from fastapi.encoders import jsonable_encoder
 from core.database import db_session
 from lib.common import get_paging_info
 from lib.board_lib import insert_board_new, set_write_delay, get_list_thumbnail
+from lib.fulltext import update_search_index
 from api.v1.models.response import (
     response_401, response_403, response_404, response_422
 )
@@ -43,17 +44,33 @@ credentials_exception = HTTPException(
             )
 async def api_list_post(
     service: Annotated[ListPostServiceAPI, Depends(ListPostServiceAPI.async_init)],
-    pagination: Annotated[PagenationRequest, Depends()]
+    pagination: Annotated[PagenationRequest, Depends()],
+    cursor: Annotated[Optional[str], Query(title="목록 cursor",
+                                           description="이전 응답의 next_cursor 또는 prev_cursor 값. "
+                                                       "입력하면 page 대신 cursor 기준으로 목록을 조회합니다.")] = None,
+    use_cursor: Annotated[bool, Query(title="cursor 사용 여부",
+                                      description="cursor 없이 첫 목록을 cursor 방식으로 조회할 경우 true")] = False,
 ) -> ResponseBoardListModel:
     """
     게시판 정보, 글 목록을 반환합니다.
-    """
-    writes = service.get_writes(
-        with_files=True,
-        page=pagination.page,
-        per_page=pagination.per_page
-    )
-    total_records = service.get_total_count()
+    - cursor를 사용하면 OFFSET 없이 조회하며, total_records는 대략적인 게시글 수입니다.
+    """
+    if cursor or use_cursor:
+        writes = await service.run(
+            service.get_writes_by_cursor,
+            cursor=cursor,
+            with_files=True,
+            per_page=pagination.per_page
+        )
+        total_records = await service.run(service.get_approximate_total_count)
+    else:
+        writes = await service.run(
+            service.get_writes,
+            with_files=True,
+            page=pagination.page,
+            per_page=pagination.per_page
+        )
+        total_records = await service.run(service.get_total_count)
     paging_info = get_paging_info(
         pagination.page, pagination.per_page, total_records
     )
@@ -63,10 +80,12 @@ async def api_list_post(
         "categories": service.categories,
         "board": service.board,
         "writes": writes,
-        "total_count": service.get_total_count(),
+        "total_count": total_records,
         "current_page": service.search_params['current_page'],
         "prev_spt": service.prev_spt,
         "next_spt": service.next_spt,
+        "prev_cursor": service.prev_cursor,
+        "next_cursor": service.next_cursor,
     }
     return jsonable_encoder(content)
 
@@ -77,14 +96,13 @@ async def api_list_post(
                        **response_404, **response_422}
             )
 async def api_read_post(
-    db: db_session,
     service: Annotated[ReadPostServiceAPI, Depends(ReadPostServiceAPI.async_init)],
     ajax_service: Annotated[AJAXService, Depends(AJAXService.async_init)],
 ) -> ResponseWriteModel:
     """
     지정된 게시판의 글을 개별 조회합니다.
     """
-    ajax_good_data = ajax_service.get_ajax_good_data(service.bo_table, service.write)
+    ajax_good_data = await service.run(ajax_service.get_ajax_good_data, service.bo_table, service.write)
     thumbnail = get_list_thumbnail(
         service.request,
         service.board,
@@ -98,18 +116,18 @@ async def api_read_post(
         "images": service.images,
         "normal_files": service.normal_files,
         "links": service.get_links(),
-        "comments": service.get_comments(),
+        "comments": await service.run(service.get_comments),
         "good": ajax_good_data["good"],
         "nogood": ajax_good_data["nogood"],
     })
     content.update(additional_content)
-    service.validate_secret()
-    service.validate_repeat()
+    await service.run(service.validate_secret)
+    await service.run(service.validate_repeat)
     service.block_read_comment()
     service.validate_read_level()
-    service.check_scrap()
-    service.check_is_good()
-    db.commit()
+    await service.run(service.check_scrap)
+    await service.run(service.check_is_good)
+    await service.run(service.db.commit)
     return content
 
 
@@ -119,7 +137,6 @@ async def api_read_post(
                        **response_404, **response_422}
             )
 async def api_read_post(
-    db: db_session,
     service: Annotated[ReadPostServiceAPI, Depends(ReadPostServiceAPI.async_init)],
     ajax_service: Annotated[AJAXService, Depends(AJAXService.async_init)],
     wr_password: str = Body(..., title="비밀번호", description="비밀글 비밀번호")
@@ -130,9 +147,9 @@ async def api_read_post(
     ### Request Body
     - **wr_password**: 게시글 비밀번호
     """
-    write_password = service.get_write_password()
-    service.validate_read_wr_password(wr_password, write_password)
-    ajax_good_data = ajax_service.get_ajax_good_data(service.bo_table, service.write)
+    write_password = await service.run(service.get_write_password)
+    await service.validate_read_wr_password(wr_password, write_password)
+    ajax_good_data = await service.run(ajax_service.get_ajax_good_data, service.bo_table, service.write)
     thumbnail = get_list_thumbnail(
         service.request,
         service.board,
@@ -146,16 +163,16 @@ async def api_read_post(
         "images": service.images,
         "normal_files": service.normal_files,
         "links": service.get_links(),
-        "comments": service.get_comments(),
+        "comments": await service.run(service.get_comments),
         "good": ajax_good_data["good"],
         "nogood": ajax_good_data["nogood"],
     })
     content.update(additional_content)
-    service.validate_repeat()
+    await service.run(service.validate_repeat)
     service.block_read_comment()
-    service.check_scrap()
-    service.check_is_good()
-    db.commit()
+    await service.run(service.check_scrap)
+    await service.run(service.check_is_good)
+    await service.run(service.db.commit)
     return content
 
 
@@ -194,7 +211,7 @@ async def api_create_post(
     service.validate_post_content(wr_data.wr_subject)
     service.validate_post_content(wr_data.wr_content)
     service.validate_write_level()
-    service.arrange_data(wr_data, wr_data.secret, wr_data.html, wr_data.mail)
+    await service.arrange_data(wr_data, wr_data.secret, wr_data.html, wr_data.mail)
     write = service.save_write(wr_data.parent_id, wr_data)
     insert_board_new(service.bo_table, write)
     service.add_point(write)
@@ -239,11 +256,11 @@ async def api_update_post(
     """
     service.validate_restrict_comment_count()
     write = service.get_write(service.wr_id)
-    service.validate_author(write, wr_data.wr_password)
+    await service.validate_author(write, wr_data.wr_password)
     service.validate_secret_board(wr_data.secret, wr_data.html, wr_data.mail)
     service.validate_post_content(wr_data.wr_subject)
     service.validate_post_content(wr_data.wr_content)
-    service.arrange_data(wr_data, wr_data.secret, wr_data.html, wr_data.mail)
+    await service.arrange_data(wr_data, wr_data.secret, wr_data.html, wr_data.mail)
     service.save_write(write, wr_data)
     service.set_notice(write.wr_id, wr_data.notice)
     service.update_children_category(wr_data)
@@ -301,7 +318,7 @@ async def api_delete_post(
     """
     지정된 게시판의 비회원 글을 삭제합니다.
     """
-    service.validate_author(service.write, wr_password)
+    await service.validate_author(service.write, wr_password)
     service.validate_exists_reply()
     service.validate_exists_comment()
     service.delete_write()
@@ -421,7 +438,7 @@ async def api_create_comment(
     service.validate_comment_level()
     service.validate_point()
     service.validate_post_content(comment_data.wr_content)
-    comment = service.save_comment(comment_data, parent_write)
+    comment = await service.save_comment(comment_data, parent_write)
     service.add_point(comment)
     service.send_write_mail_(comment, parent_write)
     insert_board_new(bo_table, comment)
@@ -455,11 +472,12 @@ async def api_update_comment(
     if not comment:
         raise HTTPException(status_code=404, detail=f"{comment_data.comment_id} : 존재하지 않는 댓글입니다.")
 
-    service.validate_author(comment, comment_data.wr_password)
+    await service.validate_author(comment, comment_data.wr_password)
     service.validate_post_content(comment_data.wr_content)
     comment.wr_content = service.get_cleaned_data(comment_data.wr_content)
     comment.wr_option = comment_data.wr_option or "html1"
     comment.wr_last = service.g5_instance.get_wr_last_now(write_model.__tablename__)
+    update_search_index(db, write_model, [comment])
     db.commit()
     return {"result": "updated"}
 
@@ -492,6 +510,6 @@ async def api_delete_post(
     """
     지정된 게시판의 비회원 댓글을 삭제합니다.
     """
-    service.validate_author(service.write, wr_password)
+    await service.validate_author(service.write, wr_password)
     service.delete_comment()
     return {"result": "deleted"}
\ No newline at end of file
@@ -22,7 +22,7 @@ router = APIRouter()
             summary="최신 게시글 목록",
             responses={**response_401, **response_422})
 async def api_board_new_list(
-    service: Annotated[BoardNewServiceAPI, Depends()],
+    service: Annotated[BoardNewServiceAPI, Depends(BoardNewServiceAPI.async_init)],
     pagination: Annotated[PagenationRequest, Depends()],
     gr_id: str = Query(None, title="게시판 그룹 id", description="게시판 그룹 id"),
     view: BoardNewViewType = Query(None, title="게시판 view", description="게시판 view"),
@@ -36,9 +36,9 @@ async def api_board_new_list(
     current_page = pagination.page
     per_page = pagination.per_page
     offset = service.get_offset(current_page)
-    board_news = service.get_board_news(query, offset, per_page)
-    total_records = service.get_total_count(query)
-    service.arrange_borad_news_data(board_news, total_records, offset)
+    board_news = await service.run(service.get_board_news, query, offset, per_page)
+    total_records = await service.run(service.get_total_count, query)
+    await service.run(service.arrange_borad_news_data, board_news, total_records, offset)
     paging_info = get_paging_info(current_page, per_page, total_records)
 
     content = {
@@ -55,14 +55,14 @@ async def api_board_new_list(
             responses={**response_401, **response_422}
             )
 async def api_latest_posts(
-    service: Annotated[BoardNewServiceAPI, Depends()],
+    service: Annotated[BoardNewServiceAPI, Depends(BoardNewServiceAPI.async_init)],
     data: RequestBoardNewWrites = Depends(),
 ):
     """
     모든 게시판의 최신글을 조회합니다.
     """
     bo_table_list = get_bo_table_list()
-    latest_posts = service.get_latest_posts(bo_table_list, data.view_type.value, data.rows)
+    latest_posts = await service.run(service.get_latest_posts, bo_table_list, data.view_type.value, data.rows)
     return latest_posts
 
 
@@ -71,14 +71,14 @@ async def api_latest_posts(
             responses={**response_401, **response_422}
             )
 async def api_latest_posts_by_board(
-    service: Annotated[BoardNewServiceAPI, Depends()],
+    service: Annotated[BoardNewServiceAPI, Depends(BoardNewServiceAPI.async_init)],
     bo_table: Annotated[str, Path(..., title="게시판 코드", description="게시판 코드")],
     data: RequestBoardNewWrites = Depends(),
 ):
     """
     최신글을 게시판별로 조회합니다.
     """
-    latest_posts = service.get_latest_posts([bo_table], data.view_type.value, data.rows)
+    latest_posts = await service.run(service.get_latest_posts, [bo_table], data.view_type.value, data.rows)
     return latest_posts
 
 
@@ -28,10 +28,10 @@ async def api_search(
     게시판 검색
     - 게시판 종류와, 개별 게시판에 있는 게시글을 검색합니다.
     """
-    boards = service.get_boards()
+    boards = await service.run(service.get_boards)
     page = pagination.page
     per_page = pagination.per_page
-    searched_result = service.search(boards, sfl, stx, sop, page, per_page)
+    searched_result = await service.run(service.search, boards, sfl, stx, sop, page, per_page)
     total_search_count = searched_result["total_search_count"]
     boards = searched_result["boards"]
     paging_info = get_paging_info(page, per_page, total_search_count)
@@ -41,4 +41,5 @@ async def api_search(
         "total_pages": paging_info["total_pages"],
         "onetable": onetable,
         "boards": boards,
+        "timeout_boards": [board.bo_table for board in searched_result["timeout_boards"]],
     }
@@ -6,12 +6,13 @@ from api.v1.service.point import PointServiceAPI
 from api.v1.dependencies.member import get_current_member_optional, get_current_member
 from api.v1.models.board import WriteTransportationRequest
 from core.models import Board, Member
-from core.database import db_session
+from core.database import async_db_session, db_session
 from lib.dependency.dependencies import common_search_query_params
 from lib.board_lib import generate_reply_character, get_next_num
+from lib.fulltext import update_search_index
 from lib.template_filters import number_format
 from lib.member import get_admin_type, MemberDetails
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import async_validate_password
 from service.board import (
     GroupBoardListService, ListPostService, ReadPostService,
     CreatePostService, UpdatePostService, DownloadFileService,
@@ -75,12 +76,13 @@ class ListPostServiceAPI(ListPostService):
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         bo_table: Annotated[str, Path(..., title="게시판 테이블명", description="게시판 테이블명")],
         file_service: Annotated[BoardFileService, Depends()],
         search_params: Annotated[Dict, Depends(common_search_query_params)],
         member: Annotated[Member, Depends(get_current_member_optional)],
     ):
-        instance = cls(request, db, bo_table, file_service, search_params, member)
+        instance = await cls.create(async_db, request, db, bo_table, file_service, search_params, member)
         return instance
 
     def raise_exception(self, status_code: int, detail: str = None):
@@ -110,21 +112,22 @@ class ReadPostServiceAPI(ReadPostService):
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         file_service: Annotated[BoardFileService, Depends()],
         point_service: Annotated[PointServiceAPI, Depends()],
         bo_table: Annotated[str, Path(..., title="게시판 테이블명", description="게시판 테이블명")],
         wr_id: Annotated[int, Path(..., title="글 아이디", description="글 아이디")],
         member: Annotated[Member, Depends(get_current_member_optional)],
     ):
-        instance = cls(request, db, file_service, point_service, bo_table, wr_id, member)
+        instance = await cls.create(async_db, request, db, file_service, point_service, bo_table, wr_id, member)
         return instance
 
     def raise_exception(self, status_code: int, detail: str = None):
         raise HTTPException(status_code=status_code, detail=detail)
 
-    def validate_read_wr_password(self, wr_password: str, hashed_wr_password: str):
+    async def validate_read_wr_password(self, wr_password: str, hashed_wr_password: str):
         """게시글 비밀번호 검사"""
-        if not validate_password(wr_password, hashed_wr_password):
+        if not await async_validate_password(wr_password, hashed_wr_password):
             self.raise_exception(403, "비밀번호가 일치하지 않습니다.")
 
 class CreatePostServiceAPI(CreatePostService):
@@ -174,6 +177,7 @@ class CreatePostServiceAPI(CreatePostService):
 
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
+        update_search_index(self.db, self.write_model, [write])
         self.db.commit()
         return write
 
@@ -13,13 +13,14 @@ from core.models import WriteBaseModel
 from core.template import UserTemplates
 from lib.member import get_admin_type
 from lib.board_lib import (
-    set_image_width, url_auto_link, BoardConfig, get_list_thumbnail,
+    set_image_width, url_auto_link, render_write_content, BoardConfig, get_list_thumbnail,
     render_latest_posts, generate_reply_character, is_secret_write,
     is_owner, insert_board_new, set_write_delay
 )
 from lib.captcha import captcha_widget
 from lib.common import set_url_query_params, get_unique_id, remove_query_params
 from lib.dependency.board import get_write
+from lib.fulltext import update_search_index
 from lib.dependency.dependencies import (
     check_group_access, common_search_query_params, validate_captcha, validate_token
 )
@@ -38,6 +39,7 @@ router = APIRouter()
 templates = UserTemplates()
 templates.env.filters["set_image_width"] = set_image_width
 templates.env.filters["url_auto_link"] = url_auto_link
+templates.env.globals["render_write_content"] = render_write_content
 templates.env.globals["get_admin_type"] = get_admin_type
 templates.env.globals["get_unique_id"] = get_unique_id
 templates.env.globals["board_config"] = BoardConfig
@@ -76,10 +78,11 @@ async def list_post(
 ):
     """해당 게시판의 게시글 목록을 보여준다."""
     board = list_post_service.board
+    total_count = await list_post_service.run(list_post_service.get_total_count)
     paging = get_paging(
         list_post_service.request,
         list_post_service.search_params['current_page'],
-        list_post_service.get_total_count(),
+        total_count,
         list_post_service.page_rows
     )
 
@@ -93,9 +96,10 @@ async def list_post(
         "categories": list_post_service.categories,
         "board": board,
         "board_config": list_post_service,
-        "notice_writes": list_post_service.get_notice_writes(),
-        "writes": list_post_service.get_writes(page=search_params.get('current_page')),
-        "total_count": list_post_service.get_total_count(),
+        "notice_writes": await list_post_service.run(list_post_service.get_notice_writes),
+        "writes": await list_post_service.run(
+            list_post_service.get_writes, page=search_params.get('current_page')),
+        "total_count": total_count,
         "current_page": list_post_service.search_params['current_page'],
         "paging": paging,
         "is_write": list_post_service.is_write_level(),
@@ -317,7 +321,7 @@ async def create_post(
     service.validate_post_content(form_data.wr_subject)
     service.validate_post_content(form_data.wr_content)
     service.is_write_level()
-    service.arrange_data(form_data, secret, html, mail)
+    await service.arrange_data(form_data, secret, html, mail)
     write = service.save_write(parent_id, form_data)
     insert_board_new(service.bo_table, write)
     service.add_point(write)
@@ -351,12 +355,12 @@ async def update_post(
     """게시글을 수정한다."""
     wr_id = service.wr_id
     write = service.get_write(wr_id)
-    service.validate_author(write, form_data.wr_password)
+    await service.validate_author(write, form_data.wr_password)
     service.validate_restrict_comment_count()
     service.validate_secret_board(secret, html, mail)
     service.validate_post_content(form_data.wr_subject)
     service.validate_post_content(form_data.wr_content)
-    service.arrange_data(form_data, secret, html, mail)
+    await service.arrange_data(form_data, secret, html, mail)
     service.save_secret_session(wr_id, secret)
     service.save_write(write, form_data)
     service.set_notice(wr_id, notice)
@@ -377,14 +381,14 @@ async def read_post(
     """게시글을 읽는다."""
     board = service.board
     service.request.state.editor = service.select_editor
-    service.validate_secret_with_session()
-    service.validate_repeat_with_session()
+    await service.run(service.validate_secret_with_session)
+    await service.run(service.validate_repeat_with_session)
     service.block_read_comment()
     service.validate_read_level()
-    service.check_scrap()
-    service.check_is_good()
-    prev, next = service.get_prev_next()
-    service.db.commit()
+    await service.run(service.check_scrap)
+    await service.run(service.check_is_good)
+    prev, next = await service.run(service.get_prev_next)
+    await service.run(service.db.commit)
     context = {
         "request": service.request,
         "board": board,
@@ -395,7 +399,7 @@ async def read_post(
         "images": service.images,
         "files": service.images + service.normal_files,
         "links": service.get_links(),
-        "comments": service.get_comments(),
+        "comments": await service.run(service.get_comments),
         "is_write": service.is_write_level(),
         "is_reply": service.is_reply_level(),
         "is_comment_write": service.is_comment_level(),
@@ -466,7 +470,7 @@ async def write_comment_update(
         service.validate_comment_level()
         service.validate_point()
         service.validate_post_content(form.wr_content)
-        comment = service.save_comment(form, write)
+        comment = await service.save_comment(form, write)
         service.add_point(comment)
         service.send_write_mail_(comment, write)
         insert_board_new(service.bo_table, comment)
@@ -478,11 +482,13 @@ async def write_comment_update(
         if not comment:
             raise AlertException(f"{form.comment_id} : 존재하지 않는 댓글입니다.", 404)
 
-        service.validate_author(comment)
+        await service.validate_author(comment)
         service.validate_post_content(form.wr_content)
         comment.wr_content = service.get_cleaned_data(form.wr_content)
         comment.wr_option = form.wr_secret or "html1"
         comment.wr_last = service.g5_instance.get_wr_last_now(write_model.__tablename__)
+    if form.w == "cu":
+        update_search_index(service.db, service.write_model, [comment])
     service.db.commit()
     redirect_url = service.get_redirect_url(write)
     return RedirectResponse(redirect_url, status_code=303)
@@ -27,9 +27,9 @@ async def board_new_list(
     """
     query = service.get_query(gr_id, mb_id, view)
     offset = service.get_offset(current_page)
-    board_news = service.get_board_news(query, offset)
-    total_count = service.get_total_count(query)
-    service.arrange_borad_news_data(board_news, total_count, offset)
+    board_news = await service.run(service.get_board_news, query, offset)
+    total_count = await service.run(service.get_total_count, query)
+    await service.run(service.arrange_borad_news_data, board_news, total_count, offset)
 
     context = {
         "request": service.request,
@@ -51,7 +51,7 @@ async def new_delete(
     """
     게시글을 삭제한다.
     """
-    service.delete_board_news(bn_ids)
+    await service.run(service.delete_board_news, bn_ids)
     url = "/bbs/new"
     query_params = service.request.query_params
     return RedirectResponse(set_url_query_params(url, query_params), 303)
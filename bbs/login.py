@@ -8,6 +8,7 @@ from core.template import UserTemplates
 from lib.common import session_member_key
 from lib.dependency.dependencies import set_current_connect, validate_login_url
 from lib.member import is_super_admin
+from lib.session import regenerate_session
 from lib.social import providers
 from lib.social.social import SocialProvider, oauth
 from service.member_service import MemberService
@@ -42,8 +43,9 @@ async def login(
         auto_login: bool = Form(default=False),
 ):
     """로그인 폼화면에서 로그인"""
-    member = member_service.authenticate_member(mb_id, mb_password)
+    member = await member_service.authenticate_member(mb_id, mb_password)
 
+    regenerate_session(request)
     request.session["ss_mb_id"] = member.mb_id
     # XSS 공격에 대응하기 위하여 회원의 고유키를 생성해 놓는다.
     ss_mb_key = session_member_key(request, member)
@@ -91,6 +93,7 @@ async def logout(request: Request):
             )
 
     request.session.clear()
+    regenerate_session(request)
 
     response = RedirectResponse(url="/", status_code=302)
     if "ck_auto" in request.cookies:
@@ -10,6 +10,7 @@ from core.template import UserTemplates
 from lib.dependency.member import validate_leave_member
 from lib.dependency.dependencies import validate_token
 from lib.dependency.auth import get_login_member
+from lib.session import regenerate_session
 from service.member_service import MemberService
 
 router = APIRouter()
@@ -50,5 +51,6 @@ async def member_leave(
 
     # 로그아웃
     request.session.clear()
+    regenerate_session(request)
 
     raise AlertException(f"{login_member.mb_nick} 님의 회원탈퇴가 처리되었습니다.", 200)
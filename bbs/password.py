@@ -10,7 +10,7 @@ from core.models import Member, WriteBaseModel
 from core.template import UserTemplates
 from lib.dependency.board import get_write
 from lib.dependency.dependencies import validate_token
-from lib.pbkdf2 import validate_password
+from lib.pbkdf2 import async_validate_password
 from lib.token import create_session_token
 
 router = APIRouter()
@@ -61,7 +61,7 @@ async def password_check(
             write.wr_password = getattr(write_member, "mb_password", "")
 
     # 비밀번호 비교
-    if not validate_password(wr_password, write.wr_password):
+    if not await async_validate_password(wr_password, write.wr_password):
         raise AlertException(f"비밀번호가 일치하지 않습니다.", 403)
 
     # 비밀번호 검증 후 처리
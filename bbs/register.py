@@ -21,6 +21,7 @@ from lib.dependency.dependencies import (
 )
 from lib.dependency.member import validate_certify_email_member, validate_policy_agree, validate_register_data
 from lib.mail import send_register_admin_mail, send_register_mail
+from lib.session import regenerate_session
 from service.member_service import MemberImageService, MemberService, ValidateMember, ValidateMemberAjax
 from service.point_service import PointService
 
@@ -120,6 +121,7 @@ async def post_register_form(
 
     # 회원가입 이후 세션 처리
     if not config.cf_use_email_certify:
+        regenerate_session(request)
         request.session["ss_mb_id"] = member.mb_id
         request.session["ss_mb_key"] = session_member_key(request, member)
     request.session["ss_mb_reg"] = member.mb_id
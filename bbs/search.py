@@ -25,9 +25,9 @@ async def search(
     """
     게시판 검색
     """
-    groups = search_service.get_groups()
-    boards = search_service.get_boards()
-    searched_result = search_service.search(boards, sfl, stx, sop)
+    groups = await search_service.run(search_service.get_groups)
+    boards = await search_service.run(search_service.get_boards)
+    searched_result = await search_service.run(search_service.search, boards, sfl, stx, sop)
     total_search_count = searched_result["total_search_count"]
     boards = searched_result["boards"]
 
@@ -42,6 +42,7 @@ async def search(
         "total_search_count": total_search_count,
         "groups": groups,
         "boards": boards,
+        "timeout_boards": searched_result["timeout_boards"],
         "exists_onetable": onetable in bo_table_list,
     }
     return templates.TemplateResponse("/bbs/search.html", context)
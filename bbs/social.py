@@ -20,7 +20,8 @@ from core.models import Config, Member, MemberSocialProfiles
 from core.template import UserTemplates
 from lib.common import get_admin_email, get_admin_email_name, session_member_key
 from lib.mail import mailer
-from lib.pbkdf2 import create_hash
+from lib.pbkdf2 import async_create_hash
+from lib.session import regenerate_session
 from lib.social import providers
 from lib.social.social import (
     get_social_login_token, get_social_profile, oauth, SocialProvider
@@ -139,6 +140,7 @@ async def authorize_social_login(
         member = member_service.get_member(social_profile.mb_id)
 
         # 로그인
+        regenerate_session(request)
         request.session["ss_mb_id"] = member.mb_id
         # XSS 공격에 대응하기 위하여 회원의 고유키를 생성해 놓는다.
         request.session["ss_mb_key"] = session_member_key(request, member)
@@ -270,7 +272,7 @@ async def post_social_register(
 
     member = Member()
     member.mb_id = gnu_social_id
-    member.mb_password = create_hash(str(request_time.microsecond) + uuid4().hex)
+    member.mb_password = await async_create_hash(str(request_time.microsecond) + uuid4().hex)
     member.mb_name = mb_nick
     member.mb_nick = mb_nick
     member.mb_email = member_form.mb_email
@@ -1,8 +1,11 @@
-from typing import AsyncGenerator
+from typing import AsyncGenerator, Optional
 
 from fastapi import Depends
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine, URL
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+)
 from sqlalchemy.ext.declarative import declared_attr
 from sqlalchemy.orm import Session, sessionmaker
 from sqlalchemy.pool import QueuePool
@@ -32,6 +35,7 @@ class DBSetting:
     _port: Annotated[int, 0]
     _name: Annotated[str, ""]
     _url: Annotated[str, ""]
+    _async_url: Annotated[str, None] = None
     _charset: Annotated[str, ""]
     _instance: Annotated['DBSetting', None] = None
     _setting_init: Annotated[bool, False]
@@ -41,6 +45,12 @@ class DBSetting:
         "postgresql": "postgresql",
         "sqlite": "sqlite:///sqlite3.db"
     }
+    # 비동기 엔진에서 사용하는 드라이버
+    supported_async_engines = {
+        "mysql": "mysql+asyncmy",
+        "postgresql": "postgresql+asyncpg",
+        "sqlite": "sqlite+aiosqlite:///sqlite3.db"
+    }
 
     def __new__(cls):
         if cls._instance is None:
@@ -66,6 +76,10 @@ class DBSetting:
     def url(self, url: str) -> None:
         self._url = url
 
+    @property
+    def async_url(self) -> Optional[str]:
+        return self._async_url
+
     @property
     def table_prefix(self) -> str:
         return self._table_prefix
@@ -85,8 +99,13 @@ class DBSetting:
         self._charset = settings.DB_CHARSET
 
     def create_url(self) -> None:
+        self._url = self._build_url(self.supported_engines)
+        if settings.DB_ASYNC:
+            self._async_url = self._build_url(self.supported_async_engines, is_async=True)
+
+    def _build_url(self, engines: dict, is_async: bool = False):
         url = None
-        if db_driver := self.supported_engines.get(self._db_engine):
+        if db_driver := engines.get(self._db_engine):
             if self._db_engine == "sqlite":
                 url = db_driver
             else:
@@ -94,7 +113,7 @@ class DBSetting:
                 if self._db_engine == "mysql":
                     query_option = {"charset": self._charset}
 
-                elif self._db_engine == "postgresql":
+                elif self._db_engine == "postgresql" and not is_async:
                     if self._charset == "utf8mb4" or self._charset == "utf8":
                         # pycopg 드라이버 인코딩 설정 utf8 을 사용
                         query_option = {"client_encoding": 'utf8'}
@@ -109,7 +128,7 @@ class DBSetting:
                     database=self._db_name,
                     query=query_option,
                 )
-        self._url = url
+        return url
 
 
 class DBConnect(DBSetting):
@@ -120,6 +139,8 @@ class DBConnect(DBSetting):
     """
     _engine: Annotated[Engine, None]
     _sessionLocal: Annotated[sessionmaker[Session], None]
+    _async_engine: Annotated[AsyncEngine, None] = None
+    _asyncSessionLocal: Annotated[async_sessionmaker[AsyncSession], None] = None
     _instance: Annotated['DBConnect', None] = None
 
     def __new__(cls):
@@ -149,6 +170,14 @@ class DBConnect(DBSetting):
     def sessionLocal(self, sessionLocal: sessionmaker[Session]) -> None:
         self._sessionLocal = sessionLocal
 
+    @property
+    def async_engine(self) -> Optional[AsyncEngine]:
+        return self._async_engine
+
+    @property
+    def asyncSessionLocal(self) -> Optional[async_sessionmaker[AsyncSession]]:
+        return self._asyncSessionLocal
+
     def create_engine(self) -> None:
         self.engine = create_engine(
             self._url,
@@ -164,11 +193,29 @@ class DBConnect(DBSetting):
         self._sessionLocal = sessionmaker(autocommit=False, autoflush=False,
                                           bind=self.engine, expire_on_commit=True)
 
+    def create_async_engine(self) -> None:
+        """비동기 engine 및 session 생성
+        - .env 파일의 DB_ASYNC 설정이 True인 경우에만 생성합니다.
+        """
+        if not self._async_url:
+            return
+
+        # sqlite(aiosqlite)는 드라이버 기본 커넥션 풀을 사용
+        pool_options = {}
+        if self._db_engine != "sqlite":
+            pool_options = {"pool_size": 20, "max_overflow": 40, "pool_timeout": 60}
+        self._async_engine = create_async_engine(self._async_url, **pool_options)
+        # commit 이후 속성 접근시 이벤트 루프 밖에서 조회가 일어나지 않도록 만료하지 않음
+        self._asyncSessionLocal = async_sessionmaker(autoflush=False,
+                                                     bind=self._async_engine,
+                                                     expire_on_commit=False)
+
 
 db_connect = DBConnect()
 # 데이터베이스 url이 없을 경우, 설치를 위해 임시로 메모리 DB 사용
 db_connect.url = db_connect.url or "sqlite://"
 db_connect.create_engine()
+db_connect.create_async_engine()
 
 
 # 데이터베이스 세션을 가져오는 의존성 함수
@@ -180,5 +227,18 @@ async def get_db() -> AsyncGenerator[Session, None]:
         db.close()
 
 
+# 비동기 데이터베이스 세션을 가져오는 의존성 함수
+# - 비동기 엔진을 사용하지 않는 경우(DB_ASYNC=False) None을 반환합니다.
+async def get_async_db() -> AsyncGenerator[Optional[AsyncSession], None]:
+    async_session_local = DBConnect().asyncSessionLocal
+    if async_session_local is None:
+        yield None
+        return
+
+    async with async_session_local() as db:
+        yield db
+
+
 # Annotated를 사용하여 의존성 주입
 db_session = Annotated[Session, Depends(get_db)]
+async_db_session = Annotated[Optional[AsyncSession], Depends(get_async_db)]
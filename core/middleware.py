@@ -1,5 +1,5 @@
 """애플리케이션에 사용되는 미들웨어를 정의합니다."""
-from user_agents import parse
+import time
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
@@ -12,6 +12,12 @@ from core.plugin import (
     unregister_plugin, delete_router_by_tagname
 )
 from core.settings import settings
+from lib.session import SESSION_MAX_AGE, ServerSessionMiddleware, get_session_store
+from lib.user_agent import classify_user_agent
+
+API_PATH_PREFIX = "/api/"
+PLUGIN_CHECK_INTERVAL = 1  # 단위: 초
+_plugin_checked_at = 0.0
 
 
 def regist_core_middleware(app: FastAPI) -> None:
@@ -28,7 +34,14 @@ def regist_core_middleware(app: FastAPI) -> None:
             return await call_next(request)
 
         # 플러그인 설정
-        plugin_state_change_time = get_plugin_state_change_time()
+        # 플러그인 상태 파일은 PLUGIN_CHECK_INTERVAL(초)마다 한번만 확인합니다.
+        global _plugin_checked_at
+        now = time.monotonic()
+        if now - _plugin_checked_at >= PLUGIN_CHECK_INTERVAL:
+            _plugin_checked_at = now
+            plugin_state_change_time = get_plugin_state_change_time()
+        else:
+            plugin_state_change_time = cache_plugin_state.__getitem__('change_time')
         if cache_plugin_state.__getitem__('change_time') != plugin_state_change_time:
             # 플러그인 상태변경시 캐시를 업데이트.
             # 업데이트 이후 관리자 메뉴, 라우터 재등록/삭제
@@ -47,6 +60,12 @@ def regist_core_middleware(app: FastAPI) -> None:
         request.state.is_mobile = False
         request.state.is_responsive = settings.IS_RESPONSIVE
 
+        # API 요청은 웹 페이지용 접속환경(PC/모바일)을 확인하지 않습니다.
+        if is_api_request(request):
+            request.state.device = "pc"
+            request.scope["router"] = app.router
+            return await call_next(request)
+
         # 반응형이라면 PC/모바일 버전 설정 세션을 초기화합니다.
         if request.state.is_responsive:
             request.session["is_mobile"] = False
@@ -56,8 +75,7 @@ def regist_core_middleware(app: FastAPI) -> None:
                 request.state.is_mobile = request.session.get("is_mobile", False)
             else:
                 # User-Agent 헤더를 통해 모바일 여부를 판단합니다. (모바일과 태블릿 접속)
-                user_agent = parse(request.headers.get("User-Agent", ""))
-                if user_agent.is_mobile or user_agent.is_tablet:
+                if classify_user_agent(request.headers.get("User-Agent", "")).is_mobile:
                     request.state.is_mobile = True
 
         # 디바이스 기본값 설정
@@ -70,10 +88,19 @@ def regist_core_middleware(app: FastAPI) -> None:
 
     # 세션 미들웨어를 추가합니다.
     # .env 파일의 설정을 통해 secret_key, session_cookie를 설정할 수 있습니다.
-    app.add_middleware(SessionMiddleware,
-                       secret_key=settings.SESSION_SECRET_KEY,
-                       session_cookie=settings.SESSION_COOKIE_NAME,
-                       max_age=60 * 60 * 3)
+    # SESSION_BACKEND 설정이 cookie가 아니면 세션 데이터를 서버 저장소에 저장합니다.
+    session_store = get_session_store()
+    if session_store:
+        app.add_middleware(ServerSessionMiddleware,
+                           store=session_store,
+                           secret_key=settings.SESSION_SECRET_KEY,
+                           session_cookie=settings.SESSION_COOKIE_NAME,
+                           max_age=SESSION_MAX_AGE)
+    else:
+        app.add_middleware(SessionMiddleware,
+                           secret_key=settings.SESSION_SECRET_KEY,
+                           session_cookie=settings.SESSION_COOKIE_NAME,
+                           max_age=SESSION_MAX_AGE)
 
     # 클라이언트가 사용할 프로토콜을 결정하는 미들웨어를 추가합니다.
     app.add_middleware(BaseSchemeMiddleware)
@@ -112,6 +139,11 @@ async def should_run_middleware(request: Request) -> bool:
     return True
 
 
+def is_api_request(request: Request) -> bool:
+    """API 요청(/api/...)인지 확인합니다."""
+    return request.url.path.startswith(API_PATH_PREFIX)
+
+
 class BaseSchemeMiddleware(BaseHTTPMiddleware):
     """X-Forwarded-Proto 헤더를 통해 클라이언트가 사용하는 실제 프로토콜을 결정합니다."""
     async def dispatch(self, request: Request, call_next):
@@ -557,6 +557,8 @@ class Visit(Base):
     vi_os = Column(String(255), nullable=False, default="")
     vi_device = Column(String(255), nullable=False, default="")
 
+    date_ip_index = Index("idx_visit_date_ip", vi_date, vi_ip)
+
 
 class VisitSum(Base):
     """
@@ -568,6 +570,26 @@ class VisitSum(Base):
     vs_count = Column(Integer, nullable=False, default=0)
 
 
+class VisitRollup(Base):
+    """
+    방문자 집계 테이블
+    - 날짜, 시간, 브라우저, OS, 접속기기, 유입 도메인별 방문자 수
+    - 같은 조건의 행이 여러 개일 수 있으므로 조회할 때 vr_count를 합산합니다.
+    """
+    __tablename__ = DB_TABLE_PREFIX + "visit_rollup"
+
+    vr_id = Column(Integer, primary_key=True, autoincrement=True)
+    vr_date = Column(Date, nullable=False, default="")
+    vr_hour = Column(Integer, nullable=False, default=0)
+    vr_browser = Column(String(255), nullable=False, default="")
+    vr_os = Column(String(255), nullable=False, default="")
+    vr_device = Column(String(255), nullable=False, default="")
+    vr_domain = Column(String(255), nullable=False, default="")
+    vr_count = Column(Integer, nullable=False, default=0)
+
+    vr_date_index = Index("vr_date", vr_date)
+
+
 class QaConfig(Base):
     """
     Q&A 설정 테이블
@@ -686,6 +708,9 @@ class Point(Base):
     po_rel_id = Column(String(20), nullable=False, default="")
     po_rel_action = Column(String(100), nullable=False, default="")
 
+    mb_rel_index = Index("idx_point_mb_rel", mb_id, po_rel_table, po_rel_id, po_rel_action)
+    mb_expire_index = Index("idx_point_mb_expire", mb_id, po_expired, po_expire_date)
+
     # 연관관계
     member: Mapped["Member"] = relationship("Member", back_populates="points")
 
@@ -707,6 +732,8 @@ class Memo(Base):
     me_type = Column(Enum("send", "recv", name="me_type"), nullable=False, default="recv")
     me_send_ip = Column(String(100), nullable=False, default="")
 
+    recv_type_index = Index("idx_memo_recv_type", me_recv_mb_id, me_type)
+
     # 연관관계
     recv_member: Mapped["Member"] = relationship("Member", back_populates="recv_memos", foreign_keys=[me_recv_mb_id])
     send_member: Mapped["Member"] = relationship("Member", back_populates="send_memos", foreign_keys=[me_send_mb_id])
@@ -868,6 +895,9 @@ class BoardNew(Base):
     bn_datetime = Column(DateTime, nullable=False, default=func.now())
     mb_id = Column(String(20), nullable=False, default='')
 
+    datetime_index = Index("idx_board_new_datetime", bn_datetime)
+    table_parent_index = Index("idx_board_new_table_parent", bo_table, wr_parent)
+
     board: Mapped["Board"] = relationship("Board", back_populates="board_news")
 
 
@@ -883,6 +913,8 @@ class Scrap(Base):
     wr_id = Column(Integer, nullable=False, default=0)
     ms_datetime = Column(DateTime, nullable=False, default=func.now())
 
+    mb_id_index = Index("idx_scrap_mb_id", mb_id)
+
     board: Mapped["Board"] = relationship("Board", back_populates="scraps")
     member: Mapped["Member"] = relationship("Member", back_populates="scraps")
 
@@ -958,3 +990,6 @@ class Login(Base):
     lo_datetime = Column(DateTime, nullable=False, default=func.now())
     lo_location = Column(Text, nullable=False)
     lo_url = Column(Text, nullable=False)
+
+    ip_index = Index("idx_login_ip", lo_ip)
+    datetime_index = Index("idx_login_datetime", lo_datetime)
@@ -17,6 +17,7 @@ class Settings(BaseSettings):
     APP_IS_DEBUG: bool = False  # 디버그 모드
 
     COOKIE_DOMAIN: str = ""  # 쿠키 도메인
+    COUNTER_FLUSH_INTERVAL: int = 5  # 조회수, 다운로드 횟수를 모아서 기록하는 간격 (초, 0: 바로 기록)
 
     # 데이터베이스 설정
     DB_TABLE_PREFIX: str = "g6_"
@@ -27,17 +28,41 @@ class Settings(BaseSettings):
     DB_PORT: int = 3306
     DB_NAME: str = ""
     DB_CHARSET: str = "utf8mb4"
+    DB_ASYNC: bool = False  # 비동기 데이터베이스 엔진 사용 (aiosqlite, asyncmy, asyncpg 드라이버 필요)
+    DB_FULLTEXT_SEARCH: bool = False  # 게시판 제목+내용 검색에 전문 검색 인덱스 사용 (기존 게시판은 관리자 DB 인덱스 점검에서 생성)
 
     IS_RESPONSIVE: bool = True  # 반응형 사용
 
+    PASSWORD_HASH_WORKERS: int = 4  # 비밀번호 해시 계산 스레드 수
+
+    # 캐시 설정
+    CACHE_BACKEND: str = "memory"  # 캐시 저장소 (memory: 프로세스 메모리, sqlite: 워커 공유 SQLite 파일)
+    CACHE_TTL: int = 600  # 캐시 기본 만료 시간 (초)
+    CACHE_SQLITE_PATH: str = "data/cache.sqlite3"  # sqlite 캐시 파일 경로
+    CONTENT_CACHE_TTL: int = 86400  # 게시글 본문 변환(링크, 이미지 크기) 결과 캐시 시간 (초, 0: 사용하지 않음)
+
+    # 전체검색 설정
+    SEARCH_MAX_WORKERS: int = 8  # 게시판별 검색을 동시에 실행할 스레드 수 (0: 순차 실행)
+    SEARCH_BOARD_TIMEOUT: float = 5  # 게시판 검색 제한 시간 (초, 동시에 실행하는 모든 게시판에 함께 적용)
+
     SESSION_COOKIE_NAME: str = "session"  # 세션 쿠키 이름
     SESSION_SECRET_KEY: str = ""  # 세션 비밀키
+    SESSION_BACKEND: str = "cookie"  # 세션 저장소 (cookie: 서명된 쿠키, memory: 프로세스 메모리, sqlite: 워커 공유 SQLite 파일)
+    SESSION_SQLITE_PATH: str = "data/session.sqlite3"  # sqlite 세션 파일 경로
 
     # SMTP 설정
     SMTP_SERVER: str = "localhost"
     SMTP_PORT: int = 25
     SMTP_USERNAME: str = ""
     SMTP_PASSWORD: str = ""
+    MAIL_WORKERS: int = 1  # 메일 발송 스레드 수 (0: 요청 중에 바로 발송)
+    MAIL_MAX_RETRIES: int = 3  # 메일 발송 실패 시 재시도 횟수
+
+    # 템플릿 설정
+    TEMPLATE_BYTECODE_CACHE: bool = True  # 컴파일된 템플릿을 파일로 저장하여 워커들이 함께 사용
+    TEMPLATE_WARMUP: bool = False  # 서버 시작 시 모든 템플릿을 미리 컴파일
+
+    THUMBNAIL_WORKERS: int = 2  # 섬네일 생성 프로세스 수 (0: 요청 중에 바로 생성)
 
     TIME_ZONE: str = "Asia/Seoul"  # 시간대
 
@@ -48,7 +73,12 @@ class Settings(BaseSettings):
     UPLOAD_IMAGE_RESIZE_HEIGHT: int = 2800  # 이미지 리사이즈 높이 (px)
     UPLOAD_IMAGE_QUALITY: int = 80  # 이미지 품질 (0~100)
 
+    USER_AGENT_CACHE_SIZE: int = 10000  # User-Agent 분류 결과를 캐시할 개수
+
+    VISIT_FLUSH_INTERVAL: int = 5  # 방문자 접속 이력을 모아서 기록하는 간격 (초, 0: 요청마다 바로 기록)
+
     USE_API: bool = True  # API 사용
+    API_MEMBER_CACHE_TTL: int = 10  # API 인증 회원 정보 캐시 시간 (초, 0: 사용하지 않음, 최대 60, 다른 워커에는 이 시간만큼 늦게 반영)
     USE_TEMPLATE: bool = True  # 템플릿 사용
 
 
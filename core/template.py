@@ -1,11 +1,13 @@
+import logging
 import os
 import re
+import threading
 import typing
 
 from cachetools import LRUCache, cached
 from fastapi import FastAPI, Request
 from fastapi.templating import Jinja2Templates
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import BytecodeCache, Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateError
 from sqlalchemy import select
 from starlette.background import BackgroundTask
 from starlette.staticfiles import StaticFiles
@@ -91,6 +93,25 @@ TEMPLATES = "templates"
 ADMIN_TEMPLATES = "admin/templates"
 ADMIN_TEMPLATES_DIR = get_admin_theme_path()  # 관리자 템플릿 경로
 
+TEMPLATE_BYTECODE_CACHE_DIR = "data/cache/jinja2"
+_bytecode_cache: typing.Optional[BytecodeCache] = None
+
+
+def get_bytecode_cache() -> typing.Optional[BytecodeCache]:
+    """컴파일된 템플릿을 저장하는 파일 캐시를 반환합니다.
+    - 같은 서버의 워커들이 함께 사용하므로, 한 워커에서 컴파일한 템플릿을
+      다른 워커는 다시 컴파일하지 않고 불러옵니다.
+    - TEMPLATE_BYTECODE_CACHE 설정이 False이면 None을 반환합니다.
+    """
+    global _bytecode_cache
+    if not settings.TEMPLATE_BYTECODE_CACHE:
+        return None
+    if _bytecode_cache is None:
+        os.makedirs(TEMPLATE_BYTECODE_CACHE_DIR, exist_ok=True)
+        _bytecode_cache = FileSystemBytecodeCache(TEMPLATE_BYTECODE_CACHE_DIR)
+    return _bytecode_cache
+
+
 class TemplateService():
     """템플릿 서비스 클래스
     - TODO: 이외의 다른 부분도 클래스화 해야한다.
@@ -116,7 +137,9 @@ class UserTemplates(Jinja2Templates):
     - 싱글톤 패턴으로 구현
     """
     _instance = None
-    _is_mobile: bool = False
+    # 템플릿 경로 목록 => 템플릿 경로별 Environment
+    _device_envs: typing.Dict[typing.Tuple[str, ...], Environment] = {}
+    _device_envs_lock = threading.Lock()
     default_directories = [
         TemplateService.get_templates_dir(),
         EDITOR_PATH,
@@ -138,6 +161,7 @@ class UserTemplates(Jinja2Templates):
             self._initialized = True
             super().__init__(directory=self.default_directories,
                              context_processors=context_processors)
+            self.env.bytecode_cache = get_bytecode_cache()
 
             # 템플릿 필터 설정
             self.env.filters["datetime_format"] = datetime_format
@@ -168,6 +192,51 @@ class UserTemplates(Jinja2Templates):
         }
         return context
 
+    def get_directories(self, is_mobile: bool = False) -> typing.List[str]:
+        """템플릿 경로 목록을 반환합니다.
+        - 적응형&모바일 접근일 경우 모바일 템플릿 경로를 가장 먼저 검색합니다.
+        - mobile 템플릿이 존재하지 않을 경우 기본 템플릿을 자동으로 사용합니다.
+        """
+        directories = list(self.default_directories)
+        if not settings.IS_RESPONSIVE and is_mobile:
+            directories.insert(0, f"{TemplateService.get_templates_dir()}/mobile")
+        return directories
+
+    def get_environment(self, is_mobile: bool = False) -> Environment:
+        """접속 기기(PC/모바일)와 테마에 맞는 Environment를 반환합니다.
+        - 템플릿 경로마다 Environment를 따로 만들어 두고 재사용하므로
+          PC/모바일 요청이 번갈아 들어와도 컴파일된 템플릿이 유지됩니다.
+        - 필터, 전역 변수는 self.env와 공유합니다. (Environment.overlay)
+        """
+        directories = tuple(self.get_directories(is_mobile))
+        env = self._device_envs.get(directories)
+        if env is None:
+            with self._device_envs_lock:
+                env = self._device_envs.get(directories)
+                if env is None:
+                    env = self.env.overlay(loader=FileSystemLoader(directories),
+                                           bytecode_cache=get_bytecode_cache())
+                    self._device_envs[directories] = env
+        return env
+
+    def warm_up(self) -> int:
+        """모든 템플릿을 미리 컴파일합니다.
+
+        Returns:
+            int: 컴파일한 템플릿 수
+        """
+        device_types = [False] if settings.IS_RESPONSIVE else [False, True]
+        count = 0
+        for is_mobile in device_types:
+            env = self.get_environment(is_mobile)
+            for name in env.list_templates(extensions=["html"]):
+                try:
+                    env.get_template(name)
+                    count += 1
+                except (TemplateError, UnicodeDecodeError) as e:
+                    logging.warning("템플릿을 컴파일하지 못했습니다. %s: %s", name, e)
+        return count
+
     def TemplateResponse(
         self,
         name: str,
@@ -178,35 +247,23 @@ class UserTemplates(Jinja2Templates):
         background: typing.Optional[BackgroundTask] = None,
     ) -> _TemplateResponse:
         """Jinja2Templates TemplateResponse Override
-        
-        적응형&모바일 접근일 경우 모바일 템플릿을 우선으로 검색하도록 경로를 재설정한다.
-        - mobile 템플릿이 존재하지 않을 경우 기본 템플릿을 자동으로 사용한다.
-        - 클래스 변수(_is_mobile)를 통해 이전 요청과 비교하여 변경되었을 경우에만 경로를 재설정한다.
-        - 해당 로직은 생성자에서 처리하지 못한다.
+
+        접속 기기(PC/모바일)에 맞는 Environment에서 템플릿을 찾아 응답합니다.
         """
         request = context.get("request")
         is_mobile: bool = getattr(request.state, "is_mobile", False)
-        if (not settings.IS_RESPONSIVE
-                and self._is_mobile != is_mobile):
-            # 경로 우선순위 변경
-            mobile_dir = f"{TemplateService.get_templates_dir()}/mobile"
-            if is_mobile:
-                self.default_directories.insert(0, mobile_dir)
-            else:
-                if mobile_dir in self.default_directories:
-                    self.default_directories.remove(mobile_dir)
-
-            # 템플릿 로더 재설정
-            self.env.loader = FileSystemLoader(self.default_directories)
-            self._is_mobile = is_mobile
-
-        return super().TemplateResponse(
-            name=name,
-            context=context,
+
+        for context_processor in self.context_processors:
+            context.update(context_processor(request))
+
+        template = self.get_environment(is_mobile).get_template(name)
+        return _TemplateResponse(
+            template,
+            context,
             status_code=status_code,
             headers=headers,
             media_type=media_type,
-            background=background
+            background=background,
         )
 
 
@@ -234,6 +291,7 @@ class AdminTemplates(Jinja2Templates):
             self._initialized = True
             super().__init__(directory=self.default_directories,
                              context_processors=context_processors)
+            self.env.bytecode_cache = get_bytecode_cache()
 
             # 템플릿 필터 설정
             self.env.filters["datetime_format"] = datetime_format
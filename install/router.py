@@ -30,6 +30,10 @@ from install.default_values import (
     default_group, default_member, default_qa_config, default_version
 )
 from lib.common import dynamic_create_write_table, read_license
+from lib.cache import get_cache
+from lib.config_cache import ConfigCache
+from lib.db_index import create_missing_indexes
+from lib.fulltext import create_search_indexes
 from lib.dependency.dependencies import validate_install, validate_token
 from lib.pbkdf2 import create_hash
 
@@ -200,6 +204,10 @@ async def install_process():
             Base.metadata.create_all(bind=engine)
             yield "데이터베이스 테이블 생성 완료"
 
+            # 기존 테이블을 유지하는 경우 빠진 인덱스를 추가합니다.
+            create_missing_indexes(engine)
+            yield "데이터베이스 인덱스 생성 완료"
+
             with db_connect.sessionLocal() as db:
                 config_setup(db, form_data.admin_id, form_data.admin_email)
                 if not form_data.is_skip_admin:
@@ -211,12 +219,18 @@ async def install_process():
                 board_group_setup(db)
                 board_setup(db)
                 db.commit()
+                ConfigCache.invalidate()
                 yield "기본설정 정보 입력 완료"
 
             for board in default_boards:
                 dynamic_create_write_table(board['bo_table'], create_table=True)
             yield "게시판 테이블 생성 완료"
 
+            # 전문 검색을 사용하는 경우 게시판 테이블의 전문 검색 인덱스를 생성합니다.
+            with db_connect.sessionLocal() as db:
+                if create_search_indexes(db):
+                    yield "전문 검색 인덱스 생성 완료"
+
             setup_data_directory()
             yield "데이터 경로 생성 완료"
 
@@ -332,3 +346,5 @@ def setup_data_directory():
         shutil.rmtree(default_cache_directory)
     # 캐시 디렉토리 생성
     os.makedirs(default_cache_directory)
+    # 캐시 저장소 비우기
+    get_cache().clear()
@@ -1,4 +1,5 @@
 """게시판/게시글 함수 모음"""
+import hashlib
 import os
 import re
 from datetime import datetime, timedelta
@@ -13,14 +14,18 @@ from sqlalchemy.orm import Session
 
 from core.database import DBConnect
 from core.exception import AlertException
-from core.models import Board, BoardNew, Member, WriteBaseModel
+from core.models import Board, BoardFile, BoardNew, Member, WriteBaseModel
+from core.settings import settings
 from core.template import TemplateService, UserTemplates
+from lib.cache import get_cache
 from lib.common import (
-    FileCache, StringEncrypt, cut_name, dynamic_create_write_table, get_admin_email,
-    get_admin_email_name, get_editor_image, thumbnail
+    StringEncrypt, cut_name, dynamic_create_write_table, get_admin_email,
+    get_admin_email_name, get_editor_image
 )
+from lib.fulltext import get_fulltext_search
 from lib.mail import mailer
 from lib.member import MemberDetails
+from lib.thumbnail import ThumbnailManager
 from service.board_file_service import BoardFileService as FileService
 
 
@@ -509,6 +514,16 @@ def write_search_filter(
             if "wr_password" in fields:
                 fields.remove("wr_password")
 
+            # 전문 검색 인덱스를 사용할 수 있으면 인덱스로 검색하고,
+            # 인덱스로 검색할 수 없는 짧은 단어만 LIKE 검색
+            fulltext_search = get_fulltext_search()
+            if (fulltext_search
+                    and fulltext_search.is_searchable(fields)
+                    and fulltext_search.is_indexed(db, model)):
+                fulltext_words, words = fulltext_search.split_words([w for w in words if w.strip()])
+                if fulltext_words:
+                    word_filters.append(fulltext_search.match(model, fulltext_words, operator))
+
             # 필드검색 필터 생성 (or 조건)
             for word in words:
                 if not word.strip():
@@ -547,7 +562,8 @@ def get_next_num(bo_table: str) -> int:
         db.close()
 
 
-def get_list(request: Request, db: Session, write: WriteBaseModel, board_config: BoardConfig, subject_len: int = 0):
+def get_list(request: Request, db: Session, write: WriteBaseModel, board_config: BoardConfig,
+             subject_len: int = 0, has_file: bool = None):
     """게시글 목록의 출력에 필요한 정보를 추가합니다.
     - 그누보드5의 get_list와 동일한 기능을 합니다.
 
@@ -556,11 +572,14 @@ def get_list(request: Request, db: Session, write: WriteBaseModel, board_config:
         write (WriteBaseModel): 게시글 객체.
         board (Board): 게시판 객체.
         subject_len (int, optional): 게시글 제목 길이. Defaults to 0.
+        has_file (bool, optional): 첨부파일 존재 여부. 미리 조회한 경우 전달하며,
+            None이면 데이터베이스에서 조회합니다. Defaults to None.
 
     Returns:
         WriteBaseModel: 게시글 목록.
     """
-    file_service = FileService(request, db)
+    if has_file is None:
+        has_file = FileService(request, db).is_exist(board_config.board.bo_table, write.wr_id)
     write.subject = board_config.cut_write_subject(write.wr_subject, subject_len)
     write.name = cut_name(request, write.wr_name)
     write.email = StringEncrypt().encrypt(write.wr_email)
@@ -570,7 +589,7 @@ def get_list(request: Request, db: Session, write: WriteBaseModel, board_config:
     write.icon_secret = "secret" in write.wr_option
     write.icon_hot = board_config.is_icon_hot(write.wr_hit)
     write.icon_new = board_config.is_icon_new(write.wr_datetime)
-    write.icon_file = file_service.is_exist(board_config.board.bo_table, write.wr_id)
+    write.icon_file = has_file
     write.icon_link = write.wr_link1 or write.wr_link2
     write.icon_reply = write.wr_reply
 
@@ -711,23 +730,30 @@ def send_write_mail(request: Request, board: Board, write: WriteBaseModel, origi
 
         # 중복 이메일 제거
         send_email_list = list(set(send_email_list))
+        if not send_email_list:
+            return
+
+        # 메일 내용은 수신자와 관계없이 같으므로 한번만 생성합니다.
+        subject = f"[{config.cf_title}] {board.bo_subject} 게시판에 {act}이 등록되었습니다."
+        body = templates.TemplateResponse(
+            "bbs/mail_form/write_update_mail.html", {
+                "request": request,
+                "act": act,
+                "board": board,
+                "wr_subject": write.wr_subject,
+                "wr_name": write.wr_name,
+                "wr_content": write.wr_content,
+                "link_url": link_url,
+            }
+        ).body.decode("utf-8")
+        from_email = get_admin_email(request)
+        from_name = get_admin_email_name(request)
         for email in send_email_list:
-            subject = f"[{config.cf_title}] {board.bo_subject} 게시판에 {act}이 등록되었습니다."
-            body = templates.TemplateResponse(
-                "bbs/mail_form/write_update_mail.html", {
-                    "request": request,
-                    "act": act,
-                    "board": board,
-                    "wr_subject": write.wr_subject,
-                    "wr_name": write.wr_name,
-                    "wr_content": write.wr_content,
-                    "link_url": link_url,
-                }
-            ).body.decode("utf-8")
-            mailer(get_admin_email(request), email, subject, body, get_admin_email_name(request))
-
-
-def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, thumb_width: int, thumb_height: int, **kwargs):
+            mailer(from_email, email, subject, body, from_name)
+
+
+def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, thumb_width: int, thumb_height: int,
+                       images: List[BoardFile] = None, **kwargs):
     """게시글 목록의 섬네일 이미지를 생성한다.
 
     Args:
@@ -736,11 +762,14 @@ def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, th
         write (WriteBaseModel): _description_
         thumb_width (int, optional): _description_. Defaults to 0.
         thumb_height (int, optional): _description_. Defaults to 0.
+        images (List[BoardFile], optional): 미리 조회한 이미지 파일 목록.
+            None이면 데이터베이스에서 조회합니다. Defaults to None.
     """
     config = request.state.config
-    with DBConnect().sessionLocal() as db:
-        service = FileService(request, db)
-        images, files = service.get_board_files_by_type(board.bo_table, write.wr_id)
+    if images is None:
+        with DBConnect().sessionLocal() as db:
+            service = FileService(request, db)
+            images, files = service.get_board_files_by_type(board.bo_table, write.wr_id)
     source_file = None
     result = {"src": "", "alt": "", "noimg":""}
 
@@ -774,13 +803,12 @@ def get_list_thumbnail(request: Request, board: Board, write: WriteBaseModel, th
                 continue
 
     # 섬네일 생성
+    # 생성되지 않은 섬네일은 백그라운드에서 생성하고, 그 동안 대체 이미지를 반환합니다.
     if source_file:
-        result["src"] = thumbnail(source_file, width=thumb_width, height=thumb_height, **kwargs)
+        result["src"] = ThumbnailManager.get(source_file, thumb_width, thumb_height, **kwargs)
     # 이미지가 없을 때
     else:
-        result["src"] = thumbnail("./static/img/dummy-donotremove.png",
-                        target_path="./data/thumbnail_tmp",
-                        width=thumb_width, height=thumb_height, **kwargs)
+        result["src"] = ThumbnailManager.get_placeholder(thumb_width, thumb_height)
         result["noimg"] = "img_not_found"
 
     return result
@@ -842,6 +870,59 @@ def url_auto_link(text: str, request: Request, is_nofollow: bool = True) -> str:
     return bleach.linkify(text, callbacks=[_nofollow, _target], parse_email=True)
 
 
+def render_write_content(request: Request, board: Board, write: WriteBaseModel) -> str:
+    """게시글 본문에 이미지 크기 지정(set_image_width), URL 링크 변환(url_auto_link)을 적용한 HTML을 반환합니다.
+    - bleach.linkify는 본문이 길수록 오래 걸리므로 변환 결과를 게시글마다 캐시합니다.
+    - 캐시에는 본문, 수정시간(wr_last), 이미지 크기, 링크 target 설정으로 만든 버전을 함께 저장하고
+      버전이 다르면 다시 변환합니다. (다른 워커에서 수정된 게시글도 이전 결과를 사용하지 않습니다.)
+
+    Args:
+        request (Request): Request 객체.
+        board (Board): 게시판 object
+        write (WriteBaseModel): 게시글 object
+
+    Returns:
+        str: 변환된 본문 HTML
+    """
+    content = write.wr_content or ""
+    image_width = board.bo_image_width or None
+
+    def render() -> str:
+        return url_auto_link(set_image_width(content, image_width), request)
+
+    ttl = settings.CONTENT_CACHE_TTL
+    if ttl <= 0:
+        return render()
+
+    cf_link_target = getattr(request.state.config, "cf_link_target", "_blank")
+    version = hashlib.md5(
+        f"{write.wr_last}|{image_width}|{cf_link_target}|{content}".encode("utf-8")
+    ).hexdigest()
+    cache = get_cache()
+    cache_key = get_content_cache_key(board.bo_table, write.wr_id)
+
+    # 캐시 값: "{버전}\n{HTML}"
+    cached = cache.get(cache_key)
+    if cached and cached.startswith(f"{version}\n"):
+        return cached[len(version) + 1:]
+
+    html = render()
+    cache.set(cache_key, f"{version}\n{html}", ttl, tags=[f"content-{board.bo_table}"])
+    return html
+
+
+def get_content_cache_key(bo_table: str, wr_id: int) -> str:
+    """게시글 본문 변환 결과의 캐시 키를 반환합니다."""
+    return f"content-{bo_table}-{wr_id}"
+
+
+def delete_content_cache(bo_table: str, wr_ids: List[int]) -> None:
+    """수정/삭제된 게시글의 본문 변환 결과 캐시를 삭제합니다."""
+    cache = get_cache()
+    for wr_id in wr_ids:
+        cache.delete(get_content_cache_key(bo_table, wr_id))
+
+
 def is_write_delay(request: Request) -> bool:
     """특정 시간 간격 내에 다시 글을 작성할 수 있는지 확인하는 함수"""
     if request.state.is_super_admin:
@@ -913,48 +994,52 @@ def render_latest_posts(request: Request, skin_name: str = 'basic', bo_table: st
     Returns:
         str: 최신글 HTML
     """
-    templates = UserTemplates()
-    templates.env.globals["get_list_thumbnail"] = get_list_thumbnail
-
     device = request.state.device
-    file_cache = FileCache()
-    cache_filename = f"latest-{bo_table}-{device}-{skin_name}-{rows}-{subject_len}-{file_cache.get_cache_secret_key()}.html"
-    cache_file = os.path.join(file_cache.cache_dir, cache_filename)
-
-    # 캐시된 파일이 있으면 파일을 읽어서 반환
-    if os.path.exists(cache_file):
-        return file_cache.get(cache_file)
-
-    with DBConnect().sessionLocal() as db:
-        # 게시판 설정
-        board = db.get(Board, bo_table)
-        if not board:
-            return ""
-
-        board_config = BoardConfig(request, board)
-        board.subject = board_config.subject
+    cache_key = f"latest-{bo_table}-{device}-{skin_name}-{rows}-{subject_len}"
+    uncached_html = None
+
+    def render() -> str:
+        nonlocal uncached_html
+        with ThumbnailManager.collect_pending() as pending_thumbnails:
+            html = render_html()
+        if pending_thumbnails:
+            # 생성 중인 섬네일의 대체 이미지가 포함되어 있으면 캐시하지 않습니다.
+            uncached_html = html
+            return None
+        return html
+
+    def render_html() -> str:
+        templates = UserTemplates()
+        templates.env.globals["get_list_thumbnail"] = get_list_thumbnail
 
-        #게시글 목록 조회
-        write_model = dynamic_create_write_table(bo_table)
-        writes = db.scalars(
-            select(write_model)
-            .where(write_model.wr_is_comment == 0)
-            .order_by(write_model.wr_num)
-            .limit(rows)
-        ).all()
-        for write in writes:
-            write = get_list(request, db, write, board_config, subject_len)
-
-    context = {
-        "request": request,
-        "board": board,
-        "writes": writes,
-        "bo_table": bo_table,
-    }
-    temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
-    temp_decode = temp.body.decode("utf-8")
-
-    # 캐시 파일 생성
-    file_cache.create(temp_decode, cache_file)
-
-    return temp_decode
+        with DBConnect().sessionLocal() as db:
+            # 게시판 설정
+            board = db.get(Board, bo_table)
+            if not board:
+                return None
+
+            board_config = BoardConfig(request, board)
+            board.subject = board_config.subject
+
+            #게시글 목록 조회
+            write_model = dynamic_create_write_table(bo_table)
+            writes = db.scalars(
+                select(write_model)
+                .where(write_model.wr_is_comment == 0)
+                .order_by(write_model.wr_num)
+                .limit(rows)
+            ).all()
+            for write in writes:
+                write = get_list(request, db, write, board_config, subject_len)
+
+        context = {
+            "request": request,
+            "board": board,
+            "writes": writes,
+            "bo_table": bo_table,
+        }
+        temp = templates.TemplateResponse(f"latest/{skin_name}.html", context)
+        return temp.body.decode("utf-8")
+
+    # 캐시된 HTML이 없으면 한 요청만 렌더링하여 캐시에 저장
+    return get_cache().get_or_set(cache_key, render, tags=["latest", f"latest-{bo_table}"]) or uncached_html or ""
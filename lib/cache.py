@@ -0,0 +1,249 @@
+"""렌더링 결과 등을 저장하는 캐시 기능을 제공하는 모듈입니다.
+- CACHE_BACKEND 설정에 따라 캐시 저장소를 선택합니다.
+  - memory: 프로세스 메모리 (LRU + TTL)
+  - sqlite: 같은 서버의 워커들이 공유하는 SQLite 파일
+- 캐시는 태그(예: latest-{bo_table})를 지정하여 저장하고, 태그 단위로 삭제합니다.
+"""
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, Optional, Type
+
+from cachetools import TTLCache
+from filelock import FileLock
+
+from core.settings import settings
+
+
+class CacheBackend(ABC):
+    """
+    캐시 저장소 기본 클래스
+    - 저장소별 클래스는 get, set, delete, delete_tag, clear를 구현합니다. (추상 메소드)
+    """
+
+    def __init__(self):
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._key_locks_lock = threading.Lock()
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[str]:
+        """캐시된 값을 반환합니다. 없거나 만료되었으면 None"""
+
+    @abstractmethod
+    def set(self, key: str, value: str, ttl: int = None, tags: Iterable[str] = ()) -> None:
+        """값을 캐시에 저장합니다.
+
+        Args:
+            key (str): 캐시 키
+            value (str): 저장할 값
+            ttl (int, optional): 만료 시간(초). 없으면 CACHE_TTL 설정값
+            tags (Iterable[str], optional): 태그 목록. delete_tag()로 한번에 삭제할 때 사용
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """캐시를 삭제합니다."""
+
+    @abstractmethod
+    def delete_tag(self, tag: str) -> None:
+        """태그가 지정된 캐시를 모두 삭제합니다."""
+
+    @abstractmethod
+    def clear(self) -> None:
+        """캐시를 모두 삭제합니다."""
+
+    def get_or_set(self, key: str, create_func: Callable[[], str],
+                   ttl: int = None, tags: Iterable[str] = ()) -> str:
+        """캐시된 값을 반환하고, 없으면 create_func()의 결과를 저장 후 반환합니다.
+        - 같은 키의 값이 없을 때 여러 요청이 동시에 create_func()를 실행하지 않도록
+          한 요청만 값을 생성하고, 나머지 요청은 생성된 값을 사용합니다.
+        - create_func()가 None을 반환하면 캐시에 저장하지 않습니다.
+        """
+        value = self.get(key)
+        if value is not None:
+            return value
+
+        with self._get_key_lock(key):
+            value = self.get(key)
+            if value is None:
+                value = create_func()
+                if value is not None:
+                    self.set(key, value, ttl, tags)
+        return value
+
+    def _get_key_lock(self, key: str) -> threading.Lock:
+        with self._key_locks_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+
+class MemoryCache(CacheBackend):
+    """
+    프로세스 메모리 캐시 (LRU + TTL)
+    - 태그 삭제는 태그 버전 파일에 기록하여 다른 워커의 캐시도 무효화합니다.
+      (버전 파일은 TAG_CHECK_INTERVAL(초)마다 한번만 확인합니다.)
+    """
+    TAG_VERSION_FILE_PATH = "data/cache/cache_tags.json"
+    TAG_CHECK_INTERVAL = 1  # 단위: 초
+    # 모든 캐시에 지정되는 태그 (clear()에서 다른 워커의 캐시를 무효화할 때 사용)
+    ALL_TAG = "__all__"
+
+    def __init__(self, maxsize: int = 1024):
+        super().__init__()
+        self._maxsize = maxsize
+        self._caches: Dict[int, TTLCache] = {}
+        self._lock = threading.RLock()
+        self._tag_versions: Dict[str, int] = {}
+        self._tags_checked_at = 0
+
+    def get(self, key: str) -> Optional[str]:
+        self._refresh_tag_versions()
+        with self._lock:
+            for cache in self._caches.values():
+                entry = cache.get(key)
+                if entry is None:
+                    continue
+                value, tag_versions = entry
+                if any(self._tag_versions.get(tag, 0) != version for tag, version in tag_versions.items()):
+                    cache.pop(key, None)
+                    return None
+                return value
+        return None
+
+    def set(self, key: str, value: str, ttl: int = None, tags: Iterable[str] = ()) -> None:
+        ttl = ttl or settings.CACHE_TTL
+        with self._lock:
+            self.delete(key)
+            cache = self._caches.get(ttl)
+            if cache is None:
+                cache = self._caches[ttl] = TTLCache(maxsize=self._maxsize, ttl=ttl)
+            tag_versions = {tag: self._tag_versions.get(tag, 0) for tag in (*tags, self.ALL_TAG)}
+            cache[key] = (value, tag_versions)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            for cache in self._caches.values():
+                cache.pop(key, None)
+
+    def delete_tag(self, tag: str) -> None:
+        os.makedirs(os.path.dirname(self.TAG_VERSION_FILE_PATH), exist_ok=True)
+        with FileLock(f"{self.TAG_VERSION_FILE_PATH}.lock", timeout=5):
+            tag_versions = self._read_tag_versions()
+            tag_versions[tag] = time.time_ns()
+            temp_file_path = f"{self.TAG_VERSION_FILE_PATH}.{os.getpid()}"
+            with open(temp_file_path, "w", encoding="UTF-8") as file:
+                json.dump(tag_versions, file)
+            os.replace(temp_file_path, self.TAG_VERSION_FILE_PATH)
+
+        with self._lock:
+            self._tag_versions = tag_versions
+            self._tags_checked_at = time.monotonic()
+
+    def clear(self) -> None:
+        self.delete_tag(self.ALL_TAG)
+        with self._lock:
+            self._caches.clear()
+
+    def _refresh_tag_versions(self) -> None:
+        now = time.monotonic()
+        if now - self._tags_checked_at < self.TAG_CHECK_INTERVAL:
+            return
+        tag_versions = self._read_tag_versions()
+        with self._lock:
+            self._tag_versions = tag_versions
+            self._tags_checked_at = now
+
+    def _read_tag_versions(self) -> Dict[str, int]:
+        try:
+            with open(self.TAG_VERSION_FILE_PATH, "r", encoding="UTF-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+
+class SQLiteCache(CacheBackend):
+    """
+    SQLite 파일 캐시
+    - 같은 서버의 여러 워커가 하나의 캐시를 공유합니다.
+    - 스레드마다 별도의 커넥션을 사용합니다.
+    """
+
+    def __init__(self, path: str = None):
+        super().__init__()
+        self._path = path or settings.CACHE_SQLITE_PATH
+        self._local = threading.local()
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS cache"
+                         " (key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)")
+            conn.execute("CREATE TABLE IF NOT EXISTS cache_tag"
+                         " (tag TEXT NOT NULL, key TEXT NOT NULL, PRIMARY KEY (tag, key))")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[str]:
+        row = self._connect().execute(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (key, time.time())
+        ).fetchone()
+        return row[0] if row else None
+
+    def set(self, key: str, value: str, ttl: int = None, tags: Iterable[str] = ()) -> None:
+        expires_at = time.time() + (ttl or settings.CACHE_TTL)
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+                         (key, value, expires_at))
+            conn.executemany("INSERT OR IGNORE INTO cache_tag (tag, key) VALUES (?, ?)",
+                             [(tag, key) for tag in tags])
+
+    def delete(self, key: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            conn.execute("DELETE FROM cache_tag WHERE key = ?", (key,))
+
+    def delete_tag(self, tag: str) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM cache WHERE key IN (SELECT key FROM cache_tag WHERE tag = ?)", (tag,))
+            conn.execute("DELETE FROM cache_tag WHERE tag = ?", (tag,))
+
+    def clear(self) -> None:
+        conn = self._connect()
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute("DELETE FROM cache")
+            conn.execute("DELETE FROM cache_tag")
+
+
+# 캐시 저장소 종류
+# 다른 저장소를 사용하려면 cache_backends에 추가 후 CACHE_BACKEND에 이름을 설정합니다.
+cache_backends: Dict[str, Type[CacheBackend]] = {
+    "memory": MemoryCache,
+    "sqlite": SQLiteCache,
+}
+_cache_instance: Optional[CacheBackend] = None
+_cache_instance_lock = threading.Lock()
+
+
+def get_cache() -> CacheBackend:
+    """CACHE_BACKEND 설정에 맞는 캐시 저장소를 반환합니다."""
+    global _cache_instance
+    if _cache_instance is None:
+        with _cache_instance_lock:
+            if _cache_instance is None:
+                backend = cache_backends.get(settings.CACHE_BACKEND, MemoryCache)
+                _cache_instance = backend()
+    return _cache_instance
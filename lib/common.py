@@ -27,6 +27,9 @@ from core.models import (
     BoardNew, Config, Member, Memo, UniqId, Visit, WriteBaseModel
 )
 from core.plugin import get_admin_menu_id_by_path
+from lib.g5_compatibility import TableColumnCache
+from lib.ip_matcher import get_ip_matcher
+from lib.word_filter import get_word_filter, get_word_set
 
 load_dotenv()
 
@@ -76,6 +79,7 @@ def dynamic_create_write_table(
     # 게시판 추가시 한번만 테이블 생성
     if create_table:
         DynamicModel.__table__.create(bind=db_connect.engine, checkfirst=True)
+        TableColumnCache.invalidate(DynamicModel.__tablename__)
     # 생성된 모델 캐싱
     _created_models[table_name] = DynamicModel
     return DynamicModel
@@ -369,63 +373,6 @@ class StringEncrypt:
 # decrypted_text = enc.decrypt(encrypted_text)
 # print(decrypted_text)
 
-class FileCache():
-    """파일 캐시 클래스
-    """
-    cache_dir = os.path.join("data", "cache")
-    cache_secret_key = None
-
-    def __init__(self):
-        # 캐시 디렉토리가 없으면 생성
-        os.makedirs(self.cache_dir, exist_ok=True)
-
-    def get_cache_secret_key(self):
-        """
-        캐시 비밀키를 반환하는 함수
-        """
-        # 캐시된 값이 있다면, 해당 값을 반환
-        if self.cache_secret_key:
-            return self.cache_secret_key
-
-        # 서버 소프트웨어 및 DOCUMENT_ROOT 값을 해싱하여 6자리 문자열 생성
-        server_software = os.environ.get("SERVER_SOFTWARE", "")
-        document_root = os.environ.get("DOCUMENT_ROOT", "")
-        combined_data = server_software + document_root
-        self.cache_secret_key = hashlib.md5(combined_data.encode()).hexdigest()[:6]
-
-        return self.cache_secret_key
-
-    def get(self, cache_file: str):
-        """
-        캐시된 파일이 있으면 파일을 읽어서 반환
-        """
-        if os.path.exists(cache_file):
-            with open(cache_file, "r", encoding="utf-8") as f:
-                return f.read()
-        return None
-
-    def create(self, data: str, cache_file: str):
-        """
-        cache_file을 생성하는 함수
-        """
-        with open(cache_file, "w", encoding="utf-8") as f:
-            f.write(data)
-
-    def delete(self, cache_file: str):
-        """
-        cache_file을 삭제하는 함수
-        """
-        if os.path.exists(cache_file):
-            os.remove(cache_file)
-
-    def delete_prefix(self, prefix: str):
-        """
-        prefix로 시작하는 캐시 파일을 모두 삭제하는 함수
-        """
-        for file in os.listdir(self.cache_dir):
-            if file.startswith(prefix):
-                os.remove(os.path.join(self.cache_dir, file))
-
 
 def get_admin_email(request: Request):
     """관리자 이메일 주소를 반환하는 함수
@@ -718,7 +665,7 @@ def check_ip_list(request: Request, current_ip: str, ip_list: str, allow: bool)
     Args:
         request (Request): FastAPI Request 객체
         ip (str): IP
-        ip_list (str): IP 목록 문자열
+        ip_list (str): IP 목록 문자열 (IP, + 와일드카드 패턴, CIDR 대역)
         allow (bool): True인 경우 허용 목록, False인 경우 차단 목록
 
     Returns:
@@ -731,17 +678,8 @@ def check_ip_list(request: Request, current_ip: str, ip_list: str, allow: bool)
     if not ip_list:
         return allow
 
-    ip_patterns = ip_list.split("\n")
-    for pattern in ip_patterns:
-        pattern = pattern.strip()
-        if not pattern:
-            continue
-        pattern = pattern.replace(".", r"\.")
-        pattern = pattern.replace("+", r"[0-9\.]+")
-        if re.match(f"^{pattern}$", current_ip):
-            return True
-
-    return False
+    # 목록을 매번 정규식으로 변환하지 않고 미리 변환해 둔 IPMatcher를 사용합니다.
+    return get_ip_matcher(ip_list).match(current_ip)
 
 
 def filter_words(request: Request, contents: str) -> str:
@@ -755,15 +693,9 @@ def filter_words(request: Request, contents: str) -> str:
         str: 필터링된 단어가 있으면 해당 단어, 없으면 빈 문자열
     """
     cf_filter = request.state.config.cf_filter
-    words = cf_filter.split(",")
-    for word in words:
-        word = word.strip()
-        if not word:
-            continue
-        if word in contents:
-            return word
-
-    return ''
+    # 단어마다 내용을 검색하지 않고 미리 만들어 둔 WordFilter로 한번에 검색합니다.
+    match = get_word_filter(cf_filter).search(contents)
+    return match[1] if match else ''
 
 
 def check_prohibit_words(request: Request, contents: str) -> str:
@@ -777,10 +709,9 @@ def check_prohibit_words(request: Request, contents: str) -> str:
     Returns:
         str: 금지된 단어가 있으면 해당 단어, 없으면 빈 문자열
     """
-    prohibit_list = getattr(request.state.config, "cf_prohibit_id", "").split(",")
-    prohibit_list = [id.strip().lower() for id in prohibit_list]
+    prohibit_words = get_word_set(getattr(request.state.config, "cf_prohibit_id", ""))
 
-    if contents.lower() in prohibit_list:
+    if contents.lower() in prohibit_words:
         return contents
 
     return ''
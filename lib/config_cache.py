@@ -0,0 +1,112 @@
+"""기본환경설정(Config) 캐시 기능을 제공하는 모듈입니다."""
+import os
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from core.models import Config
+
+# 여러 워커(프로세스) 간에 설정 변경을 알리기 위한 버전(세대) 파일
+CONFIG_VERSION_FILE_PATH = "data/cache/config_version.txt"
+
+
+class ConfigCache:
+    """
+    기본환경설정 캐시 클래스
+    - 요청마다 Config 테이블을 조회하지 않도록 프로세스 메모리에 캐시합니다.
+    - 설정이 변경되면 invalidate()로 버전 파일을 갱신하고,
+      다른 워커는 버전 값이 달라진 것을 확인하여 다시 조회합니다.
+    - 버전 파일 확인은 CHECK_INTERVAL(초)마다 한번만 수행하며,
+      버전이 같더라도 TTL(초)이 지나면 다시 조회합니다.
+    """
+    CHECK_INTERVAL = 1  # 단위: 초
+    TTL = 60  # 단위: 초
+
+    _config: Optional[Config] = None
+    _version: str = ""
+    _generation: int = 0
+    _loaded_at: float = 0
+    _checked_at: float = 0
+    _lock = threading.Lock()
+
+    @classmethod
+    def get(cls, db: Session) -> Optional[Config]:
+        """캐시된 기본환경설정을 반환합니다.
+        - 캐시가 없거나 만료/변경된 경우 데이터베이스에서 다시 조회합니다.
+
+        Args:
+            db (Session): 데이터베이스 세션
+
+        Returns:
+            Optional[Config]: 기본환경설정 객체 (세션에서 분리된 객체)
+        """
+        now = time.monotonic()
+        if (cls._config is not None
+                and now - cls._checked_at < cls.CHECK_INTERVAL
+                and now - cls._loaded_at < cls.TTL):
+            return cls._config
+
+        version = cls.read_version()
+        with cls._lock:
+            if (cls._config is None
+                    or cls._version != version
+                    or now - cls._loaded_at >= cls.TTL):
+                config = db.scalar(select(Config))
+                if config is None:
+                    return None
+                # 요청이 끝난 후에도 사용할 수 있도록 세션에서 분리
+                db.expunge(config)
+                cls._config = config
+                cls._version = version
+                cls._loaded_at = now
+                cls._generation += 1
+            cls._checked_at = now
+
+        return cls._config
+
+    @classmethod
+    def get_generation(cls) -> int:
+        """현재 워커에서 기본환경설정을 조회한 횟수(세대)를 반환합니다.
+        - 설정값으로부터 만들어지는 다른 캐시의 키로 사용할 수 있습니다.
+        """
+        return cls._generation
+
+    @staticmethod
+    def read_version() -> str:
+        """버전 파일에 기록된 설정 버전을 반환합니다."""
+        try:
+            with open(CONFIG_VERSION_FILE_PATH, "r", encoding="UTF-8") as file:
+                return file.read().strip()
+        except OSError:
+            return ""
+
+    @classmethod
+    def invalidate(cls) -> None:
+        """기본환경설정 캐시를 무효화합니다.
+        - 설정을 변경하는 곳에서 commit 이후에 호출해야 합니다.
+        - 버전 파일을 갱신하여 다른 워커의 캐시도 무효화합니다.
+        """
+        os.makedirs(os.path.dirname(CONFIG_VERSION_FILE_PATH), exist_ok=True)
+        temp_file_path = f"{CONFIG_VERSION_FILE_PATH}.{os.getpid()}"
+        with open(temp_file_path, "w", encoding="UTF-8") as file:
+            file.write(str(time.time_ns()))
+        os.replace(temp_file_path, CONFIG_VERSION_FILE_PATH)
+
+        with cls._lock:
+            cls._config = None
+            cls._checked_at = 0
+
+    @classmethod
+    def update_local(cls, **values) -> None:
+        """현재 워커의 캐시된 설정값만 갱신합니다.
+        - 방문자 수(cf_visit)처럼 자주 변경되지만
+          다른 워커에 즉시 반영할 필요가 없는 값에 사용합니다.
+        """
+        with cls._lock:
+            if cls._config is None:
+                return
+            for field, value in values.items():
+                setattr(cls._config, field, value)
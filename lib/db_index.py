@@ -0,0 +1,159 @@
+"""모델에 정의된 인덱스를 기존 데이터베이스에 추가하고, 쿼리 실행 계획을 점검하는 모듈입니다.
+- 테이블 생성(create_all)은 이미 있는 테이블에 인덱스를 추가하지 않으므로,
+  기존 설치 환경은 create_missing_indexes()로 빠진 인덱스를 추가합니다.
+- 같은 컬럼으로 시작하는 인덱스(유니크 제약조건 포함)가 이미 있으면 추가하지 않습니다.
+"""
+import logging
+from datetime import date, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+from sqlalchemy import Index, Table, exists, func, inspect, select
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.sql import Select
+
+from core.models import Base, BoardGood, BoardNew, Login, Memo, Point, Scrap, Visit
+
+
+class IndexStatus(NamedTuple):
+    """인덱스 상태"""
+    table: str  # 테이블 이름
+    name: str  # 인덱스 이름
+    columns: Tuple[str, ...]  # 인덱스 컬럼
+    covered_by: Optional[str]  # 같은 컬럼으로 시작하는 기존 인덱스 이름 (없으면 None)
+
+
+class QueryPlan(NamedTuple):
+    """쿼리 실행 계획 점검 결과"""
+    name: str  # 쿼리 설명
+    table: str  # 조회 테이블
+    plan: str  # 실행 계획
+    full_scan: bool  # 테이블 전체 검색 여부
+
+
+def _existing_indexes(inspector, table_name: str) -> Dict[str, Tuple[str, ...]]:
+    """테이블의 기존 인덱스, 유니크 제약조건, 기본키의 {이름: 컬럼}을 반환합니다."""
+    indexes = {}
+    for index in inspector.get_indexes(table_name):
+        indexes[index["name"]] = tuple(index["column_names"])
+    for constraint in inspector.get_unique_constraints(table_name):
+        indexes.setdefault(constraint["name"], tuple(constraint["column_names"]))
+    primary_key = inspector.get_pk_constraint(table_name)
+    if primary_key.get("constrained_columns"):
+        indexes.setdefault(primary_key.get("name") or "PRIMARY", tuple(primary_key["constrained_columns"]))
+    return indexes
+
+
+def get_index_status(bind: Engine) -> List[IndexStatus]:
+    """모델에 정의된 인덱스가 데이터베이스에 있는지 확인합니다.
+    - 테이블이 없으면 (게시판 테이블 등) 확인하지 않습니다.
+    """
+    inspector = inspect(bind)
+    table_names = set(inspector.get_table_names())
+    statuses = []
+    for table in Base.metadata.sorted_tables:
+        if table.name not in table_names or not table.indexes:
+            continue
+        existing = _existing_indexes(inspector, table.name)
+        for index in sorted(table.indexes, key=lambda i: i.name):
+            columns = tuple(column.name for column in index.columns)
+            covered_by = index.name if index.name in existing else next(
+                (name for name, index_columns in existing.items()
+                 if index_columns[:len(columns)] == columns),
+                None
+            )
+            statuses.append(IndexStatus(table.name, index.name, columns, covered_by))
+    return statuses
+
+
+def create_missing_indexes(bind: Engine) -> List[str]:
+    """데이터베이스에 없는 인덱스를 생성합니다. 여러 번 실행해도 결과는 같습니다.
+
+    Returns:
+        List[str]: 생성한 인덱스 이름 목록
+    """
+    indexes: Dict[Tuple[str, str], Index] = {
+        (table.name, index.name): index
+        for table in Base.metadata.sorted_tables for index in table.indexes
+    }
+    created = []
+    for status in get_index_status(bind):
+        if status.covered_by:
+            continue
+        indexes[(status.table, status.name)].create(bind=bind)
+        logging.info("인덱스 생성: %s.%s", status.table, status.name)
+        created.append(status.name)
+    return created
+
+
+def get_hot_path_queries() -> List[Tuple[str, Table, Select]]:
+    """요청마다 실행되는 주요 서비스 쿼리 목록 (쿼리 설명, 조회 테이블, 쿼리)"""
+    today = date.today()
+    return [
+        ("포인트 중복 적립 확인", Point.__table__,
+         select(Point.po_id).where(Point.mb_id == "admin", Point.po_rel_table == "@login",
+                                   Point.po_rel_id == "admin", Point.po_rel_action == "login")),
+        ("소멸 예정 포인트 합계", Point.__table__,
+         select(func.sum(Point.po_point - Point.po_use_point))
+         .where(Point.mb_id == "admin", Point.po_expired == 0, Point.po_expire_date < today)),
+        ("방문자 중복 확인", Visit.__table__,
+         exists().where(Visit.vi_date == today, Visit.vi_ip == "127.0.0.1").select()),
+        ("현재 접속자 IP 조회", Login.__table__,
+         select(Login.lo_id).where(Login.lo_ip == "127.0.0.1")),
+        ("현재 접속자 목록", Login.__table__,
+         select(Login.lo_id).where(Login.lo_datetime > today - timedelta(days=1))),
+        ("읽지 않은 쪽지 수", Memo.__table__,
+         select(func.count(Memo.me_id)).where(Memo.me_recv_mb_id == "admin", Memo.me_type == "recv")),
+        ("최근게시물 목록", BoardNew.__table__,
+         select(BoardNew.bn_id).where(BoardNew.bn_datetime > today - timedelta(days=1))
+         .order_by(BoardNew.bn_datetime.desc()).limit(10)),
+        ("최근게시물 삭제", BoardNew.__table__,
+         select(BoardNew.bn_id).where(BoardNew.bo_table == "free", BoardNew.wr_parent == 1)),
+        ("스크랩 목록", Scrap.__table__,
+         select(Scrap.ms_id).where(Scrap.mb_id == "admin")),
+        ("추천/비추천 확인", BoardGood.__table__,
+         select(BoardGood.bg_id).where(BoardGood.bo_table == "free", BoardGood.wr_id == 1)),
+    ]
+
+
+def _explain(conn: Connection, query: Select, table_name: str) -> Tuple[str, bool]:
+    """데이터베이스별 EXPLAIN 결과와 테이블 전체 검색 여부를 반환합니다."""
+    dialect = conn.dialect.name
+    compiled = query.compile(dialect=conn.dialect, compile_kwargs={"literal_binds": True})
+    if dialect == "sqlite":
+        rows = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {compiled}").all()
+        details = [str(row[-1]) for row in rows]
+        full_scan = any(
+            detail.startswith((f"SCAN {table_name}", f"SCAN TABLE {table_name}")) and "INDEX" not in detail
+            for detail in details
+        )
+        return "\n".join(details), full_scan
+    if dialect == "mysql":
+        result = conn.exec_driver_sql(f"EXPLAIN {compiled}")
+        rows = [dict(zip(result.keys(), row)) for row in result.all()]
+        full_scan = any(row.get("table") == table_name and row.get("type") == "ALL" for row in rows)
+        plan = "\n".join(
+            f"table={row.get('table')}, type={row.get('type')}, key={row.get('key')}, rows={row.get('rows')}"
+            for row in rows
+        )
+        return plan, full_scan
+    # postgresql
+    lines = [str(row[0]) for row in conn.exec_driver_sql(f"EXPLAIN {compiled}").all()]
+    full_scan = any(f"Seq Scan on {table_name}" in line for line in lines)
+    return "\n".join(lines), full_scan
+
+
+def explain_hot_path_queries(bind: Engine) -> List[QueryPlan]:
+    """주요 서비스 쿼리의 실행 계획을 확인하여 테이블 전체 검색 여부를 점검합니다.
+    - 데이터가 적은 테이블은 인덱스가 있어도 전체 검색을 선택할 수 있습니다.
+    """
+    plans = []
+    with bind.connect() as conn:
+        for name, table, query in get_hot_path_queries():
+            try:
+                plan, full_scan = _explain(conn, query, table.name)
+            except SQLAlchemyError as exc:
+                plan, full_scan = f"실행 계획을 확인할 수 없습니다. ({exc})", False
+                conn.rollback()
+            plans.append(QueryPlan(name, table.name, plan, full_scan))
+    return plans
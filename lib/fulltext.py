@@ -0,0 +1,361 @@
+"""게시판 전문(Full-Text) 검색 기능을 제공하는 모듈입니다.
+- DB_FULLTEXT_SEARCH 설정을 사용하면 제목+내용 검색에
+  LIKE '%검색어%' 대신 데이터베이스의 전문 검색 인덱스를 사용합니다.
+- MySQL: FULLTEXT 인덱스(ngram 파서)
+- PostgreSQL: tsvector 표현식 GIN 인덱스
+- SQLite: FTS5 가상 테이블(trigram 토크나이저)
+- 인덱스 생성은 테이블 잠금과 시간이 걸리므로 검색 요청 중에 하지 않고,
+  설치, 게시판 생성/복사, 관리자 DB 인덱스 점검에서 create_search_indexes()로 실행합니다.
+"""
+import logging
+import re
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional, Type
+
+from sqlalchemy import ColumnElement, literal_column, select, text
+from sqlalchemy.dialects.mysql import match
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Board, WriteBaseModel
+from core.settings import settings
+
+logger = logging.getLogger(__name__)
+
+
+class FullTextSearch(ABC):
+    """
+    전문 검색 백엔드 기본 클래스
+    - 데이터베이스별 백엔드는 이 클래스를 상속받아 구현합니다.
+    """
+    # 전문 검색 인덱스에 포함되는 필드
+    FIELDS = ("wr_subject", "wr_content")
+    # 전문 검색을 사용하는 검색어의 최소 길이 (짧은 검색어는 LIKE 검색)
+    MIN_WORD_LENGTH = 2
+    # 인덱스가 없는 테이블을 다시 확인하는 간격 (단위: 초)
+    CHECK_INTERVAL = 60
+
+    def __init__(self):
+        self._indexed_tables = set()
+        self._missing_tables: Dict[str, float] = {}
+
+    def is_searchable(self, fields: List[str]) -> bool:
+        """검색 필드가 전문 검색 인덱스로 검색 가능한지 확인합니다."""
+        return set(fields) == set(self.FIELDS)
+
+    def split_words(self, words: List[str]):
+        """검색어를 전문 검색할 단어와 LIKE 검색할 단어로 분리합니다."""
+        fulltext_words = []
+        like_words = []
+        for word in words:
+            cleaned = self.clean_word(word)
+            if len(cleaned) >= self.MIN_WORD_LENGTH:
+                fulltext_words.append(cleaned)
+            else:
+                like_words.append(word)
+        return fulltext_words, like_words
+
+    def clean_word(self, word: str) -> str:
+        """검색 구문에서 특별한 의미를 가지는 문자를 제거합니다."""
+        return word.strip()
+
+    def is_indexed(self, db: Session, model: WriteBaseModel) -> bool:
+        """게시판 테이블에 전문 검색 인덱스가 있는지 확인합니다.
+        - 인덱스를 생성하지 않습니다. 인덱스가 없으면 LIKE 검색을 사용합니다.
+        - 인덱스가 없는 테이블은 CHECK_INTERVAL(초)마다 한번만 다시 확인합니다.
+        """
+        table_name = model.__tablename__
+        if table_name in self._indexed_tables:
+            return True
+        if time.monotonic() - self._missing_tables.get(table_name, -self.CHECK_INTERVAL) < self.CHECK_INTERVAL:
+            return False
+
+        try:
+            # 호출한 쪽의 트랜잭션에 영향을 주지 않도록 SAVEPOINT 안에서 확인합니다.
+            with db.begin_nested():
+                exists_index = self.exists_index(db, model)
+        except SQLAlchemyError as exc:
+            logger.warning("전문 검색 인덱스를 확인할 수 없습니다. (%s) %s", table_name, exc)
+            exists_index = False
+
+        if exists_index:
+            self._indexed_tables.add(table_name)
+            self._missing_tables.pop(table_name, None)
+        else:
+            self._missing_tables[table_name] = time.monotonic()
+        return exists_index
+
+    def sync_index(self, db: Session, model: WriteBaseModel) -> None:
+        """전문 검색 인덱스가 없으면 생성합니다.
+        - 인덱스를 데이터베이스가 관리하는 경우 이미 있는 인덱스는 그대로 사용합니다.
+        """
+        if not self.exists_index(db, model):
+            self.create_index(db, model)
+        db.commit()
+        self._indexed_tables.add(model.__tablename__)
+        self._missing_tables.pop(model.__tablename__, None)
+
+    def drop_index(self, db: Session, model: WriteBaseModel) -> None:
+        """게시판 테이블 삭제 전에 전문 검색 인덱스를 삭제합니다.
+        - 테이블과 함께 삭제되는 인덱스는 캐시된 상태만 삭제합니다.
+        """
+        self._indexed_tables.discard(model.__tablename__)
+        self._missing_tables.pop(model.__tablename__, None)
+
+    @abstractmethod
+    def exists_index(self, db: Session, model: WriteBaseModel) -> bool:
+        """전문 검색 인덱스가 있는지 확인합니다."""
+
+    @abstractmethod
+    def create_index(self, db: Session, model: WriteBaseModel) -> None:
+        """전문 검색 인덱스를 생성합니다."""
+
+    @abstractmethod
+    def match(self, model: WriteBaseModel, words: List[str], operator: str = "or") -> ColumnElement:
+        """전문 검색 조건을 반환합니다."""
+
+    def update_writes(self, db: Session, model: WriteBaseModel, writes: List[WriteBaseModel]) -> None:
+        """게시글의 추가/수정 내용을 인덱스에 반영합니다.
+        - 데이터베이스가 인덱스를 자동으로 갱신하는 경우 아무 작업도 하지 않습니다.
+        - commit은 게시글을 저장하는 쪽에서 합니다.
+        """
+
+    def delete_writes(self, db: Session, model: WriteBaseModel, wr_ids: List[int]) -> None:
+        """삭제된 게시글을 인덱스에서 제거합니다.
+        - 데이터베이스가 인덱스를 자동으로 갱신하는 경우 아무 작업도 하지 않습니다.
+        - commit은 게시글을 삭제하는 쪽에서 합니다.
+        """
+
+
+class MySQLFullTextSearch(FullTextSearch):
+    """MySQL FULLTEXT 인덱스(ngram 파서)를 사용하는 전문 검색 백엔드"""
+    # ngram_token_size 기본값
+    MIN_WORD_LENGTH = 2
+
+    def clean_word(self, word: str) -> str:
+        return re.sub(r'[+\-<>()~*"@]', "", word).strip()
+
+    def exists_index(self, db: Session, model: WriteBaseModel) -> bool:
+        table_name = model.__tablename__
+        return bool(db.scalar(
+            text("SELECT COUNT(*) FROM information_schema.statistics"
+                 " WHERE table_schema = DATABASE() AND table_name = :table_name AND index_name = :index_name"),
+            {"table_name": table_name, "index_name": f"ft_{table_name}"}
+        ))
+
+    def create_index(self, db: Session, model: WriteBaseModel) -> None:
+        table_name = model.__tablename__
+        db.execute(text(
+            f"ALTER TABLE {table_name} ADD FULLTEXT INDEX ft_{table_name} ({', '.join(self.FIELDS)})"
+            " WITH PARSER ngram"
+        ))
+
+    def match(self, model: WriteBaseModel, words: List[str], operator: str = "or") -> ColumnElement:
+        prefix = "+" if operator == "and" else ""
+        against = " ".join(f'{prefix}"{word}"' for word in words)
+        columns = [getattr(model, field) for field in self.FIELDS]
+        return match(*columns, against=against).in_boolean_mode()
+
+
+class PostgreSQLFullTextSearch(FullTextSearch):
+    """PostgreSQL tsvector 표현식 GIN 인덱스를 사용하는 전문 검색 백엔드"""
+    MIN_WORD_LENGTH = 1
+
+    def clean_word(self, word: str) -> str:
+        return re.sub(r"[&|!():*'\"\\<>]", "", word).strip()
+
+    def get_document(self, model: WriteBaseModel, with_table: bool = True) -> str:
+        """인덱스와 검색 조건에서 동일하게 사용하는 tsvector 표현식을 반환합니다."""
+        prefix = f"{model.__tablename__}." if with_table else ""
+        columns = " || ' ' || ".join(f"coalesce({prefix}{field}, '')" for field in self.FIELDS)
+        return f"to_tsvector('simple', {columns})"
+
+    def exists_index(self, db: Session, model: WriteBaseModel) -> bool:
+        return bool(db.scalar(
+            text("SELECT COUNT(*) FROM pg_indexes WHERE tablename = :table_name AND indexname = :index_name"),
+            {"table_name": model.__tablename__, "index_name": f"ft_{model.__tablename__}"}
+        ))
+
+    def create_index(self, db: Session, model: WriteBaseModel) -> None:
+        table_name = model.__tablename__
+        db.execute(text(
+            f"CREATE INDEX IF NOT EXISTS ft_{table_name} ON {table_name}"
+            f" USING GIN (({self.get_document(model, with_table=False)}))"
+        ))
+
+    def match(self, model: WriteBaseModel, words: List[str], operator: str = "or") -> ColumnElement:
+        # 한글은 형태소 분석 없이 단어 앞부분 일치(prefix)로 검색합니다.
+        query = (" & " if operator == "and" else " | ").join(f"{word}:*" for word in words)
+        return text(
+            f"{self.get_document(model)} @@ to_tsquery('simple', :fulltext_query)"
+        ).bindparams(fulltext_query=query)
+
+
+class SQLiteFullTextSearch(FullTextSearch):
+    """SQLite FTS5 가상 테이블(trigram 토크나이저)을 사용하는 전문 검색 백엔드
+    - FTS5 테이블은 게시판 테이블과 별도로 저장되므로
+      게시글 추가/수정/삭제시 update_writes, delete_writes로 동기화해야 합니다.
+    - sync_index()는 FTS5 테이블이 이미 있어도 게시판 테이블의 내용으로 다시 채웁니다.
+      (동기화되지 않은 게시글이 있을 수 있는 기존 설치 환경, 게시판 복사)
+    - trigram 토크나이저는 SQLite 3.34 이상에서 사용할 수 있습니다.
+    """
+    # trigram 토크나이저는 3글자 이상만 검색 가능
+    MIN_WORD_LENGTH = 3
+
+    def clean_word(self, word: str) -> str:
+        return word.replace('"', "").strip()
+
+    def get_fts_table_name(self, model: WriteBaseModel) -> str:
+        """FTS5 가상 테이블 이름을 반환합니다."""
+        return f"{model.__tablename__}_fts"
+
+    def exists_index(self, db: Session, model: WriteBaseModel) -> bool:
+        return bool(db.scalar(
+            text("SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = :name"),
+            {"name": self.get_fts_table_name(model)}
+        ))
+
+    def create_index(self, db: Session, model: WriteBaseModel) -> None:
+        db.execute(text(
+            f"CREATE VIRTUAL TABLE {self.get_fts_table_name(model)}"
+            f" USING fts5({', '.join(self.FIELDS)}, tokenize='trigram')"
+        ))
+        self._fill_index(db, model)
+
+    def sync_index(self, db: Session, model: WriteBaseModel) -> None:
+        if self.exists_index(db, model):
+            db.execute(text(f"DELETE FROM {self.get_fts_table_name(model)}"))
+            self._fill_index(db, model)
+            db.commit()
+        super().sync_index(db, model)
+
+    def drop_index(self, db: Session, model: WriteBaseModel) -> None:
+        db.execute(text(f"DROP TABLE IF EXISTS {self.get_fts_table_name(model)}"))
+        db.commit()
+        super().drop_index(db, model)
+
+    def _fill_index(self, db: Session, model: WriteBaseModel) -> None:
+        """게시판 테이블의 게시글을 인덱스에 추가합니다."""
+        db.execute(text(
+            f"INSERT INTO {self.get_fts_table_name(model)} (rowid, {', '.join(self.FIELDS)})"
+            f" SELECT wr_id, {', '.join(self.FIELDS)} FROM {model.__tablename__}"
+        ))
+
+    def match(self, model: WriteBaseModel, words: List[str], operator: str = "or") -> ColumnElement:
+        fts_table_name = self.get_fts_table_name(model)
+        query = (" AND " if operator == "and" else " OR ").join(f'"{word}"' for word in words)
+        subquery = (
+            select(literal_column("rowid"))
+            .select_from(text(fts_table_name))
+            .where(text(f"{fts_table_name} MATCH :fulltext_query").bindparams(fulltext_query=query))
+        )
+        return model.wr_id.in_(subquery)
+
+    def update_writes(self, db: Session, model: WriteBaseModel, writes: List[WriteBaseModel]) -> None:
+        if not writes or not self.is_indexed(db, model):
+            return
+        fts_table_name = self.get_fts_table_name(model)
+        self.delete_writes(db, model, [write.wr_id for write in writes])
+        db.execute(
+            text(f"INSERT INTO {fts_table_name} (rowid, {', '.join(self.FIELDS)})"
+                 f" VALUES (:wr_id, {', '.join(':' + field for field in self.FIELDS)})"),
+            [{"wr_id": write.wr_id, **{field: getattr(write, field) for field in self.FIELDS}}
+             for write in writes]
+        )
+
+    def delete_writes(self, db: Session, model: WriteBaseModel, wr_ids: List[int]) -> None:
+        if not wr_ids or not self.is_indexed(db, model):
+            return
+        fts_table_name = self.get_fts_table_name(model)
+        db.execute(
+            text(f"DELETE FROM {fts_table_name} WHERE rowid = :wr_id"),
+            [{"wr_id": wr_id} for wr_id in wr_ids]
+        )
+
+
+# 데이터베이스 종류별 전문 검색 백엔드
+# 다른 백엔드를 사용하려면 register_fulltext_search()로 등록합니다.
+fulltext_search_backends: Dict[str, Type[FullTextSearch]] = {
+    "mysql": MySQLFullTextSearch,
+    "postgresql": PostgreSQLFullTextSearch,
+    "sqlite": SQLiteFullTextSearch,
+}
+_fulltext_search_instance: Optional[FullTextSearch] = None
+
+
+def register_fulltext_search(dialect_name: str, backend: Type[FullTextSearch]) -> None:
+    """데이터베이스 종류에 사용할 전문 검색 백엔드를 등록합니다."""
+    global _fulltext_search_instance
+    fulltext_search_backends[dialect_name] = backend
+    _fulltext_search_instance = None
+
+
+def get_fulltext_search() -> Optional[FullTextSearch]:
+    """현재 데이터베이스에 맞는 전문 검색 백엔드를 반환합니다.
+
+    Returns:
+        Optional[FullTextSearch]: 전문 검색을 사용하지 않거나 지원하지 않으면 None
+    """
+    global _fulltext_search_instance
+    if not settings.DB_FULLTEXT_SEARCH:
+        return None
+
+    if _fulltext_search_instance is None:
+        dialect_name = DBConnect().engine.dialect.name
+        backend = fulltext_search_backends.get(dialect_name)
+        if backend is None:
+            return None
+        _fulltext_search_instance = backend()
+    return _fulltext_search_instance
+
+
+def update_search_index(db: Session, model: WriteBaseModel, writes: List[WriteBaseModel]) -> None:
+    """게시글 추가/수정 내용을 전문 검색 인덱스에 반영합니다. (게시글과 같은 트랜잭션에서 commit)"""
+    if fulltext_search := get_fulltext_search():
+        fulltext_search.update_writes(db, model, writes)
+
+
+def delete_search_index(db: Session, model: WriteBaseModel, wr_ids: List[int]) -> None:
+    """삭제한 게시글을 전문 검색 인덱스에서 제거합니다. (게시글과 같은 트랜잭션에서 commit)"""
+    if fulltext_search := get_fulltext_search():
+        fulltext_search.delete_writes(db, model, wr_ids)
+
+
+def create_search_index(db: Session, model: WriteBaseModel) -> None:
+    """게시판 테이블의 전문 검색 인덱스를 생성(동기화)합니다. (게시판 생성/복사)"""
+    if fulltext_search := get_fulltext_search():
+        fulltext_search.sync_index(db, model)
+
+
+def create_search_indexes(db: Session) -> List[str]:
+    """모든 게시판 테이블의 전문 검색 인덱스를 생성(동기화)합니다. (설치, 관리자 DB 인덱스 점검)
+    - 데이터가 많은 테이블은 시간이 걸리고 테이블이 잠길 수 있습니다.
+
+    Returns:
+        List[str]: 인덱스를 생성(동기화)한 게시판 테이블 이름 목록
+    """
+    from lib.common import dynamic_create_write_table
+
+    fulltext_search = get_fulltext_search()
+    if fulltext_search is None:
+        return []
+
+    table_names = []
+    for bo_table in db.scalars(select(Board.bo_table)).all():
+        model = dynamic_create_write_table(bo_table)
+        try:
+            fulltext_search.sync_index(db, model)
+        except SQLAlchemyError as exc:
+            db.rollback()
+            logger.warning("전문 검색 인덱스를 생성할 수 없습니다. (%s) %s", model.__tablename__, exc)
+            continue
+        table_names.append(model.__tablename__)
+    return table_names
+
+
+def drop_search_index(db: Session, model: WriteBaseModel) -> None:
+    """게시판 테이블을 삭제하기 전에 전문 검색 인덱스를 삭제합니다."""
+    if fulltext_search := get_fulltext_search():
+        fulltext_search.drop_index(db, model)
@@ -1,9 +1,44 @@
+import threading
 from datetime import datetime
-from sqlalchemy import MetaData, Table
+from typing import Dict, Optional
+
+from sqlalchemy import inspect
 
 from core.database import db_session
 
 
+class TableColumnCache:
+    """
+    테이블의 컬럼 타입을 캐시하는 클래스
+    - 데이터베이스 전체를 reflect 하지 않고, 필요한 테이블의 컬럼 정보만 한번 조회하여 저장합니다.
+    - 게시판 테이블이 생성/삭제되면 invalidate()로 해당 테이블의 캐시를 삭제합니다.
+    - 워커(프로세스)마다 별도로 저장됩니다.
+    """
+    _columns: Dict[str, Dict[str, str]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_columns(cls, bind, table_name: str) -> Dict[str, str]:
+        """테이블의 {컬럼 이름: 컬럼 타입 문자열}을 반환합니다."""
+        columns = cls._columns.get(table_name)
+        if columns is None:
+            columns = {
+                column["name"]: str(column["type"])
+                for column in inspect(bind).get_columns(table_name)
+            }
+            with cls._lock:
+                cls._columns[table_name] = columns
+        return columns
+
+    @classmethod
+    def invalidate(cls, table_name: str = None) -> None:
+        """테이블의 컬럼 캐시를 삭제합니다. table_name이 없으면 전체 삭제"""
+        with cls._lock:
+            if table_name is None:
+                cls._columns.clear()
+            else:
+                cls._columns.pop(table_name, None)
+
 
 class G5Compatibility:
     """
@@ -13,16 +48,18 @@ class G5Compatibility:
     def __init__(self, db: db_session):
         self.db = db
 
+    def get_column_type(self, table_name: str, column_name: str) -> Optional[str]:
+        """
+        테이블 컬럼의 타입 문자열을 반환합니다. (예: DATETIME, VARCHAR(19))
+        """
+        return TableColumnCache.get_columns(self.db.get_bind(), table_name).get(column_name)
+
     def get_wr_last_now(self, table_name):
         """
         write_free, write_notice 등의 테이블의 wr_last 필드에 들어갈 현재 시간을 반환합니다.
         """
-        metadata = MetaData()
-        metadata.reflect(bind=self.db.bind)
-        table = Table(table_name, metadata, autoload_with=self.db.bind)
-        wr_last_col = table.columns.get('wr_last')
-        wr_last_type = str(wr_last_col.type)
+        wr_last_type = self.get_column_type(table_name, 'wr_last')
         now = datetime.now()
         if wr_last_type == 'VARCHAR(19)':
             now = now.strftime('%Y-%m-%d %H:%M:%S')
-        return now
\ No newline at end of file
+        return now
@@ -0,0 +1,92 @@
+"""접근가능/차단 IP 목록을 미리 변환해 두고 IP를 확인하는 모듈입니다."""
+import ipaddress
+import logging
+import re
+import threading
+from bisect import bisect_right
+from typing import Dict, List, Optional
+
+from cachetools import LRUCache, cached
+
+PLAIN_IP_PATTERN = re.compile(r"[0-9a-fA-F.:]+")
+
+
+class IPMatcher:
+    """
+    IP 목록(줄 단위) 확인 클래스
+    - 와일드카드가 없는 IP는 set으로 확인합니다.
+    - `+` 와일드카드가 포함된 패턴은 하나의 정규식으로 합쳐서 한번에 확인합니다.
+      (예: 123.123.+ → 123.123.으로 시작하는 모든 IP)
+    - CIDR 대역(예: 192.168.0.0/16)은 합쳐서 정렬한 뒤 이진 탐색으로 확인합니다.
+    """
+
+    def __init__(self, ip_list: str):
+        self.addresses = set()
+        self.pattern: Optional[re.Pattern] = None
+        # IP 버전별 (대역 시작 주소 목록, 대역 끝 주소 목록)
+        self.ranges: Dict[int, tuple] = {}
+
+        patterns: List[str] = []
+        networks = {4: [], 6: []}
+        for line in ip_list.split("\n"):
+            line = line.strip()
+            if not line:
+                continue
+
+            if "/" in line:
+                try:
+                    network = ipaddress.ip_network(line, strict=False)
+                    networks[network.version].append(network)
+                    continue
+                except ValueError:
+                    pass
+
+            if PLAIN_IP_PATTERN.fullmatch(line):
+                self.addresses.add(line)
+                continue
+
+            pattern = line.replace(".", r"\.").replace("+", r"[0-9\.]+")
+            try:
+                re.compile(pattern)
+            except re.error:
+                logging.warning("잘못된 IP 패턴: %s", line)
+                continue
+            patterns.append(f"(?:{pattern})")
+
+        if patterns:
+            self.pattern = re.compile(f"^(?:{'|'.join(patterns)})$")
+
+        for version, version_networks in networks.items():
+            if version_networks:
+                collapsed = list(ipaddress.collapse_addresses(version_networks))
+                self.ranges[version] = (
+                    [int(network.network_address) for network in collapsed],
+                    [int(network.broadcast_address) for network in collapsed],
+                )
+
+    def match(self, ip: str) -> bool:
+        """IP가 목록에 속하는지 확인합니다."""
+        if ip in self.addresses:
+            return True
+        if self.pattern and self.pattern.match(ip):
+            return True
+        if self.ranges:
+            try:
+                address = ipaddress.ip_address(ip)
+            except ValueError:
+                return False
+            if address.version not in self.ranges:
+                return False
+            starts, ends = self.ranges[address.version]
+            index = bisect_right(starts, int(address)) - 1
+            return index >= 0 and int(address) <= ends[index]
+        return False
+
+
+@cached(LRUCache(maxsize=16), lock=threading.Lock())
+def get_ip_matcher(ip_list: str) -> IPMatcher:
+    """IP 목록 문자열에 대한 IPMatcher를 반환합니다.
+    - 목록 문자열이 같으면 만들어 둔 IPMatcher를 재사용하므로
+      기본환경설정이 변경되었을 때만 새로 만들어집니다.
+    """
+    return IPMatcher(ip_list)
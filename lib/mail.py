@@ -2,12 +2,19 @@
 메일 발송 라이브러리
 - background에서 Session 공유 문제로 인해 DBConnect().sessionLocal()을 사용함
 """
+import heapq
+import itertools
+import logging
+import queue
 import smtplib
+import threading
+import time
 from datetime import datetime
 from email.header import Header
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr
+from typing import List, Optional, Tuple
 
 from fastapi import Request
 from fastapi.templating import Jinja2Templates
@@ -24,9 +31,216 @@ _SMTP_USERNAME = settings.SMTP_USERNAME
 _SMTP_PASSWORD = settings.SMTP_PASSWORD
 
 
+class MailMessage:
+    """발송할 메일 정보"""
+
+    def __init__(self, from_email: str, to_email: str, subject: str, body: str,
+                 from_name: str = None, to_name: str = None):
+        self.from_email = from_email
+        self.to_email = to_email
+        self.attempts = 0  # 발송 시도 횟수
+
+        msg = MIMEMultipart()
+        msg['From'] = formataddr((str(Header(from_name, 'utf-8')), from_email))
+        msg['To'] = formataddr((str(Header(to_name, 'utf-8')), to_email))
+        msg['Subject'] = subject
+        # Assuming body is HTML, if not change 'html' to 'plain'
+        msg.attach(MIMEText(body, 'html'))
+        self.content = msg.as_string()
+
+
+def connect_smtp() -> smtplib.SMTP:
+    """SMTP 서버에 연결하고 로그인한 객체를 반환합니다."""
+    # Daum, Naver 메일은 SMTP_SSL을 사용합니다.
+    if _SMTP_PORT == 465:
+        server = smtplib.SMTP_SSL(_SMTP_SERVER, _SMTP_PORT, timeout=10)
+    else: # port: 587
+        server = smtplib.SMTP(_SMTP_SERVER, _SMTP_PORT, timeout=10)
+        # 로컬 디버깅 서버처럼 STARTTLS를 지원하지 않는 서버는 평문으로 발송합니다.
+        server.ehlo()
+        if server.has_extn("starttls"):
+            server.starttls()
+
+    if _SMTP_USERNAME and _SMTP_PASSWORD:
+        server.login(_SMTP_USERNAME, _SMTP_PASSWORD)
+    return server
+
+
+class SMTPConnection:
+    """
+    재사용 가능한 SMTP 연결
+    - 연결 후 IDLE_TIMEOUT(초) 동안 발송이 없으면 연결을 끊고, 다음 발송 시 다시 연결합니다.
+    """
+    IDLE_TIMEOUT = 30  # 단위: 초
+
+    def __init__(self):
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+
+    def send(self, message: MailMessage) -> None:
+        """메일을 발송합니다. 재사용한 연결이 끊어져 있으면 한번 다시 연결합니다."""
+        reused = self._server is not None
+        try:
+            self._get_server().sendmail(message.from_email, message.to_email, message.content)
+        except smtplib.SMTPServerDisconnected:
+            self.close()
+            if not reused:
+                raise
+            self._get_server().sendmail(message.from_email, message.to_email, message.content)
+        self._last_used = time.monotonic()
+
+    def close_if_idle(self) -> None:
+        """IDLE_TIMEOUT 동안 사용하지 않은 연결을 끊습니다."""
+        if self._server is not None and time.monotonic() - self._last_used > self.IDLE_TIMEOUT:
+            self.close()
+
+    def close(self) -> None:
+        """연결을 끊습니다."""
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:
+            pass
+        self._server = None
+
+    def _get_server(self) -> smtplib.SMTP:
+        self.close_if_idle()
+        if self._server is None:
+            self._server = connect_smtp()
+            self._last_used = time.monotonic()
+        return self._server
+
+
+class MailOutbox:
+    """
+    메일 발송 대기열
+    - 요청에서는 메일을 대기열에 등록만 하고, 발송은 백그라운드 스레드(MAIL_WORKERS)에서 처리합니다.
+    - 스레드마다 SMTP 연결을 유지하여 여러 메일을 하나의 연결로 연속 발송합니다.
+    - 발송에 실패한 메일은 RETRY_DELAY * 2^(시도 횟수 - 1)초 후에
+      MAIL_MAX_RETRIES 횟수만큼 다시 발송합니다.
+    - 대기열은 프로세스 메모리에 있으므로 서버가 비정상 종료되면 발송하지 못한 메일은 사라집니다.
+    """
+    BATCH_SIZE = 20  # 한번에 꺼내서 연속 발송할 메일 수
+    RETRY_DELAY = 5  # 단위: 초
+    POLL_INTERVAL = 1  # 대기열 확인 간격 (단위: 초)
+
+    _queue: "queue.Queue[MailMessage]" = queue.Queue()
+    # (재발송 시각, 순번, 메일)
+    _retry_heap: List[Tuple[float, int, MailMessage]] = []
+    _retry_counter = itertools.count()
+    _workers: List[threading.Thread] = []
+    _lock = threading.Lock()
+    _stopping = threading.Event()
+
+    @classmethod
+    def enqueue(cls, message: MailMessage) -> None:
+        """메일을 발송 대기열에 등록합니다."""
+        cls.start()
+        cls._queue.put(message)
+
+    @classmethod
+    def start(cls) -> None:
+        """발송 스레드를 시작합니다. (이미 실행 중이면 실행하지 않습니다.)"""
+        with cls._lock:
+            if cls._stopping.is_set():
+                return
+            workers = [worker for worker in cls._workers if worker.is_alive()]
+            for index in range(len(workers), settings.MAIL_WORKERS):
+                worker = threading.Thread(target=cls._run, name=f"mail-outbox-{index}", daemon=True)
+                worker.start()
+                workers.append(worker)
+            cls._workers = workers
+
+    @classmethod
+    def shutdown(cls, timeout: float = 10) -> None:
+        """대기열에 남은 메일을 발송한 후 발송 스레드를 종료합니다.
+
+        Args:
+            timeout (float, optional): 발송 스레드 종료를 기다리는 최대 시간(초). Defaults to 10.
+        """
+        cls._stopping.set()
+        deadline = time.monotonic() + timeout
+        for worker in cls._workers:
+            worker.join(max(0.0, deadline - time.monotonic()))
+
+        with cls._lock:
+            remains = cls._queue.qsize() + len(cls._retry_heap)
+        if remains:
+            logging.warning("발송하지 못한 메일 %d건이 있습니다.", remains)
+
+    @classmethod
+    def _run(cls) -> None:
+        connection = SMTPConnection()
+        try:
+            while True:
+                cls._requeue_due_retries()
+                batch = cls._get_batch()
+                if not batch:
+                    connection.close_if_idle()
+                    if cls._stopping.is_set():
+                        return
+                    continue
+                for message in batch:
+                    cls._send(connection, message)
+        finally:
+            connection.close()
+
+    @classmethod
+    def _get_batch(cls) -> List[MailMessage]:
+        """대기열에서 최대 BATCH_SIZE개의 메일을 꺼냅니다."""
+        try:
+            batch = [cls._queue.get(timeout=cls.POLL_INTERVAL)]
+        except queue.Empty:
+            return []
+        while len(batch) < cls.BATCH_SIZE:
+            try:
+                batch.append(cls._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    @classmethod
+    def _send(cls, connection: SMTPConnection, message: MailMessage) -> None:
+        message.attempts += 1
+        try:
+            connection.send(message)
+        except smtplib.SMTPRecipientsRefused as e:
+            logging.error("메일 수신자가 거부되었습니다. %s %s", message.to_email, e)
+        except smtplib.SMTPResponseException as e:
+            connection.close()
+            # 5xx 응답(인증 실패, 잘못된 주소 등)은 다시 보내도 실패하므로 재발송하지 않습니다.
+            if e.smtp_code >= 500:
+                logging.error("메일을 보내는 중에 오류가 발생했습니다. %s %s", message.to_email, e)
+            else:
+                cls._retry(message, e)
+        except (smtplib.SMTPException, OSError) as e:
+            connection.close()
+            cls._retry(message, e)
+
+    @classmethod
+    def _retry(cls, message: MailMessage, error: Exception) -> None:
+        if message.attempts > settings.MAIL_MAX_RETRIES or cls._stopping.is_set():
+            logging.error("메일 발송에 실패했습니다. (%d회 시도) %s %s", message.attempts, message.to_email, error)
+            return
+        retry_at = time.monotonic() + cls.RETRY_DELAY * 2 ** (message.attempts - 1)
+        with cls._lock:
+            heapq.heappush(cls._retry_heap, (retry_at, next(cls._retry_counter), message))
+
+    @classmethod
+    def _requeue_due_retries(cls) -> None:
+        """재발송 시각이 된 메일을 대기열에 다시 등록합니다."""
+        now = time.monotonic()
+        with cls._lock:
+            while cls._retry_heap and cls._retry_heap[0][0] <= now:
+                cls._queue.put(heapq.heappop(cls._retry_heap)[2])
+
+
 def mailer(from_email: str, to_email: str, subject: str, body: str,
            from_name: str = None, to_name: str = None) -> None:
     """메일 발송 함수
+    - MAIL_WORKERS 설정이 1 이상이면 발송 대기열에 등록하고 바로 반환합니다.
+    - 0 이면 요청 중에 바로 발송합니다. (send_mail_now)
 
     Args:
         from_email (str): 보내는 사람 이메일
@@ -35,46 +249,49 @@ def mailer(from_email: str, to_email: str, subject: str, body: str,
         body (str): 내용
         from_name (str, optional): 보내는 사람 이름. Defaults to None.
         to_name (str, optional): 받는 사람 이름. Defaults to None.
-
-    Raises:
-        SMTPAuthenticationError: SMTP 인증정보가 잘못되었을 때
-        SMTPServerDisconnected: SMTP 서버에 연결하지 못했거나 연결이 끊어졌을 때
-        SMTPException: 메일을 보내는 중에 오류가 발생했을 때
-        Exception: 기타 오류
     """
-    try:
-        # Daum, Naver 메일은 SMTP_SSL을 사용합니다.
-        if _SMTP_PORT == 465:
-            server = smtplib.SMTP_SSL(_SMTP_SERVER, _SMTP_PORT, timeout=10)
-        else: # port: 587
-            server = smtplib.SMTP(_SMTP_SERVER, _SMTP_PORT, timeout=10)
-            server.starttls()
+    if settings.MAIL_WORKERS > 0:
+        try:
+            message = MailMessage(from_email, to_email, subject, body, from_name, to_name)
+        except Exception as e:
+            print(e)
+            return
+        MailOutbox.enqueue(message)
+        return
 
-        if _SMTP_USERNAME and _SMTP_PASSWORD:
-            server.login(_SMTP_USERNAME, _SMTP_PASSWORD)
+    error = send_mail_now(from_email, to_email, subject, body, from_name, to_name)
+    if error:
+        print(error)
 
-        msg = MIMEMultipart()
-        msg['From'] = formataddr((str(Header(from_name, 'utf-8')), from_email))
-        msg['To'] = formataddr((str(Header(to_name, 'utf-8')), to_email))
-        msg['Subject'] = subject
-        # Assuming body is HTML, if not change 'html' to 'plain'
-        msg.attach(MIMEText(body, 'html'))
 
-        server.sendmail(from_email, to_email, msg.as_string())
+def send_mail_now(from_email: str, to_email: str, subject: str, body: str,
+                  from_name: str = None, to_name: str = None) -> Optional[str]:
+    """메일을 발송 대기열에 등록하지 않고 바로 발송합니다.
+    - 관리자 테스트 메일처럼 발송 결과를 바로 확인해야 하는 경우에 사용합니다.
 
+    Returns:
+        Optional[str]: 발송에 실패한 경우 오류 메시지 (한 줄), 성공하면 None
+    """
+    connection = SMTPConnection()
+    try:
+        message = MailMessage(from_email, to_email, subject, body, from_name, to_name)
+        connection.send(message)
     except smtplib.SMTPAuthenticationError as e:
-        print(f"SMTP 인증정보가 잘못되었습니다. {e}")
+        error = f"SMTP 인증정보가 잘못되었습니다. {e}"
     except smtplib.SMTPServerDisconnected as e:
-        print(f"SMTP 서버에 연결하지 못했거나 연결이 끊어졌습니다. {e}")
+        error = f"SMTP 서버에 연결하지 못했거나 연결이 끊어졌습니다. {e}"
     except smtplib.SMTPException as e:
-        print(f"메일을 보내는 중에 오류가 발생했습니다. {e}")
+        error = f"메일을 보내는 중에 오류가 발생했습니다. {e}"
+    except OSError as e:
+        error = f"SMTP 서버({_SMTP_SERVER}:{_SMTP_PORT})에 연결하지 못했습니다. {e}"
     except Exception as e:
-        print(e)
+        error = str(e)
+    else:
+        return None
     finally:
-        try:
-            server.quit()
-        except Exception as e:
-            pass
+        connection.close()
+    # 알림창(alert)에 그대로 출력할 수 있도록 한 줄로 변환
+    return " ".join(error.replace('"', "'").split())
 
 
 async def send_password_reset_mail(request: Request, member: Member) -> None:
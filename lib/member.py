@@ -1,11 +1,16 @@
 """회원 관련 기능을 제공하는 모듈입니다."""
 import math
+import threading
 from datetime import date, datetime, timedelta
-from typing import Tuple, Union
+from typing import Optional, Tuple, Union
 
+from cachetools import TTLCache
 from fastapi import Request
+from sqlalchemy import inspect
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from core.models import Board, Config, Group, Member
+from core.settings import settings
 
 
 class MemberDetails:
@@ -91,6 +96,60 @@ class MemberDetails:
         return False
 
 
+class MemberCache:
+    """
+    API 인증 회원 정보 캐시
+    - JWT로 인증할 때마다 회원 정보를 조회하지 않도록 (회원 아이디, 토큰 발급 시각)별로
+      회원 정보의 복사본을 API_MEMBER_CACHE_TTL(초) 동안 저장합니다.
+    - 캐시된 회원 정보는 요청의 세션에 merge하여 반환하므로 수정 후 commit할 수 있습니다.
+    - 회원 정보를 수정하면 invalidate()로 캐시를 삭제합니다.
+    - invalidate()는 현재 워커의 캐시만 삭제합니다. 다른 워커는 최대 TTL(초) 동안
+      변경 전 회원 정보(포인트, 레벨, 차단/탈퇴 여부 포함)로 인증하므로 TTL은 짧게 유지하며,
+      MAX_TTL(초)보다 길게 설정해도 MAX_TTL을 사용합니다.
+    """
+    MAX_TTL = 60
+    _cache: Optional[TTLCache] = None
+    _lock = threading.Lock()
+
+    @classmethod
+    def _get_cache(cls) -> TTLCache:
+        if cls._cache is None:
+            cls._cache = TTLCache(maxsize=10000, ttl=min(settings.API_MEMBER_CACHE_TTL, cls.MAX_TTL))
+        return cls._cache
+
+    @classmethod
+    def get(cls, db: Session, mb_id: str, issued_at: int) -> Optional[Member]:
+        """캐시된 회원 정보를 세션에 추가하여 반환합니다. 없으면 None"""
+        if settings.API_MEMBER_CACHE_TTL <= 0:
+            return None
+        with cls._lock:
+            snapshot = cls._get_cache().get((mb_id, issued_at))
+        if snapshot is None:
+            return None
+        # 데이터베이스를 조회하지 않고 세션에 추가
+        return db.merge(snapshot, load=False)
+
+    @classmethod
+    def set(cls, member: Member, issued_at: int) -> None:
+        """회원 정보의 복사본을 캐시에 저장합니다."""
+        if settings.API_MEMBER_CACHE_TTL <= 0 or member is None:
+            return
+        columns = inspect(Member).column_attrs
+        snapshot = Member(**{column.key: getattr(member, column.key) for column in columns})
+        make_transient_to_detached(snapshot)
+        with cls._lock:
+            cls._get_cache()[(member.mb_id, issued_at)] = snapshot
+
+    @classmethod
+    def invalidate(cls, mb_id: str) -> None:
+        """회원의 캐시를 모두 삭제합니다."""
+        if cls._cache is None:
+            return
+        with cls._lock:
+            for key in [key for key in cls._cache.keys() if key[0] == mb_id]:
+                cls._cache.pop(key, None)
+
+
 def get_member_level(request: Request) -> int:
     """request에서 회원 레벨 정보를 가져오는 함수"""
     member: Member = request.state.login_member
@@ -1,8 +1,17 @@
+import asyncio
 import hashlib
 import os
 import base64
 import hmac
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from math import ceil
+from typing import Callable, Dict, TypeVar
+
+from core.settings import settings
+
+T = TypeVar("T")
 
 # Constants
 PBKDF2_COMPAT_HASH_ALGORITHM = 'SHA256'
@@ -42,8 +51,12 @@ def needs_upgrade(hash):
     params = hash.split(':')
     if len(params) < 4:
         return True
-    
-    # You can add more conditions to check if the hash needs an upgrade
+
+    # 현재 설정보다 약한 알고리즘/반복 횟수로 생성된 해시
+    if params[0].lower() != PBKDF2_COMPAT_HASH_ALGORITHM.lower():
+        return True
+    if not params[1].isdigit() or int(params[1]) < PBKDF2_COMPAT_ITERATIONS:
+        return True
     return False
 
 def pbkdf2_default(algo, password, salt, count, key_length):
@@ -63,6 +76,12 @@ def pbkdf2_default(algo, password, salt, count, key_length):
         else:
             raise ValueError('PBKDF2 ERROR: Hash algorithm not supported.')
     
+    # hashlib.pbkdf2_hmac은 C로 구현되어 있고, 계산하는 동안 GIL을 해제합니다.
+    try:
+        return hashlib.pbkdf2_hmac(algo, password.encode(), salt, count, key_length)
+    except ValueError:
+        pass
+
     hash_length = len(hashlib.new(algo).digest())
     block_count = ceil(key_length / hash_length)
     
@@ -101,4 +120,72 @@ def pbkdf2_fallback(password, salt, count, key_length):
             xorsum = bytes(x ^ y for x, y in zip(xorsum, last))
         output += xorsum
     
-    return output[:key_length]
\ No newline at end of file
+    return output[:key_length]
+
+
+class PasswordHashExecutor:
+    """
+    비밀번호 해시 계산 전용 스레드 풀
+    - 해시 계산이 이벤트 루프와 FastAPI의 기본 스레드 풀을 점유하지 않도록
+      PASSWORD_HASH_WORKERS 크기의 별도 스레드 풀에서 실행합니다.
+    - 대기/실행 중인 작업 수와 대기 시간을 기록합니다. (get_stats)
+    """
+    _executor: ThreadPoolExecutor = None
+    _lock = threading.Lock()
+    _stats: Dict[str, float] = {
+        "queued": 0,  # 대기 중인 작업 수
+        "running": 0,  # 실행 중인 작업 수
+        "completed": 0,  # 완료된 작업 수
+        "total_wait_time": 0.0,  # 누적 대기 시간 (초)
+        "max_wait_time": 0.0,  # 최대 대기 시간 (초)
+    }
+
+    @classmethod
+    def get_executor(cls) -> ThreadPoolExecutor:
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(
+                    max_workers=max(1, settings.PASSWORD_HASH_WORKERS),
+                    thread_name_prefix="password-hash"
+                )
+            return cls._executor
+
+    @classmethod
+    async def run(cls, func: Callable[..., T], *args) -> T:
+        """스레드 풀에서 함수를 실행하고 결과를 반환합니다."""
+        queued_at = time.monotonic()
+        with cls._lock:
+            cls._stats["queued"] += 1
+
+        def _run() -> T:
+            wait_time = time.monotonic() - queued_at
+            with cls._lock:
+                cls._stats["queued"] -= 1
+                cls._stats["running"] += 1
+                cls._stats["total_wait_time"] += wait_time
+                cls._stats["max_wait_time"] = max(cls._stats["max_wait_time"], wait_time)
+            try:
+                return func(*args)
+            finally:
+                with cls._lock:
+                    cls._stats["running"] -= 1
+                    cls._stats["completed"] += 1
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(cls.get_executor(), _run)
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, float]:
+        """스레드 풀의 작업 현황을 반환합니다."""
+        with cls._lock:
+            return dict(cls._stats)
+
+
+async def async_create_hash(password: str) -> str:
+    """create_hash()를 비밀번호 해시 전용 스레드 풀에서 실행합니다."""
+    return await PasswordHashExecutor.run(create_hash, password)
+
+
+async def async_validate_password(password: str, hash: str) -> bool:
+    """validate_password()를 비밀번호 해시 전용 스레드 풀에서 실행합니다."""
+    return await PasswordHashExecutor.run(validate_password, password, hash)
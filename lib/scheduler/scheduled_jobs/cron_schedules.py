@@ -1,4 +1,6 @@
 from lib.common import delete_old_records
+from service.point_service import PointBalanceService
+from service.visit_rollup_service import VisitRollupService
 
 
 cron_jobs = [
@@ -7,6 +9,21 @@ cron_jobs = [
         'job_func': delete_old_records,
         'expression': {'hour': 5, 'minute': 30, 'second': 0}
     },
+    {
+        'job_id': 'cron_point_expire',
+        'job_func': PointBalanceService.expire_points,
+        'expression': {'hour': 0, 'minute': 5, 'second': 0}
+    },
+    {
+        'job_id': 'cron_point_reconcile',
+        'job_func': PointBalanceService.reconcile,
+        'expression': {'hour': 5, 'minute': 40, 'second': 0}
+    },
+    {
+        'job_id': 'cron_visit_rollup_backfill',
+        'job_func': VisitRollupService.backfill,
+        'expression': {'hour': 5, 'minute': 50, 'second': 0}
+    },
 ]
 
 
@@ -0,0 +1,301 @@
+"""서버 세션 저장소와 세션 미들웨어를 제공하는 모듈입니다.
+- SESSION_BACKEND 설정에 따라 세션 데이터를 저장할 위치를 선택합니다.
+  - cookie: 세션 데이터를 서명된 쿠키에 저장 (Starlette SessionMiddleware)
+  - memory: 프로세스 메모리 (워커가 하나일 때만 사용)
+  - sqlite: 같은 서버의 워커들이 공유하는 SQLite 파일
+- 서버 저장소를 사용하면 쿠키에는 서명된 세션 ID만 저장합니다.
+"""
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Dict, Optional, Tuple, Type
+
+from cachetools import TLRUCache
+from fastapi import Request
+from itsdangerous import BadSignature, TimestampSigner
+from starlette.datastructures import MutableHeaders
+from starlette.requests import HTTPConnection
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from core.settings import settings
+
+SESSION_MAX_AGE = 60 * 60 * 3  # 단위: 초
+# 세션 표시(add_session_mark)의 종류별 최대 개수
+# 쿠키 세션은 세션 데이터 전체가 쿠키(최대 4KB)에 저장되므로 적게 유지합니다.
+# (표시 하나에 약 6~10바이트, 종류 3개를 모두 채워도 4KB를 넘지 않는 개수)
+SESSION_MARK_MAX_COUNT = 500
+COOKIE_SESSION_MARK_MAX_COUNT = 100
+
+SessionEntry = Tuple[dict, float]  # (세션 데이터, 만료 시각)
+
+
+class SessionStore(ABC):
+    """
+    세션 저장소 기본 클래스
+    - 저장소별 클래스는 get, set, delete를 구현합니다.
+    """
+
+    @abstractmethod
+    def get(self, session_id: str) -> Optional[SessionEntry]:
+        """세션 데이터와 만료 시각을 반환합니다. 없거나 만료되었으면 None"""
+
+    @abstractmethod
+    def set(self, session_id: str, data: dict, max_age: int) -> None:
+        """세션 데이터를 저장합니다."""
+
+    @abstractmethod
+    def delete(self, session_id: str) -> None:
+        """세션 데이터를 삭제합니다."""
+
+
+class MemorySessionStore(SessionStore):
+    """
+    프로세스 메모리 세션 저장소
+    - 워커(프로세스)마다 따로 저장되므로 워커가 여러 개일 때는 sqlite를 사용해야 합니다.
+    - 세션마다 저장할 때 전달된 max_age가 지나면 삭제됩니다.
+    """
+
+    def __init__(self, maxsize: int = 100000):
+        self._sessions = TLRUCache(maxsize=maxsize, ttu=lambda _key, value, _now: value[1], timer=time.time)
+        self._lock = threading.Lock()
+
+    def get(self, session_id: str) -> Optional[SessionEntry]:
+        with self._lock:
+            entry = self._sessions.get(session_id)
+        if entry is None or entry[1] <= time.time():
+            return None
+        return json.loads(entry[0]), entry[1]
+
+    def set(self, session_id: str, data: dict, max_age: int) -> None:
+        with self._lock:
+            self._sessions[session_id] = (json.dumps(data), time.time() + max_age)
+
+    def delete(self, session_id: str) -> None:
+        with self._lock:
+            self._sessions.pop(session_id, None)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    SQLite 파일 세션 저장소
+    - 같은 서버의 여러 워커가 하나의 저장소를 공유합니다.
+    - 스레드마다 별도의 커넥션을 사용합니다.
+    - 만료된 세션은 CLEANUP_INTERVAL(초)마다 한번씩 삭제합니다.
+    """
+    CLEANUP_INTERVAL = 60 * 10  # 단위: 초
+
+    def __init__(self, path: str = None):
+        self._path = path or settings.SESSION_SQLITE_PATH
+        self._local = threading.local()
+        self._cleaned_at = 0.0
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("CREATE TABLE IF NOT EXISTS session"
+                         " (id TEXT PRIMARY KEY, data TEXT NOT NULL, expires_at REAL NOT NULL)")
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self._path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, session_id: str) -> Optional[SessionEntry]:
+        row = self._connect().execute(
+            "SELECT data, expires_at FROM session WHERE id = ? AND expires_at > ?", (session_id, time.time())
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), row[1]
+
+    def set(self, session_id: str, data: dict, max_age: int) -> None:
+        now = time.time()
+        conn = self._connect()
+        conn.execute("INSERT OR REPLACE INTO session (id, data, expires_at) VALUES (?, ?, ?)",
+                     (session_id, json.dumps(data), now + max_age))
+        if now - self._cleaned_at > self.CLEANUP_INTERVAL:
+            self._cleaned_at = now
+            conn.execute("DELETE FROM session WHERE expires_at <= ?", (now,))
+
+    def delete(self, session_id: str) -> None:
+        self._connect().execute("DELETE FROM session WHERE id = ?", (session_id,))
+
+
+# 세션 저장소 종류
+# 다른 저장소를 사용하려면 session_stores에 추가 후 SESSION_BACKEND에 이름을 설정합니다.
+session_stores: Dict[str, Type[SessionStore]] = {
+    "memory": MemorySessionStore,
+    "sqlite": SQLiteSessionStore,
+}
+
+
+def get_session_store() -> Optional[SessionStore]:
+    """SESSION_BACKEND 설정에 맞는 세션 저장소를 반환합니다. (cookie이면 None)"""
+    backend = session_stores.get(settings.SESSION_BACKEND)
+    return backend() if backend else None
+
+
+class ServerSessionMiddleware:
+    """
+    서버 저장소 세션 미들웨어
+    - Starlette SessionMiddleware와 같이 request.session을 사용할 수 있습니다.
+    - 쿠키에는 서명된 세션 ID만 저장하고, 세션 데이터는 저장소에 저장합니다.
+    - 세션 데이터가 변경되었거나 만료 시간이 절반 이상 지났을 때만 저장소에 저장합니다.
+    - regenerate_session()이 호출된 요청은 기존 세션 ID를 삭제하고 새 세션 ID를 발급합니다.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        store: SessionStore,
+        secret_key: str,
+        session_cookie: str = "session",
+        max_age: int = SESSION_MAX_AGE,
+        path: str = "/",
+        same_site: str = "lax",
+        https_only: bool = False,
+    ) -> None:
+        self.app = app
+        self.store = store
+        self.signer = TimestampSigner(str(secret_key))
+        self.session_cookie = session_cookie
+        self.max_age = max_age
+        self.path = path
+        self.security_flags = "httponly; samesite=" + same_site
+        if https_only:
+            self.security_flags += "; secure"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        connection = HTTPConnection(scope)
+        session_id = None
+        initial_data = "{}"
+        expires_at = 0.0
+        scope["session"] = {}
+        scope["session_regenerate"] = False
+
+        if self.session_cookie in connection.cookies:
+            try:
+                signed_id = connection.cookies[self.session_cookie].encode("utf-8")
+                session_id = self.signer.unsign(signed_id, max_age=self.max_age).decode("utf-8")
+            except BadSignature:
+                session_id = None
+            if session_id:
+                entry = self.store.get(session_id)
+                if entry is not None:
+                    scope["session"], expires_at = entry
+                    initial_data = json.dumps(scope["session"], sort_keys=True)
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal session_id
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if scope["session"]:
+                    changed = json.dumps(scope["session"], sort_keys=True) != initial_data
+                    should_refresh = expires_at - time.time() < self.max_age / 2
+                    if session_id and scope["session_regenerate"]:
+                        # 세션 고정 공격을 막기 위해 로그인/로그아웃 시 세션 ID를 교체합니다.
+                        self.store.delete(session_id)
+                        session_id = None
+                        changed = True
+                    if session_id is None:
+                        session_id = secrets.token_urlsafe(32)
+                    if changed or should_refresh:
+                        self.store.set(session_id, scope["session"], self.max_age)
+                    signed_id = self.signer.sign(session_id).decode("utf-8")
+                    headers.append("Set-Cookie", (
+                        f"{self.session_cookie}={signed_id}; path={self.path}; "
+                        f"Max-Age={self.max_age}; {self.security_flags}"
+                    ))
+                elif session_id:
+                    # 세션이 비워진 경우 (로그아웃 등) 저장소와 쿠키를 삭제합니다.
+                    self.store.delete(session_id)
+                    headers.append("Set-Cookie", (
+                        f"{self.session_cookie}=null; path={self.path}; "
+                        f"expires=Thu, 01 Jan 1970 00:00:00 GMT; {self.security_flags}"
+                    ))
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+
+
+def regenerate_session(request: Request) -> None:
+    """응답을 보낼 때 새 세션 ID를 발급하도록 표시합니다.
+    - 로그인, 로그아웃 등 권한이 바뀌는 시점에 호출합니다.
+    - 쿠키 세션은 세션 ID가 없으므로 아무 동작도 하지 않습니다.
+
+    Args:
+        request (Request): Request 객체
+    """
+    if "session_regenerate" in request.scope:
+        request.scope["session_regenerate"] = True
+
+
+def _get_session_marks(request: Request, name: str) -> Dict[str, str]:
+    """세션에 기록된 표시를 {접두어: "대상1,대상2"} 형태로 반환합니다. 만료되었으면 빈 dict"""
+    marks = request.session.get(name)
+    if not isinstance(marks, dict) or marks.get("expires_at", 0) <= time.time():
+        return {}
+    return dict(marks.get("keys") or {})
+
+
+def has_session_mark(request: Request, name: str, key: str) -> bool:
+    """세션에 기록된 표시(이미 읽은 글, 다운로드한 파일 등)가 있는지 확인합니다.
+
+    Args:
+        request (Request): Request 객체
+        name (str): 표시 종류 (예: ss_view)
+        key (str): 표시 대상 (예: {bo_table}:{wr_id})
+    """
+    prefix, _, target = key.partition(":")
+    targets = _get_session_marks(request, name).get(prefix)
+    return targets is not None and target in targets.split(",")
+
+
+def add_session_mark(request: Request, name: str, key: str,
+                     max_age: int = SESSION_MAX_AGE, max_count: int = None) -> None:
+    """세션에 표시를 기록합니다.
+    - 쿠키 세션에서도 크기가 작도록 표시 종류마다 하나의 세션 키에
+      {"expires_at": 만료 시각, "keys": {접두어(bo_table): "대상1,대상2"}} 형태로 모아서 저장합니다.
+    - 만료 시각은 표시 종류 단위이며, 표시를 기록할 때마다 max_age만큼 연장됩니다.
+    - max_count를 넘으면 오래된 표시부터 삭제합니다.
+    - max_count를 지정하지 않으면 쿠키 세션은 COOKIE_SESSION_MARK_MAX_COUNT,
+      서버 저장소 세션은 SESSION_MARK_MAX_COUNT를 사용합니다.
+
+    Args:
+        request (Request): Request 객체
+        name (str): 표시 종류 (예: ss_view)
+        key (str): 표시 대상 (예: {bo_table}:{wr_id})
+        max_age (int, optional): 표시 유지 시간(초). Defaults to SESSION_MAX_AGE.
+        max_count (int, optional): 최대 표시 개수. Defaults to None.
+    """
+    if max_count is None:
+        if settings.SESSION_BACKEND in session_stores:
+            max_count = SESSION_MARK_MAX_COUNT
+        else:
+            max_count = COOKIE_SESSION_MARK_MAX_COUNT
+    marks = _get_session_marks(request, name)
+    prefix, _, target = key.partition(":")
+    # 최근에 기록한 접두어와 대상이 뒤에 오도록 정렬
+    targets = [t for t in marks.pop(prefix).split(",") if t != target] if prefix in marks else []
+    marks[prefix] = ",".join(targets + [target])
+
+    excess = sum(len(targets.split(",")) for targets in marks.values()) - max_count
+    while excess > 0:
+        oldest_prefix = next(iter(marks))
+        oldest_targets = marks[oldest_prefix].split(",")
+        if len(oldest_targets) <= excess:
+            del marks[oldest_prefix]
+        else:
+            marks[oldest_prefix] = ",".join(oldest_targets[excess:])
+        excess -= len(oldest_targets)
+    request.session[name] = {"expires_at": int(time.time()) + max_age, "keys": marks}
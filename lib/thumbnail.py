@@ -0,0 +1,189 @@
+"""섬네일 이미지 생성 작업을 관리하는 모듈입니다.
+- 섬네일은 요청을 처리하는 중에 만들지 않고 별도의 프로세스 풀에서 생성합니다.
+- 생성이 끝나지 않은 섬네일은 대체 이미지(placeholder)를 반환합니다.
+- 생성된 섬네일 경로는 manifest(프로세스 메모리)에 기록하여
+  목록을 출력할 때마다 파일 정보를 다시 확인하지 않습니다.
+"""
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterable, List, Optional, Tuple
+
+from cachetools import LRUCache
+
+from core.models import Board
+from core.settings import settings
+from lib.common import thumbnail
+
+# 섬네일이 없을 때 사용하는 원본 이미지
+PLACEHOLDER_SOURCE_FILE = "./static/img/dummy-donotremove.png"
+PLACEHOLDER_TARGET_PATH = "./data/thumbnail_tmp"
+
+ThumbnailKey = Tuple[str, int, int, tuple]  # (원본 파일, 너비, 높이, 나머지 섬네일 생성 인자)
+
+# 현재 렌더링 중에 생성 대기 중인 섬네일 목록 (ThumbnailManager.collect_pending)
+_pending_served: ContextVar[Optional[List[ThumbnailKey]]] = ContextVar("thumbnail_pending_served", default=None)
+
+
+class ThumbnailManager:
+    """
+    섬네일 생성 관리 클래스
+    - THUMBNAIL_WORKERS 설정이 0이면 기존과 같이 요청 중에 섬네일을 생성합니다.
+    """
+    _executor: Optional[ProcessPoolExecutor] = None
+    # (원본 파일, 너비, 높이, 나머지 섬네일 생성 인자) => 섬네일 파일 경로
+    _manifest: LRUCache = LRUCache(maxsize=20000)
+    # 생성 중인 섬네일
+    _pending = set()
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_executor(cls) -> ProcessPoolExecutor:
+        """섬네일 생성 프로세스 풀을 반환합니다."""
+        with cls._lock:
+            if cls._executor is None:
+                cls._executor = ProcessPoolExecutor(max_workers=settings.THUMBNAIL_WORKERS)
+            return cls._executor
+
+    @classmethod
+    def shutdown(cls) -> None:
+        """섬네일 생성 프로세스 풀을 종료합니다. (서버 종료)
+        - 대기 중인 작업은 취소하며, 취소된 섬네일은 다음 요청에서 다시 생성합니다.
+        """
+        with cls._lock:
+            executor, cls._executor = cls._executor, None
+            cls._pending.clear()
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    @classmethod
+    def get(cls, source_file: str, width: int, height: int, **kwargs) -> str:
+        """섬네일 파일 경로를 반환합니다.
+        - 섬네일이 아직 생성되지 않았으면 생성 작업을 등록하고 대체 이미지 경로를 반환합니다.
+
+        Args:
+            source_file (str): 원본 이미지 파일 경로
+            width (int): 섬네일 너비
+            height (int): 섬네일 높이
+
+        Returns:
+            str: 섬네일 또는 대체 이미지 파일 경로
+        """
+        if settings.THUMBNAIL_WORKERS <= 0:
+            return thumbnail(source_file, width=width, height=height, **kwargs)
+
+        key = cls.make_key(source_file, width, height, kwargs)
+        thumbnail_file = cls._get_manifest(key)
+        if thumbnail_file is not None:
+            return thumbnail_file
+
+        # 이미 생성된 섬네일이 있으면 manifest에 기록 (이미지마다 한번만 확인)
+        thumbnail_file = cls.get_thumbnail_path(source_file, width, height, kwargs.get("target_path"))
+        try:
+            if os.path.getmtime(source_file) < os.path.getmtime(thumbnail_file):
+                cls._set_manifest(key, thumbnail_file)
+                return thumbnail_file
+        except OSError:
+            pass
+
+        cls.schedule(source_file, width, height, **kwargs)
+        pending = _pending_served.get()
+        if pending is not None:
+            pending.append(key)
+        return cls.get_placeholder(width, height)
+
+    @staticmethod
+    def make_key(source_file: str, width: int, height: int, kwargs: dict = None) -> ThumbnailKey:
+        """manifest 키를 반환합니다. 생성 인자가 다르면 다른 섬네일로 구분합니다."""
+        return source_file, width, height, tuple(sorted((kwargs or {}).items()))
+
+    @classmethod
+    @contextmanager
+    def collect_pending(cls):
+        """블록 안에서 생성 대기 중이어서 대체 이미지를 반환한 섬네일 목록을 수집합니다.
+        - 렌더링 결과를 캐시할 때 대체 이미지가 포함되었는지 확인하는 용도입니다.
+        """
+        pending: List[ThumbnailKey] = []
+        token = _pending_served.set(pending)
+        try:
+            yield pending
+        finally:
+            _pending_served.reset(token)
+
+    @classmethod
+    def get_placeholder(cls, width: int, height: int) -> str:
+        """대체 이미지의 섬네일 경로를 반환합니다."""
+        key = cls.make_key(PLACEHOLDER_SOURCE_FILE, width, height)
+        thumbnail_file = cls._get_manifest(key)
+        if thumbnail_file is None:
+            # 대체 이미지는 작은 이미지이므로 바로 생성합니다.
+            thumbnail_file = thumbnail(PLACEHOLDER_SOURCE_FILE, target_path=PLACEHOLDER_TARGET_PATH,
+                                       width=width, height=height)
+            if thumbnail_file:
+                cls._set_manifest(key, thumbnail_file)
+        return thumbnail_file
+
+    @classmethod
+    def schedule(cls, source_file: str, width: int, height: int, **kwargs) -> None:
+        """섬네일 생성 작업을 프로세스 풀에 등록합니다."""
+        key = cls.make_key(source_file, width, height, kwargs)
+        with cls._lock:
+            if key in cls._pending:
+                return
+            cls._pending.add(key)
+
+        try:
+            future = cls.get_executor().submit(thumbnail, source_file, width=width, height=height, **kwargs)
+        except RuntimeError:
+            # 프로세스 풀이 비정상 종료(BrokenProcessPool)된 경우 다음 요청에서 새로 생성
+            with cls._lock:
+                cls._executor = None
+                cls._pending.discard(key)
+            return
+        future.add_done_callback(lambda f: cls._on_done(key, f))
+
+    @classmethod
+    def _on_done(cls, key: ThumbnailKey, future: Future) -> None:
+        with cls._lock:
+            cls._pending.discard(key)
+        if future.cancelled() or future.exception():
+            return
+        # 섬네일 생성에 실패한 경우(빈 문자열)도 기록하여 다시 생성하지 않습니다.
+        cls._set_manifest(key, future.result())
+
+    @classmethod
+    def _get_manifest(cls, key: ThumbnailKey) -> Optional[str]:
+        with cls._lock:
+            return cls._manifest.get(key)
+
+    @classmethod
+    def _set_manifest(cls, key: ThumbnailKey, thumbnail_file: str) -> None:
+        with cls._lock:
+            cls._manifest[key] = thumbnail_file
+
+    @classmethod
+    def precompute(cls, board: Board, source_files: Iterable[str]) -> None:
+        """게시판에 설정된 갤러리 이미지 크기(PC, 모바일)의 섬네일을 미리 생성합니다.
+
+        Args:
+            board (Board): 게시판
+            source_files (Iterable[str]): 업로드된 이미지 파일 경로 목록
+        """
+        if settings.THUMBNAIL_WORKERS <= 0:
+            return
+
+        sizes = {
+            (board.bo_gallery_width or 200, board.bo_gallery_height or 150),
+            (board.bo_mobile_gallery_width or 200, board.bo_mobile_gallery_height or 150),
+        }
+        for source_file in source_files:
+            for width, height in sizes:
+                cls.schedule(source_file, width, height)
+
+    @staticmethod
+    def get_thumbnail_path(source_file: str, width: int, height: int, target_path: str = None) -> str:
+        """섬네일 파일 경로를 반환합니다. (lib.common.thumbnail 과 같은 규칙)"""
+        target_path = target_path or os.path.dirname(source_file)
+        return os.path.join(target_path, f"thumbnail_{width}x{height}_{os.path.basename(source_file)}")
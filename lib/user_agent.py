@@ -0,0 +1,153 @@
+"""User-Agent 헤더를 분류하고 결과를 캐시하는 모듈입니다."""
+import re
+import threading
+from typing import Dict, NamedTuple
+
+from cachetools import LRUCache
+from user_agents import parse
+
+from core.settings import settings
+
+
+class UserAgentInfo(NamedTuple):
+    """User-Agent 분류 결과"""
+    is_mobile: bool  # 모바일 또는 태블릿
+    browser: str  # 브라우저 (ua-parser 기준, 예: Chrome Mobile)
+    os: str  # OS (ua-parser 기준, 예: Windows)
+    device: str  # 접속기기 (pc, mobile, tablet, unknown)
+    browser_name: str  # 접속자집계용 브라우저 이름 (get_browser)
+    os_name: str  # 접속자집계용 OS 이름 (get_os)
+
+
+class UserAgentClassifier:
+    """
+    User-Agent 분류 클래스
+    - ua-parser의 정규식 분류는 느리므로 User-Agent 문자열별 분류 결과를
+      USER_AGENT_CACHE_SIZE 크기의 LRU 캐시에 저장합니다.
+    - 서로 다른 User-Agent의 수는 요청 수에 비해 매우 적으므로 대부분 캐시에서 반환됩니다.
+    - 긴 User-Agent로 캐시가 커지지 않도록 MAX_LENGTH 글자까지만 사용합니다.
+    - 캐시 적중/미적중 횟수를 기록합니다. (get_stats)
+    """
+    MAX_LENGTH = 512
+    _cache: LRUCache = None
+    _lock = threading.Lock()
+    _stats: Dict[str, int] = {
+        "hits": 0,  # 캐시 적중 횟수
+        "misses": 0,  # 캐시 미적중(새로 분류한) 횟수
+    }
+
+    @classmethod
+    def get_cache(cls) -> LRUCache:
+        if cls._cache is None:
+            cls._cache = LRUCache(maxsize=max(1, settings.USER_AGENT_CACHE_SIZE))
+        return cls._cache
+
+    @classmethod
+    def classify(cls, user_agent: str) -> UserAgentInfo:
+        """User-Agent 문자열의 분류 결과를 반환합니다."""
+        user_agent = (user_agent or "")[:cls.MAX_LENGTH]
+        with cls._lock:
+            info = cls.get_cache().get(user_agent)
+            if info is not None:
+                cls._stats["hits"] += 1
+                return info
+            cls._stats["misses"] += 1
+
+        # 분류는 잠금 밖에서 실행 (같은 User-Agent가 동시에 분류될 수 있지만 결과는 같음)
+        info = cls._parse(user_agent)
+        with cls._lock:
+            cls.get_cache()[user_agent] = info
+        return info
+
+    @staticmethod
+    def _parse(user_agent: str) -> UserAgentInfo:
+        ua = parse(user_agent)
+        device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
+        return UserAgentInfo(
+            is_mobile=ua.is_mobile or ua.is_tablet,
+            browser=getattr(ua.browser, 'family', 'unknown'),
+            os=getattr(ua.os, 'family', 'unknown'),
+            device=device,
+            browser_name=match_browser(user_agent),
+            os_name=match_os(user_agent),
+        )
+
+    @classmethod
+    def get_stats(cls) -> Dict[str, int]:
+        """캐시 적중/미적중 횟수와 캐시 크기를 반환합니다."""
+        with cls._lock:
+            cache = cls.get_cache()
+            return {**cls._stats, "size": cache.currsize, "maxsize": cache.maxsize}
+
+
+def classify_user_agent(user_agent: str) -> UserAgentInfo:
+    """User-Agent 문자열의 분류 결과를 반환합니다. (캐시 사용)"""
+    return UserAgentClassifier.classify(user_agent)
+
+
+def get_browser(user_agent: str) -> str:
+    """접속자집계용 브라우저이름을 반환합니다. (캐시 사용)"""
+    return UserAgentClassifier.classify(user_agent).browser_name
+
+
+def get_os(user_agent: str) -> str:
+    """접속자집계용 OS 이름을 반환합니다. (캐시 사용)"""
+    return UserAgentClassifier.classify(user_agent).os_name
+
+
+def match_browser(user_agent: str) -> str:
+    """브라우저이름을 반환합니다.
+    """
+    user_agent = user_agent.lower()
+
+    browsers = {
+        'Chrome': r"chrome",
+        'FireFox': r"firefox",
+        'Safari': r"safari",
+        'Opera': r"opera",
+        'MSIE': r"msie ([1-9][0-9]\.[0-9]+)",
+        'Mozilla': r"mozilla",
+        'Robot': r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook",
+        'IE': r"internet explorer"
+    }
+
+    for browser_name, pattern in browsers.items():
+        if re.search(pattern, user_agent):
+            return browser_name
+
+    return "other"  # todo 다국어
+
+
+def match_os(user_agent: str) -> str:
+    """OS 이름을 반환합니다."""
+    user_agent = user_agent.lower()
+
+    os_patterns = {
+        "Android": r"android",
+        "IOS": r"IOS",
+        "iPad OS": r"iPad",
+        "Phone": r"phone",
+        "Windows10": r"windows nt 10\.0",
+        "Windows8.1": r"windows nt 6\.3",
+        "Windows8": r"windows nt 6\.2",
+        "Windows7": r"windows nt 6\.1",
+        "Vista": r"windows nt 6\.0",
+        "XP": r"windows nt 5\.1",
+        "2003": r"windows nt 5\.2",
+        "NT": r"windows nt 4\.[0-9]*",
+        "CE": r"windows ce",
+        "MAC": r"mac",
+        "Robot": r"bot|Yeti|Baidu|Daumoa|Yandex|slurp|facebook ",
+        "Linux": r"linux",
+        "Solrais": r"solrais",
+        "IE": r"internet explorer",
+        "Mozilla": r"mozilla",
+        "IRIX": r"irix"
+    }
+
+    # Iterate through the patterns and return the first matching OS
+    for os_name, pattern in os_patterns.items():
+        if re.search(pattern, user_agent):
+            return os_name
+
+    return "other"
@@ -0,0 +1,85 @@
+"""금지단어(cf_filter), 금지 아이디/메일 도메인 목록을 확인하는 모듈입니다."""
+from collections import deque
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from cachetools import LRUCache, cached
+
+WordMatch = Tuple[int, str]  # (내용에서 단어가 시작하는 위치, 단어)
+
+
+class WordFilter:
+    """
+    여러 단어를 한번에 찾는 Aho-Corasick 오토마톤
+    - 단어 목록으로 한번만 만들어 두면, 내용의 길이에 비례하는 시간으로
+      모든 단어의 위치를 찾을 수 있습니다. (단어 수와 무관)
+    """
+
+    def __init__(self, words: Iterable[str]):
+        # 상태별 다음 상태, 실패 시 이동할 상태, 상태에서 끝나는 단어 목록
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[str, ...]] = [()]
+
+        for word in dict.fromkeys(words):
+            if word:
+                self._add_word(word)
+        self._build()
+
+    def _add_word(self, word: str) -> None:
+        state = 0
+        for char in word:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto[state][char] = next_state
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = next_state
+        self._output[state] += (word,)
+
+    def _build(self) -> None:
+        """너비 우선으로 실패 상태를 계산하고, 실패 상태의 단어 목록을 합칩니다."""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[next_state] = self._goto[fail].get(char, 0)
+                self._output[next_state] += self._output[self._fail[next_state]]
+
+    def _scan(self, text: str):
+        goto, fail, output = self._goto, self._fail, self._output
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for word in output[state]:
+                yield position - len(word) + 1, word
+
+    def find_all(self, text: str) -> List[WordMatch]:
+        """내용에 포함된 모든 단어와 위치를 반환합니다. (위치 순)"""
+        return sorted(self._scan(text))
+
+    def search(self, text: str) -> Optional[WordMatch]:
+        """내용에서 처음 발견된 단어와 위치를 반환합니다. 없으면 None"""
+        return next(self._scan(text), None)
+
+
+@cached(LRUCache(maxsize=16))
+def get_word_filter(word_list: str, separator: str = ",") -> WordFilter:
+    """단어 목록 문자열에 대한 WordFilter를 반환합니다.
+    - 목록 문자열이 같으면 만들어 둔 WordFilter를 재사용하므로
+      기본환경설정이 변경되었을 때만 새로 만들어집니다.
+    """
+    return WordFilter(word.strip() for word in word_list.split(separator))
+
+
+@cached(LRUCache(maxsize=16))
+def get_word_set(word_list: str, separator: str = ",") -> FrozenSet[str]:
+    """단어 목록 문자열을 소문자 단어 집합으로 반환합니다. (일치 여부 확인용)"""
+    return frozenset(word.strip().lower() for word in word_list.split(separator) if word.strip())
@@ -1,3 +1,4 @@
+import asyncio
 import os
 import re
 from contextlib import asynccontextmanager
@@ -10,10 +11,9 @@ from sqlalchemy import delete, insert, select
 from sqlalchemy.exc import ProgrammingError
 from starlette.staticfiles import StaticFiles
 
-from core import models
 from core.database import DBConnect
 from core.exception import AlertException, regist_core_exception_handler, template_response
-from core.middleware import regist_core_middleware, should_run_middleware
+from core.middleware import is_api_request, regist_core_middleware, should_run_middleware
 from core.plugin import (
     cache_plugin_menu, cache_plugin_state, get_plugin_state_change_time,
     import_plugin_by_states, read_plugin_state, register_plugin,
@@ -21,17 +21,22 @@ from core.plugin import (
 )
 from core.routers import router as template_router
 from core.settings import ENV_PATH, settings
-from core.template import register_theme_statics
+from core.template import UserTemplates, register_theme_statics
 from lib.common import (
     get_client_ip, is_intercept_ip, is_possible_ip, session_member_key
 )
+from lib.config_cache import ConfigCache
 from lib.dependency.dependencies import check_use_template
+from lib.mail import MailOutbox
 from lib.member import is_super_admin
 from lib.scheduler import scheduler
+from lib.session import regenerate_session
+from lib.thumbnail import ThumbnailManager
 from lib.token import create_session_token
+from service.counter_service import CounterService
 from service.member_service import MemberService
 from service.point_service import PointService
-from service.visit_service import VisitService
+from service.visit_service import VisitRecorder, VisitService
 
 from admin.admin import router as admin_router
 from install.router import router as install_router
@@ -51,7 +56,27 @@ async def lifespan(app: FastAPI):
     - yield 이전의 코드: 서버가 시작될 때 실행
     - yield 이후의 코드: 서버가 종료될 때 실행
     """
+    if settings.USE_TEMPLATE and settings.TEMPLATE_WARMUP:
+        # 요청을 받기 전에 템플릿을 미리 컴파일
+        await asyncio.to_thread(UserTemplates().warm_up)
+
+    if settings.VISIT_FLUSH_INTERVAL > 0:
+        # 방문자 접속 이력 기록은 워커마다 실행
+        scheduler.background_scheduler.add_job(
+            VisitRecorder.flush, trigger="interval", seconds=settings.VISIT_FLUSH_INTERVAL,
+            id="visit_recorder_flush", replace_existing=True
+        )
+    if settings.COUNTER_FLUSH_INTERVAL > 0:
+        # 조회수, 다운로드 횟수 기록은 워커마다 실행
+        scheduler.background_scheduler.add_job(
+            CounterService.flush, trigger="interval", seconds=settings.COUNTER_FLUSH_INTERVAL,
+            id="counter_service_flush", replace_existing=True
+        )
     yield
+    VisitRecorder.flush()
+    CounterService.flush()
+    MailOutbox.shutdown()
+    ThumbnailManager.shutdown()
     scheduler.remove_flag()
 
 app = FastAPI(
@@ -94,6 +119,9 @@ async def main_middleware(request: Request, call_next):
     if not await should_run_middleware(request):
         return await call_next(request)
 
+    if is_api_request(request):
+        return await api_middleware(request, call_next)
+
     # 데이터베이스 설치여부 체크
     with DBConnect().sessionLocal() as db:
         url_path = request.url.path
@@ -103,8 +131,8 @@ async def main_middleware(request: Request, call_next):
             if not url_path.startswith("/install"):
                 if not os.path.exists(ENV_PATH):
                     raise AlertException(".env 파일이 없습니다. 설치를 진행해 주세요.", 400, "/install")
-                # 기본환경설정 테이블 조회
-                config = db.scalar(select(models.Config))
+                # 기본환경설정 조회 (캐시)
+                config = ConfigCache.get(db)
             else:
                 return await call_next(request)
 
@@ -160,6 +188,7 @@ async def main_middleware(request: Request, call_next):
                     # 쿠키에 저장된 키와 서버에서 생성한 키가 일치하는지 검사
                     ss_mb_key = session_member_key(request, member)
                     if request.cookies.get("ck_auto") == ss_mb_key:
+                        regenerate_session(request)
                         request.session["ss_mb_id"] = cookie_mb_id
                         is_autologin = True
         except AlertException as e:
@@ -213,11 +242,50 @@ async def main_middleware(request: Request, call_next):
         if ck_visit_ip != current_ip:
             response.set_cookie(key="ck_visit_ip", value=current_ip,
                                 max_age=age_1day, domain=cookie_domain)
-            visit_service = VisitService(request, db)
-            visit_service.create_visit_record()
+            if settings.VISIT_FLUSH_INTERVAL > 0:
+                # 접속 이력은 모아서 주기적으로 기록
+                VisitRecorder.record(request)
+            else:
+                visit_service = VisitService(request, db)
+                visit_service.create_visit_record()
 
     return response
 
+
+async def api_middleware(request: Request, call_next):
+    """
+    API 요청(/api/...)에 실행되는 미들웨어
+    - 세션 로그인, 자동로그인, 첫 로그인 포인트, 방문자 기록 등 웹 페이지용 처리를 하지 않습니다.
+    - 회원 인증은 API의 JWT 의존성 함수에서 처리하므로 로그인 회원 정보는 설정하지 않습니다.
+    """
+    try:
+        with DBConnect().sessionLocal() as db:
+            # 기본환경설정 조회 (캐시된 설정이 유효하면 DB에 접속하지 않습니다.)
+            config = ConfigCache.get(db)
+    except ProgrammingError:
+        config = None
+    if config is None:
+        return JSONResponse(status_code=503,
+                            content={"detail": "DB 테이블 또는 설정정보가 존재하지 않습니다."})
+
+    request.state.config = config
+    request.state.title = config.cf_title
+    request.state.editor = config.cf_editor
+    request.state.use_editor = True if config.cf_editor else False
+    request.state.cookie_domain = settings.COOKIE_DOMAIN
+    request.state.login_member = None
+    request.state.is_super_admin = False
+
+    # 접근가능/차단 IP 체크
+    current_ip = get_client_ip(request)
+    if not is_possible_ip(request, current_ip):
+        return JSONResponse(status_code=403, content={"detail": "접근이 허용되지 않은 IP 입니다."})
+    if is_intercept_ip(request, current_ip):
+        return JSONResponse(status_code=403, content={"detail": "접근이 차단된 IP 입니다."})
+
+    return await call_next(request)
+
+
 # 기본 실행할 미들웨어를 추가하는 함수
 # 함수는 반드시 main_middleware 함수의 아래에 위치해야 합니다.
 # 그렇지 않으면 아래와 같은 오류를 만날 수 있습니다.
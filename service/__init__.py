@@ -1,5 +1,10 @@
 """서비스 클래스에서 필요한 기능을 제공하는 모듈입니다."""
 import abc
+from typing import Any, Callable, Optional
+
+from fastapi import Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 
 
 class BaseService(metaclass=abc.ABCMeta):
@@ -15,3 +20,43 @@ class BaseService(metaclass=abc.ABCMeta):
             status_code (int): HTTP 상태 코드를 나타내는 정수입니다.
             detail (str, optional): 예외 상황에 대한 추가적인 설명을 제공하는 문자열입니다. Defaults to None.
         """
+
+
+class AsyncReadMixin:
+    """
+    비동기 엔진(AsyncSession)으로 서비스의 조회 로직을 실행하는 Mixin 클래스입니다.
+    - .env 파일의 DB_ASYNC 설정이 True인 경우 서비스의 self.db는
+      AsyncSession.sync_session이 되며, 모든 데이터베이스 작업은
+      AsyncSession.run_sync()를 통해 이벤트 루프를 막지 않고 실행됩니다.
+    - 비동기 엔진을 사용하지 않으면 기존처럼 동기 세션으로 실행합니다.
+    """
+    async_db: Optional[AsyncSession] = None
+
+    @classmethod
+    async def create(cls, async_db: Optional[AsyncSession], request: Request, db: Session, *args):
+        """서비스 인스턴스를 생성합니다.
+
+        Args:
+            async_db (Optional[AsyncSession]): 비동기 세션 (비동기 엔진 미사용시 None)
+            request (Request): FastAPI의 Request 객체
+            db (Session): 동기 세션
+            *args: 서비스 생성자의 나머지 인자
+
+        Returns:
+            서비스 인스턴스
+        """
+        if async_db is None:
+            return cls(request, db, *args)
+
+        instance = await async_db.run_sync(lambda session: cls(request, session, *args))
+        instance.async_db = async_db
+        return instance
+
+    async def run(self, func: Callable, *args, **kwargs) -> Any:
+        """서비스의 데이터베이스 작업을 실행합니다.
+        - 비동기 엔진을 사용하는 경우 run_sync()로 실행합니다.
+        """
+        if self.async_db is None:
+            return func(*args, **kwargs)
+
+        return await self.async_db.run_sync(lambda _: func(*args, **kwargs))
@@ -9,15 +9,17 @@ from core.models import Board, WriteBaseModel, Group, AutoSave
 from core.exception import AlertException
 from core.formclass import WriteForm
 from lib.board_lib import (
-    BoardConfig, FileCache, is_owner, is_write_delay, send_write_mail
+    BoardConfig, is_owner, is_write_delay, send_write_mail
 )
+from lib.cache import get_cache
 from lib.member import MemberDetails
 from lib.common import (
     dynamic_create_write_table, filter_words,
     remove_query_params, set_url_query_params
 )
 from lib.html_sanitizer import content_sanitizer
-from lib.pbkdf2 import create_hash, validate_password
+from lib.pbkdf2 import async_create_hash, async_validate_password
+from lib.thumbnail import ThumbnailManager
 from service import BaseService
 from service.board_file_service import BoardFileService
 from api.v1.models.board import WriteModel
@@ -83,9 +85,10 @@ class BoardService(BaseService, BoardConfig):
         if not self.is_write_level():
             self.raise_exception(detail="글을 작성할 권한이 없습니다.", status_code=403)
 
-    def validate_author(self, write: WriteBaseModel, wr_password: str = None):
+    async def validate_author(self, write: WriteBaseModel, wr_password: str = None):
         """작성자 확인"""
-        if not is_owner(write, self.member.mb_id) and not validate_password(wr_password, write.wr_password):
+        if (not is_owner(write, self.member.mb_id)
+                and not await async_validate_password(wr_password, write.wr_password)):
             self.raise_exception(detail="작성자만 수정/삭제 할 수 있습니다.", status_code=403)
 
     def validate_secret_board(self, secret: str, html: str, mail: str):
@@ -188,7 +191,7 @@ class BoardService(BaseService, BoardConfig):
         """Stored XSS 방지용 데이터 정제"""
         return content_sanitizer.get_cleaned_data(content)
 
-    def arrange_data(self, data: Union[WriteForm, WriteModel], secret: str, html: str, mail: str):
+    async def arrange_data(self, data: Union[WriteForm, WriteModel], secret: str, html: str, mail: str):
         """
         form 또는 body 형태로 들어오는 데이터를 양식에 맞게 정리
           - 항목: ca_name, wr_password, wr_name, wr_email, wr_homepage, wr_option, wr_link1, wr_link2, wr_content
@@ -203,7 +206,7 @@ class BoardService(BaseService, BoardConfig):
         else:
             data.ca_name = ""
         self.validate_wr_password(data.wr_password)
-        data.wr_password = create_hash(data.wr_password) if data.wr_password else ""
+        data.wr_password = await async_create_hash(data.wr_password) if data.wr_password else ""
         data.wr_name = self.set_wr_name(self.member, data.wr_name)
         data.wr_email = getattr(self.member, "mb_email", data.wr_email)
         data.wr_homepage = getattr(self.member, "mb_homepage", data.wr_homepage)
@@ -236,7 +239,7 @@ class BoardService(BaseService, BoardConfig):
 
     def delete_cache(self):
         """최신글 캐시 삭제"""
-        FileCache().delete_prefix(f"latest-{self.bo_table}")
+        get_cache().delete_tag(f"latest-{self.bo_table}")
     
     def delete_auto_save(self, uid: str):
         """자동저장 글 삭제"""
@@ -278,6 +281,7 @@ class BoardService(BaseService, BoardConfig):
 
         # 파일 업로드 처리 및 파일정보 저장
         exclude_file = {"size": [], "ext": []}
+        uploaded_images = []
         for file in file_list:
             index = file_list.index(file)
 
@@ -307,6 +311,12 @@ class BoardService(BaseService, BoardConfig):
                                                         directory, filename, file, bf_content)
                     wr_file += 1
 
+                if file.filename.split(".")[-1].lower() in self.config.cf_image_extension:
+                    uploaded_images.append(f"{directory}/{filename}")
+
+        # 업로드된 이미지의 목록 섬네일을 미리 생성
+        ThumbnailManager.precompute(self.board, uploaded_images)
+
         # exclude_file이 존재하면 파일 업로드 실패 메시지 출력
         msg = ""
         if exclude_file.get("size"):
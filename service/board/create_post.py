@@ -6,8 +6,10 @@ from sqlalchemy import select, update
 from core.database import db_session
 from core.models import WriteBaseModel, BoardNew, BoardGood, Scrap
 from core.formclass import WriteForm
-from lib.board_lib import FileCache, get_next_num, generate_reply_character
+from lib.board_lib import delete_content_cache, get_next_num, generate_reply_character
+from lib.cache import get_cache
 from lib.common import cut_name, dynamic_create_write_table
+from lib.fulltext import delete_search_index, update_search_index
 from lib.dependency.dependencies import (
     validate_captcha as lib_validate_captcha, get_variety_bo_table
 )
@@ -67,6 +69,7 @@ class CreatePostService(BoardService):
 
         write.wr_parent = write.wr_id  # 부모아이디 설정
         self.board.bo_count_write = self.board.bo_count_write + 1  # 게시판 글 갯수 1 증가
+        update_search_index(self.db, self.write_model, [write])
         self.db.commit()
         return write
 
@@ -118,7 +121,6 @@ class MoveUpdateService(BoardService):
         origin_bo_table = self.bo_table
 
         # 게시글 복사/이동 작업 반복
-        file_cache = FileCache()
         for target_bo_table in target_bo_tables:
             for origin_write in origin_writes:
                 target_write_model = dynamic_create_write_table(target_bo_table)
@@ -157,6 +159,7 @@ class MoveUpdateService(BoardService):
                 self.db.commit()
                 # 부모아이디 설정
                 target_write.wr_parent = target_write.wr_id
+                update_search_index(self.db, target_write_model, [target_write])
                 self.db.commit()
 
                 if self.sw == WriteTransportation.MOVE.value:
@@ -181,8 +184,11 @@ class MoveUpdateService(BoardService):
                             .values(bo_table=target_bo_table, wr_id=target_write.wr_id)
                         )
                     # 기존 데이터 삭제
+                    origin_wr_id = origin_write.wr_id
                     self.db.delete(origin_write)
+                    delete_search_index(self.db, self.write_model, [origin_wr_id])
                     self.db.commit()
+                    delete_content_cache(origin_bo_table, [origin_wr_id])
 
                 # 파일이 존재할 경우
                 if self.file_service.is_exist(origin_board.bo_table, origin_write.wr_id):
@@ -195,7 +201,7 @@ class MoveUpdateService(BoardService):
                                                            origin_bo_table, origin_write.wr_id,
                                                            target_bo_table, target_write.wr_id)
             # 최신글 캐시 삭제
-            file_cache.delete_prefix(f'latest-{target_bo_table}')
+            get_cache().delete_tag(f'latest-{target_bo_table}')
 
         # 원본 게시판 최신글 캐시 삭제
-        file_cache.delete_prefix(f'latest-{origin_bo_table}')
+        get_cache().delete_tag(f'latest-{origin_bo_table}')
@@ -5,8 +5,10 @@ from sqlalchemy import select, exists, delete, update
 
 from core.database import db_session
 from core.models import Member, BoardNew, Scrap, WriteBaseModel
-from lib.board_lib import is_owner, FileCache
+from lib.board_lib import delete_content_cache, is_owner
+from lib.cache import get_cache
 from lib.common import remove_query_params, set_url_query_params
+from lib.fulltext import delete_search_index
 from service.board_file_service import BoardFileService
 from service.point_service import PointService
 from .board import BoardService
@@ -122,6 +124,7 @@ class DeletePostService(BoardService):
                 delete_comment_count += 1
 
         # 원글+댓글 삭제
+        delete_wr_ids = [write.wr_id for write in writes]
         db.execute(delete(write_model).filter_by(wr_parent=self.wr_id))
 
         # 최근 게시물 삭제
@@ -143,11 +146,13 @@ class DeletePostService(BoardService):
         board.bo_count_write -= delete_write_count
         board.bo_count_comment -= delete_comment_count
 
+        delete_search_index(db, write_model, delete_wr_ids)
         db.commit()
         db.close()
 
-        # 최신글 캐시 삭제
-        FileCache().delete_prefix(f'latest-{bo_table}')
+        # 최신글, 본문 변환 캐시 삭제
+        get_cache().delete_tag(f'latest-{bo_table}')
+        delete_content_cache(bo_table, [self.wr_id])
 
 
 class DeleteCommentService(DeletePostService):
@@ -223,6 +228,7 @@ class DeleteCommentService(DeletePostService):
         write_model= self.write_model
 
         # 댓글 삭제
+        comment_id = self.comment.wr_id
         self.db.delete(self.comment)
 
         # 게시글에 댓글 수 감소
@@ -231,6 +237,7 @@ class DeleteCommentService(DeletePostService):
             .where(write_model.wr_id == self.comment.wr_parent)
         )
 
+        delete_search_index(self.db, write_model, [comment_id])
         self.db.commit()
 
 
@@ -270,6 +277,7 @@ class ListDeleteService(BoardService):
             select(write_model)
             .where(write_model.wr_id.in_(wr_ids))
         ).all()
+        delete_wr_ids = [write.wr_id for write in writes]
         for write in writes:
             self.db.delete(write)
             # 원글 포인트 삭제
@@ -281,9 +289,11 @@ class ListDeleteService(BoardService):
             self.file_service.delete_board_files(self.board.bo_table, write.wr_id)
 
             # TODO: 댓글 삭제
+        delete_search_index(self.db, write_model, delete_wr_ids)
         self.db.commit()
 
-        # 최신글 캐시 삭제
-        FileCache().delete_prefix(f'latest-{self.bo_table}')
+        # 최신글, 본문 변환 캐시 삭제
+        get_cache().delete_tag(f'latest-{self.bo_table}')
+        delete_content_cache(self.bo_table, delete_wr_ids)
 
         # TODO: 게시글 삭제시 같이 삭제해야할 것들 추가
@@ -1,17 +1,28 @@
-from typing_extensions import Annotated, List
+import base64
+import binascii
+import json
+
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from typing_extensions import Annotated, Dict, List, Optional, Tuple
 from fastapi import Request, Path, Depends
-from sqlalchemy import asc, desc, func, select
+from sqlalchemy import and_, asc, desc, func, or_, select
 
-from core.database import db_session
+from core.database import async_db_session, db_session
 from core.models import WriteBaseModel
 from lib.dependency.dependencies import common_search_query_params
 from lib.board_lib import get_list_thumbnail, write_search_filter, get_list, cut_name, is_owner
 from service.board_file_service import BoardFileService
+from service.counter_service import CounterService
+from service import AsyncReadMixin
 from service.ajax import AJAXService
 from . import BoardService
 
+# 게시글 수 캐시 (게시판, 게시글 수, 검색조건별)
+total_count_cache = TTLCache(maxsize=1024, ttl=10)
+
 
-class ListPostService(BoardService):
+class ListPostService(AsyncReadMixin, BoardService):
     """
     게시글 목록 클래스
     """
@@ -28,22 +39,29 @@ class ListPostService(BoardService):
         if not self.is_list_level():
             self.raise_exception(detail="목록을 볼 권한이 없습니다.", status_code=403)
 
+        self.search_query = None  # 검색 단위(spt)를 적용하기 전의 검색 쿼리
+        self.spt = None
+        self.prev_spt = None
+        self.next_spt = None
+        self.prev_cursor = None
+        self.next_cursor = None
         self.query = self.get_query(search_params)
+        # 게시글과 같은 세션으로 파일 정보를 조회하도록 설정
+        file_service.db = db
         self.file_service = file_service
         self.search_params = search_params
-        self.prev_spt = None
-        self.next_spt = None
 
     @classmethod
     async def async_init(
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         bo_table: Annotated[str, Path(..., title="게시판 테이블명", description="게시판 테이블명")],
         file_service: Annotated[BoardFileService, Depends()],
         search_params: Annotated[dict, Depends(common_search_query_params)],
     ):
-        instance = cls(request, db, bo_table, file_service, search_params)
+        instance = await cls.create(async_db, request, db, bo_table, file_service, search_params)
         return instance
 
     def get_query(self, search_params: dict) -> select:
@@ -75,27 +93,38 @@ class ListPostService(BoardService):
             self.query = self.get_list_sort_query(self.write_model, self.query)
 
         if (sca or (sfl and stx)):  # 검색일 경우
-            search_part = int(self.config.cf_search_part) or 10000
-            min_spt = self.db.scalar(
-                select(func.coalesce(func.min(self.write_model.wr_num), 0)))
-            spt = int(self.request.query_params.get("spt", min_spt))
-            self.prev_spt = spt - search_part if spt > min_spt else None
-            self.next_spt = spt + search_part if spt + search_part < 0 else None
-
-            # wr_num 컬럼을 기준으로 검색단위를 구분합니다. (wr_num은 음수)
-            self.query = self.query.where(self.write_model.wr_num.between(spt, spt + search_part))
-
-            # 검색 내용에 댓글이 잡히는 경우 부모 글을 가져오기 위해 wr_parent를 불러오는 subquery를 이용합니다.
-            subquery = select(self.query.add_columns(self.write_model.wr_parent).distinct().order_by(None).subquery().alias("subquery"))
-            self.query = select().where(self.write_model.wr_id.in_(subquery))
+            self.search_query = self.query
+            spt = self.request.query_params.get("spt")
+            self.query = self.get_search_part_query(int(spt) if spt is not None else None)
         else:   # 검색이 아닌 경우
             self.query = self.query.where(self.write_model.wr_is_comment == 0)
 
         return self.query
 
+    def get_search_part_query(self, spt: Optional[int] = None) -> select:
+        """검색 단위(spt)의 검색 쿼리를 반환합니다.
+        - wr_num 컬럼을 기준으로 cf_search_part개씩 나누어 검색합니다. (wr_num은 음수)
+        - self.spt, self.prev_spt, self.next_spt 가 설정됩니다.
+
+        Args:
+            spt (Optional[int], optional): 검색 단위의 시작 wr_num. None이면 첫 검색 단위. Defaults to None.
+        """
+        search_part = int(self.config.cf_search_part) or 10000
+        min_spt = self.db.scalar(
+            select(func.coalesce(func.min(self.write_model.wr_num), 0)))
+        spt = min_spt if spt is None else spt
+        self.spt = spt
+        self.prev_spt = spt - search_part if spt > min_spt else None
+        self.next_spt = spt + search_part if spt + search_part < 0 else None
+
+        query = self.search_query.where(self.write_model.wr_num.between(spt, spt + search_part))
+
+        # 검색 내용에 댓글이 잡히는 경우 부모 글을 가져오기 위해 wr_parent를 불러오는 subquery를 이용합니다.
+        subquery = select(query.add_columns(self.write_model.wr_parent).distinct().order_by(None).subquery().alias("subquery"))
+        return select().where(self.write_model.wr_id.in_(subquery))
+
     def get_writes(self, with_files=False, page=1, per_page=None) -> List[WriteBaseModel]:
         """게시글 목록을 가져옵니다."""
-        ajax_service = AJAXService(self.request, self.db)
         current_page = page
         if per_page:
             page_rows = per_page        # 페이지당 게시글 수를 별도 설정
@@ -112,19 +141,118 @@ class ListPostService(BoardService):
 
         total_count = self.get_total_count()
 
+        return self.set_writes_info(writes, with_files, total_count - offset)
+
+    def get_writes_by_cursor(self, cursor: str = None, with_files=False, per_page=None) -> List[WriteBaseModel]:
+        """cursor(wr_num, wr_reply)를 기준으로 게시글 목록을 가져옵니다.
+        - OFFSET 없이 idx_wr_num_reply 인덱스를 이용하므로 페이지가 깊어져도 조회 속도가 일정합니다.
+        - 조회 후 self.next_cursor, self.prev_cursor 에 이전/다음 목록의 cursor가 설정됩니다.
+        - 검색 목록은 cursor에 검색 단위(spt)를 함께 저장합니다.
+          검색 단위의 마지막 목록이면 cursor는 이전/다음 검색 단위로 이어지므로,
+          검색 단위 경계의 목록은 page_rows보다 적을 수 있습니다.
+        """
+        if not self.is_cursor_available():
+            self.raise_exception(detail="정렬 조건이 지정된 목록은 cursor를 사용할 수 없습니다.", status_code=400)
+
+        page_rows = per_page or self.page_rows
+        direction, wr_num, wr_reply, spt = "next", None, None, None
+        if cursor:
+            try:
+                direction, wr_num, wr_reply, spt = decode_cursor(cursor)
+            except ValueError:
+                self.raise_exception(detail="올바르지 않은 cursor 입니다.", status_code=400)
+        if self.search_query is not None and spt is not None and spt != self.spt:
+            self.query = self.get_search_part_query(spt)
+
+        writes, has_more = self._fetch_writes_by_cursor(direction, wr_num, wr_reply, page_rows)
+        # 검색 단위에 조회할 게시글이 없으면 이어지는 검색 단위에서 조회합니다.
+        while not writes and self.search_query is not None:
+            part_spt = self.next_spt if direction == "next" else self.prev_spt
+            if part_spt is None:
+                break
+            self.query = self.get_search_part_query(part_spt)
+            writes, has_more = self._fetch_writes_by_cursor(direction, wr_num, wr_reply, page_rows)
+
+        has_next = has_more if direction == "next" else True
+        has_prev = has_more if direction == "prev" else bool(cursor)
+        if writes:
+            # 검색 단위의 마지막 목록이면 이전/다음 검색 단위로 이어지는 cursor를 만듭니다.
+            # (wr_num, wr_reply 조건은 검색 단위와 관계없이 같은 순서이므로 그대로 사용)
+            first, last = writes[0], writes[-1]
+            next_spt = self.spt if has_next else self.next_spt
+            prev_spt = self.spt if has_prev else self.prev_spt
+            if has_next or next_spt is not None:
+                self.next_cursor = encode_cursor("next", last.wr_num, last.wr_reply, next_spt)
+            if has_prev or prev_spt is not None:
+                self.prev_cursor = encode_cursor("prev", first.wr_num, first.wr_reply, prev_spt)
+
+        return self.set_writes_info(writes, with_files)
+
+    def _fetch_writes_by_cursor(self, direction: str, wr_num: Optional[int], wr_reply: Optional[str],
+                                page_rows: int) -> Tuple[List[WriteBaseModel], bool]:
+        """cursor 위치부터 page_rows개의 게시글과 더 조회할 게시글이 있는지 여부를 반환합니다."""
+        model = self.write_model
+        query = self.query.add_columns(model).order_by(None)
+        if direction == "prev":
+            if wr_num is not None:
+                query = query.where(or_(
+                    model.wr_num < wr_num,
+                    and_(model.wr_num == wr_num, model.wr_reply < wr_reply)
+                ))
+            query = query.order_by(model.wr_num.desc(), model.wr_reply.desc())
+        else:
+            if wr_num is not None:
+                query = query.where(or_(
+                    model.wr_num > wr_num,
+                    and_(model.wr_num == wr_num, model.wr_reply > wr_reply)
+                ))
+            query = query.order_by(model.wr_num, model.wr_reply)
+
+        # 다음 목록이 있는지 확인하기 위해 1건을 더 조회합니다.
+        writes = list(self.db.scalars(query.limit(page_rows + 1)).all())
+        has_more = len(writes) > page_rows
+        writes = writes[:page_rows]
+        if direction == "prev":
+            writes.reverse()
+        return writes, has_more
+
+    def is_cursor_available(self) -> bool:
+        """cursor 기반 목록 조회가 가능한지 확인합니다.
+        - 기본 정렬(wr_num, wr_reply)인 경우에만 사용할 수 있습니다.
+        """
+        sst = self.search_params.get('sst')
+        return not (sst and hasattr(self.write_model, sst)) and not self.board.bo_sort_field
+
+    def set_writes_info(self, writes: List[WriteBaseModel], with_files=False, start_num: int = None) -> List[WriteBaseModel]:
+        """게시글 목록 출력에 필요한 정보를 설정합니다.
+        - 댓글, 첨부파일, 추천/비추천 정보는 게시글마다 조회하지 않고 한번에 조회합니다.
+
+        Args:
+            writes (List[WriteBaseModel]): 게시글 목록
+            with_files (bool, optional): 첨부파일 목록 포함 여부. Defaults to False.
+            start_num (int, optional): 첫번째 게시글의 번호. None이면 번호를 설정하지 않습니다.
+        """
+        ajax_service = AJAXService(self.request, self.db)
+
+        # 목록에 필요한 댓글, 첨부파일, 추천/비추천 정보를 한번에 조회
+        wr_ids = [write.wr_id for write in writes]
+        comments_map = self.get_comments_map(wr_ids)
+        files_map = self.file_service.get_board_files_map(self.bo_table, wr_ids)
+        good_data_map = ajax_service.get_ajax_good_data_map(self.bo_table, wr_ids)
+
+        # 아직 기록되지 않은 조회수 반영
+        CounterService.apply_pending_hits(self.bo_table, writes)
+
         # 게시글 정보 수정
-        for write in writes:
-            write.num = total_count - offset - writes.index(write)
-            write = get_list(self.request, self.db, write, self)
-
-            # 댓글 정보를 불러와서 write에 추가합니다.
-            comments: List[WriteBaseModel] = self.db.scalars(
-            select(self.write_model).filter_by(
-                    wr_parent=write.wr_id,
-                    wr_is_comment=1
-                ).order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
-            ).all()
+        for index, write in enumerate(writes):
+            board_files = files_map.get(write.wr_id, [])
+            images, normal_files = self.file_service.split_files_by_type(board_files)
+
+            write.num = start_num - index if start_num is not None else None
+            write = get_list(self.request, self.db, write, self, has_file=bool(board_files))
 
+            # 댓글 정보를 write에 추가합니다.
+            comments = comments_map.get(write.wr_id, [])
             for comment in comments:
                 comment.name = cut_name(self.request, comment.wr_name)
                 comment.ip = self.get_display_ip(comment.wr_ip)
@@ -138,12 +266,12 @@ class ListPostService(BoardService):
                 comment.mb_icon_path = self.get_member_icon_path(comment.mb_id)
 
                 # 비밀댓글 처리
+                # 댓글의 부모글은 현재 게시글(write)이므로 다시 조회하지 않습니다.
                 session_secret_comment_name = f"ss_secret_comment_{self.bo_table}_{comment.wr_id}"
-                parent_write = self.db.get(self.write_model, comment.wr_parent)
                 if (comment.is_secret
                         and not self.member.admin_type
                         and not is_owner(comment, self.member.mb_id)
-                        and not is_owner(parent_write, self.member.mb_id)
+                        and not is_owner(write, self.member.mb_id)
                         and not self.request.session.get(session_secret_comment_name)):
                     comment.is_secret_content = True
                     comment.save_content = "비밀글 입니다."
@@ -154,22 +282,50 @@ class ListPostService(BoardService):
 
             # 게시글 목록 조회시 첨부된 파일을 함께 가져올 경우, default는 False
             if with_files:
-                write.images, write.normal_files = self.file_service.get_board_files_by_type(self.bo_table, write.wr_id)
+                write.images, write.normal_files = images, normal_files
 
             # 회원 이미지, 아이콘 경로 설정
             write.mb_image_path = self.get_member_image_path(write.mb_id)
             write.mb_icon_path = self.get_member_icon_path(write.mb_id)
 
             # 게시글 좋아요/싫어요 정보 설정
-            ajax_good_data = ajax_service.get_ajax_good_data(self.bo_table, write)
+            ajax_good_data = good_data_map[write.wr_id]
             write.good = ajax_good_data["good"]
             write.nogood = ajax_good_data["nogood"]
 
             # 게시글 썸네일 설정
-            write.thumbnail = get_list_thumbnail(self.request, self.board, write, self.gallery_width, self.gallery_height)
+            write.thumbnail = get_list_thumbnail(self.request, self.board, write,
+                                                 self.gallery_width, self.gallery_height,
+                                                 images=images)
 
         return writes
 
+    def get_comments_map(self, wr_ids: List[int]) -> Dict[int, List[WriteBaseModel]]:
+        """여러 게시글의 댓글 목록을 한번에 조회합니다.
+
+        Args:
+            wr_ids (List[int]): 게시글 아이디 목록
+
+        Returns:
+            Dict[int, List[WriteBaseModel]]: 게시글 아이디별 댓글 목록
+        """
+        comments_map = {wr_id: [] for wr_id in wr_ids}
+        if not wr_ids:
+            return comments_map
+
+        comments = self.db.scalars(
+            select(self.write_model)
+            .where(
+                self.write_model.wr_parent.in_(wr_ids),
+                self.write_model.wr_is_comment == 1
+            )
+            .order_by(self.write_model.wr_comment, self.write_model.wr_comment_reply)
+        ).all()
+        for comment in comments:
+            comments_map[comment.wr_parent].append(comment)
+
+        return comments_map
+
     def get_notice_writes(self) -> List[WriteBaseModel]:
         """게시글 중 공지사항 목록을 가져옵니다."""
         current_page = self.search_params.get('current_page')
@@ -184,6 +340,50 @@ class ListPostService(BoardService):
         return notice_writes
 
     def get_total_count(self) -> int:
-        """쿼리문을 통해 불러오는 게시글의 수"""
-        total_count = self.db.scalar(self.query.add_columns(func.count()).order_by(None))
+        """쿼리문을 통해 불러오는 게시글의 수
+        - 게시글 수(bo_count_write)가 변경되지 않았다면 잠시 동안 캐시된 값을 사용합니다.
+        """
+        cache_key = hashkey(
+            self.bo_table, self.board.bo_count_write,
+            self.request.query_params.get("sca"), self.search_params.get('sfl'),
+            self.search_params.get('stx'), self.spt,
+        )
+        total_count = total_count_cache.get(cache_key)
+        if total_count is None:
+            total_count = self.db.scalar(self.query.add_columns(func.count()).order_by(None))
+            total_count_cache[cache_key] = total_count
         return total_count
+
+    def get_approximate_total_count(self) -> int:
+        """게시글의 대략적인 수
+        - 검색/분류 조건이 없으면 COUNT 쿼리 없이 게시판의 게시글 수(bo_count_write)를 사용합니다.
+        """
+        is_search = self.request.query_params.get("sca") or self.search_params.get('stx')
+        if not is_search and self.board.bo_count_write > 0:
+            return self.board.bo_count_write
+        return self.get_total_count()
+
+
+def encode_cursor(direction: str, wr_num: int, wr_reply: str, spt: Optional[int] = None) -> str:
+    """게시글 목록 cursor를 생성합니다. (검색 목록은 검색 단위(spt) 포함)"""
+    data = json.dumps([direction, wr_num, wr_reply, spt], separators=(",", ":"))
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[str, int, str, Optional[int]]:
+    """게시글 목록 cursor를 (방향, wr_num, wr_reply, 검색 단위)로 변환합니다.
+
+    Raises:
+        ValueError: 올바르지 않은 cursor인 경우
+    """
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(cursor + padding))
+        # 검색 단위가 없는 이전 형식의 cursor
+        direction, wr_num, wr_reply, spt = values if len(values) == 4 else [*values, None]
+    except (TypeError, ValueError, binascii.Error) as exc:
+        raise ValueError("Invalid cursor") from exc
+    if (direction not in ("next", "prev") or not isinstance(wr_num, int) or not isinstance(wr_reply, str)
+            or (spt is not None and not isinstance(spt, int))):
+        raise ValueError("Invalid cursor")
+    return direction, wr_num, wr_reply, spt
@@ -3,18 +3,21 @@ from typing_extensions import Annotated, List, Tuple
 from fastapi import Depends, Request, Path
 from sqlalchemy import asc, desc, select, exists
 
-from core.database import db_session
+from core.database import async_db_session, db_session
 from core.models import BoardGood, Scrap, WriteBaseModel, BoardFile, Member
 from core.exception import RedirectException
 from lib.common import set_url_query_params
+from lib.session import add_session_mark, has_session_mark
 from lib.board_lib import is_owner, cut_name
 from lib.template_filters import number_format
 from service.board_file_service import BoardFileService
+from service.counter_service import CounterService
+from service import AsyncReadMixin
 from service.point_service import PointService
 from . import BoardService
 
 
-class ReadPostService(BoardService):
+class ReadPostService(AsyncReadMixin, BoardService):
     """
     게시글 읽기 클래스
     """
@@ -40,8 +43,14 @@ class ReadPostService(BoardService):
         self.write = write
 
         # 파일정보 조회
+        # 게시글과 같은 세션으로 파일 정보를 조회하도록 설정
+        file_service.db = db
         self.images, self.normal_files = file_service.get_board_files_by_type(self.board.bo_table, wr_id)
 
+        # 아직 기록되지 않은 조회수, 다운로드 횟수 반영
+        CounterService.apply_pending_hits(self.bo_table, [write])
+        CounterService.apply_pending_downloads(self.images + self.normal_files)
+
         # TODO: 전체목록보이기 사용 => 게시글 목록 부분을 분리해야함
         self.write_list = None
         # if member_level >= board.bo_list_level and board.bo_use_list_view:
@@ -59,12 +68,13 @@ class ReadPostService(BoardService):
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         file_service: Annotated[BoardFileService, Depends()],
         point_service: Annotated[PointService, Depends()],
         bo_table: Annotated[str, Path(...)],
         wr_id: Annotated[int, Path(...)],
     ):
-        instance = cls(request, db, file_service, point_service, bo_table, wr_id)
+        instance = await cls.create(async_db, request, db, file_service, point_service, bo_table, wr_id)
         return instance
 
     def block_read_comment(self):
@@ -145,20 +155,19 @@ class ReadPostService(BoardService):
                     self.member.mb_id, read_point, f"{self.board.bo_subject} {self.write.wr_id} 글읽기",
                     self.board.bo_table, self.write.wr_id, "읽기")
         # 조회수 증가
-        self.write.wr_hit += 1
-        self.db.commit()
+        CounterService.count_hit(self.db, self.bo_table, self.write)
 
     def validate_repeat_with_session(self):
         """
         게시글 작성자 확인(validate_repeat())과 세션여부를 확인하여
         한번 읽은 게시글은 조회수, 포인트 처리를 하지 않는다.
         """
-        session_name = f"ss_view_{self.bo_table}_{self.wr_id}"
-        if self.request.session.get(session_name):
+        mark_key = f"{self.bo_table}:{self.wr_id}"
+        if has_session_mark(self.request, "ss_view", mark_key):
             return
 
         self.validate_repeat()
-        self.request.session[session_name] = True
+        add_session_mark(self.request, "ss_view", mark_key)
 
     def check_scrap(self):
         """스크랩 여부 확인"""
@@ -324,8 +333,8 @@ class DownloadFileService(BoardService):
 
     def validate_point_session(self, board_file):
         """게시물당 포인트가 한번만 차감되도록 세션 설정"""
-        session_name = f"ss_down_{self.bo_table}_{self.wr_id}"
-        if not self.request.session.get(session_name):
+        mark_key = f"{self.bo_table}:{self.wr_id}"
+        if not has_session_mark(self.request, "ss_down", mark_key):
             # 포인트 검사
             if self.config.cf_use_point:
                 download_point = self.board.bo_download_point
@@ -341,11 +350,11 @@ class DownloadFileService(BoardService):
                         f"{self.board.bo_subject} {self.wr_id} 파일 다운로드", self.bo_table,
                         self.wr_id, "다운로드")
 
-            self.request.session[session_name] = True
+            add_session_mark(self.request, "ss_down", mark_key)
 
-        download_session_name = f"ss_down_{self.bo_table}_{self.wr_id}_{board_file.bf_no}"
-        if not self.request.session.get(download_session_name):
+        download_mark_key = f"{self.bo_table}:{self.wr_id}:{board_file.bf_no}"
+        if not has_session_mark(self.request, "ss_down_file", download_mark_key):
             # 다운로드 횟수 증가
             self.file_service.update_download_count(board_file)
             # 파일 다운로드 세션 설정
-            self.request.session[download_session_name] = True
+            add_session_mark(self.request, "ss_down_file", download_mark_key)
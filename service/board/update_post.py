@@ -5,11 +5,12 @@ from sqlalchemy import update, select, func
 from core.database import db_session
 from core.models import WriteBaseModel
 from core.formclass import WriteForm, WriteCommentForm
-from lib.board_lib import generate_reply_character
+from lib.board_lib import delete_content_cache, generate_reply_character
+from lib.fulltext import update_search_index
 from lib.g5_compatibility import G5Compatibility
 from lib.template_filters import number_format
 from lib.html_sanitizer import content_sanitizer
-from lib.pbkdf2 import create_hash
+from lib.pbkdf2 import async_create_hash
 from api.v1.models.board import WriteModel, CommentModel
 from service.point_service import PointService
 from . import BoardService
@@ -59,7 +60,9 @@ class UpdatePostService(BoardService):
         for field, value in data.__dict__.items():
             if value:
                 setattr(write, field, value)
+        update_search_index(self.db, self.write_model, [write])
         self.db.commit()
+        delete_content_cache(self.bo_table, [write.wr_id])
 
 
 class CommentService(UpdatePostService):
@@ -120,7 +123,7 @@ class CommentService(UpdatePostService):
         if self.wr_id != wr_parent:
             self.raise_exception(detail="작성하려는 대댓글의 댓글이, 부모글의 댓글이 아닙니다.", status_code=403)
 
-    def save_comment(
+    async def save_comment(
             self, data: Union[WriteCommentForm, CommentModel], write: WriteBaseModel
     ) -> WriteBaseModel:
         """댓글을 저장하고 댓글 ORM 객체를 반환"""
@@ -152,7 +155,7 @@ class CommentService(UpdatePostService):
         comment.mb_id = getattr(self.member, "mb_id", "")
         if not comment.mb_id and not data.wr_password:
             self.raise_exception(detail="비회원 댓글 작성 시 비밀번호는 필수입니다.", status_code=403)
-        comment.wr_password = create_hash(data.wr_password) if data.wr_password else ""
+        comment.wr_password = await async_create_hash(data.wr_password) if data.wr_password else ""
         comment.wr_name = self.set_wr_name(self.member, data.wr_name)
         self.validate_anonymous_password(data)
         comment.wr_email = getattr(self.member, "mb_email", "")
@@ -164,6 +167,8 @@ class CommentService(UpdatePostService):
         # 게시글에 댓글 수 증가
         write.wr_comment +=  1
 
+        self.db.flush()  # 댓글 아이디(wr_id) 생성
+        update_search_index(self.db, self.write_model, [comment])
         self.db.commit()
         return comment
 
@@ -1,12 +1,13 @@
 """게시판 파일 관련 기능을 제공하는 서비스 모듈입니다."""
 import os
 import shutil
-from typing import List
+from typing import Dict, List
 from fastapi import Request, UploadFile
 from sqlalchemy import exists, func, insert, select
 
 from core.database import db_session
 from core.models import Board, BoardFile
+from service.counter_service import CounterService
 
 
 class BoardFileService():
@@ -97,6 +98,31 @@ class BoardFileService():
 
         return files
 
+    def get_board_files_map(self, bo_table: str, wr_ids: List[int]) -> Dict[int, List[BoardFile]]:
+        """여러 게시글의 업로드된 파일 목록을 한번에 가져온다.
+
+        Args:
+            bo_table (str): 게시판 테이블명
+            wr_ids (List[int]): 게시글 아이디 목록
+
+        Returns:
+            dict[int, list[BoardFile]]: 게시글 아이디별 파일 목록
+        """
+        files_map = {wr_id: [] for wr_id in wr_ids}
+        if not wr_ids:
+            return files_map
+
+        board_files = self.db.scalars(
+            select(BoardFile).where(
+                BoardFile.bo_table == bo_table,
+                BoardFile.wr_id.in_(wr_ids)
+            ).order_by(BoardFile.wr_id, BoardFile.bf_no)
+        ).all()
+        for file in board_files:
+            files_map.setdefault(file.wr_id, []).append(file)
+
+        return files_map
+
     def get_board_files_by_type(self, bo_table: str, wr_id: int):
         """업로드된 파일 목록을 파일과 이미지로 분리한다.
 
@@ -108,6 +134,15 @@ class BoardFileService():
             list[BoardFile]: 이미지 목록
         """
         board_files = self.get_board_files(bo_table, wr_id)
+        return self.split_files_by_type(board_files)
+
+    def split_files_by_type(self, board_files: List[BoardFile]):
+        """파일 목록을 이미지와 일반 파일로 분리한다.
+
+        Returns:
+            list[BoardFile]: 이미지 목록
+            list[BoardFile]: 파일 목록
+        """
         images = []
         files = []
         for file in board_files:
@@ -195,8 +230,7 @@ class BoardFileService():
         Args:
             board_file (BoardFile): 게시판 파일 인스턴스
         """
-        board_file.bf_download += 1
-        self.db.commit()
+        CounterService.count_download(self.db, board_file)
 
     def move_board_files(self, directory: str,
                          origin_bo_table: str, origin_wr_id: int,
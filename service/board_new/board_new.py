@@ -2,18 +2,20 @@ from datetime import datetime
 from typing_extensions import Annotated, List
 from fastapi import Depends, Request, HTTPException
 from sqlalchemy import func, select, Select
+from sqlalchemy.orm import selectinload
 
 from core.models import Board, BoardNew
-from core.database import db_session
+from core.database import async_db_session, db_session
 from core.exception import AlertException
-from lib.common import dynamic_create_write_table, cut_name, FileCache
+from lib.cache import get_cache
+from lib.common import dynamic_create_write_table, cut_name
 from lib.board_lib import BoardConfig, get_list, get_list_thumbnail
-from service import BaseService
+from service import AsyncReadMixin, BaseService
 from service.board_file_service import BoardFileService
 from service.point_service import PointService
 
 
-class BoardNewService(BaseService):
+class BoardNewService(AsyncReadMixin, BaseService):
     """
     최신 게시글 관리 클래스(최신 게시글 목록 조회 및 삭제 등)
     """
@@ -28,6 +30,8 @@ class BoardNewService(BaseService):
         self.db = db
         self.config = request.state.config
         self.page_rows = self.config.cf_mobile_page_rows if request.state.is_mobile and self.config.cf_mobile_page_rows else self.config.cf_new_rows
+        # 최신글과 같은 세션으로 파일 정보를 조회하도록 설정
+        file_service.db = db
         self.file_service = file_service
         self.point_service = point_service
 
@@ -36,10 +40,11 @@ class BoardNewService(BaseService):
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         file_service: Annotated[BoardFileService, Depends()],
         point_service: Annotated[PointService, Depends()],
     ):
-        instance = cls(request, db, file_service, point_service)
+        instance = await cls.create(async_db, request, db, file_service, point_service)
         return instance
 
     def raise_exception(self, status_code: int, detail: str = None):
@@ -80,7 +85,11 @@ class BoardNewService(BaseService):
     def get_board_news(self, query: Select, offset: int, per_page: int = None) -> List[BoardNew]:
         """최신글 목록 조회"""
         per_page = per_page or self.page_rows
-        board_news = self.db.scalars(query.add_columns(BoardNew).offset(offset).limit(per_page)).all()
+        board_news = self.db.scalars(
+            query.add_columns(BoardNew)
+            .options(selectinload(BoardNew.board).selectinload(Board.group))
+            .offset(offset).limit(per_page)
+        ).all()
         return board_news
 
     def get_total_count(self, query: Select) -> int:
@@ -181,7 +190,7 @@ class BoardNewService(BaseService):
             self.db.delete(new)
 
             # 최신글 캐시 삭제
-            FileCache().delete_prefix(f'latest-{new.bo_table}')
+            get_cache().delete_tag(f'latest-{new.bo_table}')
 
         self.db.commit()
 
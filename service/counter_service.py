@@ -0,0 +1,185 @@
+"""게시글 조회수, 파일 다운로드 횟수를 모아서 기록하는 모듈입니다."""
+import logging
+import threading
+from collections import defaultdict
+from typing import Callable, Dict, Iterable, Tuple
+
+from sqlalchemy import bindparam, inspect, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import set_committed_value
+
+from core.database import DBConnect
+from core.models import BoardFile, WriteBaseModel
+from core.settings import settings
+from lib.common import dynamic_create_write_table
+
+HitKey = Tuple[str, int]  # (bo_table, wr_id)
+DownloadKey = Tuple[str, int, int]  # (bo_table, wr_id, bf_no)
+
+
+class CounterService:
+    """
+    조회수(wr_hit), 다운로드 횟수(bf_download)를 모아서 기록하는 클래스
+    - 요청 중에는 증가량을 메모리에 더하기만 하고,
+      flush()가 주기적으로 호출될 때 `UPDATE ... SET wr_hit = wr_hit + n` 으로 한번에 기록합니다.
+    - 게시글/파일을 출력할 때는 아직 기록되지 않은 증가량을 더해서 보여줍니다.
+    - 워커(프로세스)마다 별도로 동작하므로, 다른 워커의 기록되지 않은 증가량은
+      다음 flush() 이후에 반영됩니다.
+    - COUNTER_FLUSH_INTERVAL 설정이 0이면 기존과 같이 바로 기록합니다.
+    - 기록에 실패하면 다음 flush()에서 다시 기록하고, 테이블이 없거나
+      MAX_RETRIES번 연속으로 실패하면 해당 증가량은 기록하지 않습니다.
+    """
+    MAX_RETRIES = 10
+
+    _hits: Dict[HitKey, int] = defaultdict(int)
+    _downloads: Dict[DownloadKey, int] = defaultdict(int)
+    # 기록 대상(게시판 테이블, 파일 테이블)별 연속 실패 횟수
+    _failures: Dict[str, int] = defaultdict(int)
+    _lock = threading.Lock()
+    _flush_lock = threading.Lock()
+
+    @staticmethod
+    def is_buffered() -> bool:
+        """증가량을 모아서 기록하는지 여부"""
+        return settings.COUNTER_FLUSH_INTERVAL > 0
+
+    @classmethod
+    def count_hit(cls, db: Session, bo_table: str, write: WriteBaseModel) -> None:
+        """게시글 조회수를 1 증가시킵니다."""
+        if not cls.is_buffered():
+            write.wr_hit += 1
+            db.commit()
+            return
+
+        with cls._lock:
+            cls._hits[(bo_table, write.wr_id)] += 1
+        # 출력용 값만 변경 (세션의 변경사항으로 기록되지 않도록 설정)
+        set_committed_value(write, "wr_hit", write.wr_hit + 1)
+
+    @classmethod
+    def count_download(cls, db: Session, board_file: BoardFile) -> None:
+        """파일 다운로드 횟수를 1 증가시킵니다."""
+        if not cls.is_buffered():
+            board_file.bf_download += 1
+            db.commit()
+            return
+
+        with cls._lock:
+            cls._downloads[(board_file.bo_table, board_file.wr_id, board_file.bf_no)] += 1
+        set_committed_value(board_file, "bf_download", board_file.bf_download + 1)
+
+    @classmethod
+    def apply_pending_hits(cls, bo_table: str, writes: Iterable[WriteBaseModel]) -> None:
+        """아직 기록되지 않은 조회수를 게시글 출력값에 더합니다."""
+        if not cls._hits:
+            return
+        with cls._lock:
+            pending = [(write, cls._hits.get((bo_table, write.wr_id), 0)) for write in writes]
+        for write, count in pending:
+            if count:
+                set_committed_value(write, "wr_hit", write.wr_hit + count)
+
+    @classmethod
+    def apply_pending_downloads(cls, board_files: Iterable[BoardFile]) -> None:
+        """아직 기록되지 않은 다운로드 횟수를 파일 출력값에 더합니다."""
+        if not cls._downloads:
+            return
+        with cls._lock:
+            pending = [
+                (board_file, cls._downloads.get((board_file.bo_table, board_file.wr_id, board_file.bf_no), 0))
+                for board_file in board_files
+            ]
+        for board_file, count in pending:
+            if count:
+                set_committed_value(board_file, "bf_download", board_file.bf_download + count)
+
+    @classmethod
+    def flush(cls) -> None:
+        """모아둔 증가량을 데이터베이스에 기록합니다."""
+        with cls._flush_lock:
+            with cls._lock:
+                hits, cls._hits = cls._hits, defaultdict(int)
+                downloads, cls._downloads = cls._downloads, defaultdict(int)
+            if not hits and not downloads:
+                return
+
+            hits_by_table: Dict[str, Dict[HitKey, int]] = defaultdict(dict)
+            for key, count in hits.items():
+                hits_by_table[key[0]][key] = count
+
+            with DBConnect().sessionLocal() as db:
+                for bo_table, table_hits in hits_by_table.items():
+                    table_name = dynamic_create_write_table(bo_table).__tablename__
+                    cls._execute(db, table_name, lambda: cls._update_hits(db, bo_table, table_hits),
+                                 table_hits, cls._hits)
+                if downloads:
+                    cls._execute(db, BoardFile.__tablename__, lambda: cls._update_downloads(db, downloads),
+                                 downloads, cls._downloads)
+
+    @classmethod
+    def _execute(cls, db: Session, table_name: str, update_func: Callable[[], None],
+                 counts: dict, buffer: dict) -> None:
+        """기록에 실패하면 다음 flush()에서 다시 기록하도록 증가량을 되돌립니다.
+        - 게시판이 삭제되어 테이블이 없거나(데이터베이스 종류와 관계없이 확인),
+          MAX_RETRIES번 연속으로 실패하면 다시 기록하지 않습니다.
+        """
+        try:
+            update_func()
+            db.commit()
+        except SQLAlchemyError as exc:
+            db.rollback()
+            with cls._lock:
+                cls._failures[table_name] += 1
+                failures = cls._failures[table_name]
+            if failures >= cls.MAX_RETRIES or not cls._has_table(db, table_name):
+                logging.error("조회수/다운로드 횟수 기록 실패 (%s, %d회, 다시 기록하지 않음): %s",
+                              table_name, failures, exc)
+                with cls._lock:
+                    cls._failures.pop(table_name, None)
+                return
+
+            logging.error("조회수/다운로드 횟수 기록 실패 (%s, %d회): %s", table_name, failures, exc)
+            with cls._lock:
+                for key, count in counts.items():
+                    buffer[key] += count
+        else:
+            if table_name in cls._failures:
+                with cls._lock:
+                    cls._failures.pop(table_name, None)
+
+    @staticmethod
+    def _has_table(db: Session, table_name: str) -> bool:
+        """테이블이 있는지 확인합니다. 확인할 수 없으면(연결 실패 등) 있는 것으로 봅니다."""
+        try:
+            return inspect(db.get_bind()).has_table(table_name)
+        except SQLAlchemyError:
+            return True
+
+    @staticmethod
+    def _update_hits(db: Session, bo_table: str, hits: Dict[HitKey, int]) -> None:
+        table = dynamic_create_write_table(bo_table).__table__
+        db.execute(
+            update(table)
+            .where(table.c.wr_id == bindparam("b_wr_id"))
+            .values(wr_hit=table.c.wr_hit + bindparam("b_count")),
+            # 잠금 순서를 일정하게 유지하기 위해 정렬
+            [{"b_wr_id": key[1], "b_count": count} for key, count in sorted(hits.items())]
+        )
+
+    @staticmethod
+    def _update_downloads(db: Session, downloads: Dict[DownloadKey, int]) -> None:
+        table = BoardFile.__table__
+        db.execute(
+            update(table)
+            .where(
+                table.c.bo_table == bindparam("b_bo_table"),
+                table.c.wr_id == bindparam("b_wr_id"),
+                table.c.bf_no == bindparam("b_bf_no"),
+            )
+            .values(bf_download=table.c.bf_download + bindparam("b_count")),
+            [
+                {"b_bo_table": key[0], "b_wr_id": key[1], "b_bf_no": key[2], "b_count": count}
+                for key, count in sorted(downloads.items())
+            ]
+        )
@@ -3,9 +3,11 @@ import hashlib
 import os
 import re
 import secrets
+import threading
+import time
 from datetime import date, datetime, timedelta
 from glob import glob
-from typing import Optional, Tuple
+from typing import Dict, Optional, Tuple
 from typing_extensions import Annotated
 
 from fastapi import Depends, Request, UploadFile
@@ -16,8 +18,9 @@ from core.database import db_session
 from core.exception import AlertException, JSONException
 from core.models import Member
 from lib.common import filter_words, get_client_ip, is_none_datetime, check_prohibit_words
-from lib.member import get_next_open_date, hide_member_id
-from lib.pbkdf2 import validate_password
+from lib.member import MemberCache, get_next_open_date, hide_member_id
+from lib.pbkdf2 import async_create_hash, async_validate_password, needs_upgrade
+from lib.word_filter import get_word_set
 from service import BaseService
 
 
@@ -70,16 +73,18 @@ class MemberService(BaseService):
                 status_code=404, detail=f"{mb_id} : 회원정보가 없습니다.")
         return member
 
-    def authenticate_member(self, mb_id: str, password: str) -> Member:
+    async def authenticate_member(self, mb_id: str, password: str) -> Member:
         """
         비밀번호를 검증하여 회원 인증을 수행합니다.
         - 회원 정보가 없거나 탈퇴 또는 차단된 회원은 조회할 수 없습니다.
         - 이메일 인증이 완료되지 않은 회원은 조회할 수 없습니다.
+        - 이전 방식으로 생성된 비밀번호 해시는 모든 확인을 통과한 경우에만
+          현재 방식으로 다시 생성하여 저장합니다.
         """
         # 아이디, 비밀번호 중 어떤 것이 틀렸는지 알려주지 않도록 하기 위해
         # self.fetch_member()를 호출하지 않습니다.
         member = self.fetch_member_by_id(mb_id)
-        if not member or not validate_password(password, member.mb_password):
+        if not member or not await async_validate_password(password, member.mb_password):
             self.raise_exception(
                 status_code=403, detail="아이디 또는 비밀번호가 올바르지 않습니다.")
 
@@ -93,6 +98,10 @@ class MemberService(BaseService):
             url = self.request.url_for("certify_email_update_form", mb_id=mb_id, key=key)
             self.raise_exception(status_code=403, detail=message, url=url)
 
+        if needs_upgrade(member.mb_password):
+            member.mb_password = await async_create_hash(password)
+            self.db.commit()
+
         return member
 
     def get_member(self, mb_id: str) -> Member:
@@ -174,6 +183,7 @@ class MemberService(BaseService):
             if hasattr(member, key) and value is not None:
                 setattr(member, key, value)
         self.db.commit()
+        MemberCache.invalidate(member.mb_id)
 
         return member
 
@@ -184,6 +194,7 @@ class MemberService(BaseService):
             .where(Member.mb_id == mb_id)
         )
         self.db.commit()
+        MemberCache.invalidate(mb_id)
 
     def leave_member(self, member: Member):
         """
@@ -194,6 +205,7 @@ class MemberService(BaseService):
         member.mb_leave_date = datetime.now().strftime("%Y%m%d")
         member.mb_memo = f"{member.mb_memo}\n{datetime.now().strftime('%Y-%m-%d')}탈퇴함"
         self.db.commit()
+        MemberCache.invalidate(member.mb_id)
 
     def find_id(self, mb_name: str, mb_email: str) -> Member:
         """
@@ -305,6 +317,67 @@ class MemberService(BaseService):
         return self.db.scalar(query)
 
 
+class MemberImageIndex:
+    """
+    회원 아이콘/이미지 경로 색인
+    - 이미지 디렉토리(아이디 앞 2자리)별로 {회원아이디: 이미지 경로}를 만들어 두고 사용합니다.
+      회원마다 glob, getmtime을 실행하지 않습니다.
+    - 디렉토리의 수정시간이 바뀌면(다른 워커에서 이미지 저장/삭제) 해당 디렉토리만 다시 읽습니다.
+      수정시간은 디렉토리마다 CHECK_INTERVAL(초)에 한번만 확인합니다.
+    - 현재 워커에서 이미지를 저장/삭제하면 invalidate()로 바로 다시 읽도록 합니다.
+    """
+    CHECK_INTERVAL = 1  # 단위: 초
+    # 디렉토리 경로: (디렉토리 수정시간, 확인 시각, {회원아이디: 이미지 경로})
+    _directories: Dict[str, Tuple[int, float, Dict[str, str]]] = {}
+    _lock = threading.Lock()
+
+    @classmethod
+    def get_path(cls, directory: str, mb_id: str) -> Optional[str]:
+        """회원 이미지 경로를 반환합니다. 이미지가 없으면 None"""
+        member_directory = os.path.join(directory, mb_id[:2])
+        entry = cls._directories.get(member_directory)
+        now = time.monotonic()
+        if entry is None or now - entry[1] >= cls.CHECK_INTERVAL:
+            entry = cls._refresh(member_directory, entry, now)
+        return entry[2].get(mb_id)
+
+    @classmethod
+    def invalidate(cls, directory: str, mb_id: str) -> None:
+        """회원 이미지가 있는 디렉토리의 색인을 삭제합니다."""
+        with cls._lock:
+            cls._directories.pop(os.path.join(directory, mb_id[:2]), None)
+
+    @classmethod
+    def _refresh(cls, member_directory: str, entry: Optional[tuple], now: float) -> tuple:
+        try:
+            mtime = os.stat(member_directory).st_mtime_ns
+        except FileNotFoundError:
+            mtime = 0
+        if entry is not None and entry[0] == mtime:
+            entry = (mtime, now, entry[2])
+        else:
+            entry = (mtime, now, cls._scan(member_directory))
+        with cls._lock:
+            cls._directories[member_directory] = entry
+        return entry
+
+    @staticmethod
+    def _scan(member_directory: str) -> Dict[str, str]:
+        """디렉토리의 회원 이미지 경로를 읽습니다. (캐시를 위해 파일 수정시간을 추가)"""
+        paths = {}
+        try:
+            with os.scandir(member_directory) as files:
+                for file in sorted(files, key=lambda f: f.name):
+                    mb_id, dot, _ = file.name.partition(".")
+                    if not dot or mb_id in paths or not file.is_file():
+                        continue
+                    mtime = file.stat().st_mtime
+                    paths[mb_id] = f"/{os.path.join(member_directory, file.name)}?{int(mtime)}"
+        except FileNotFoundError:
+            pass
+        return paths
+
+
 class MemberImageService(BaseService):
     """
     회원 이미지 관련 서비스를 제공하는 종속성 주입 클래스입니다.
@@ -360,13 +433,7 @@ class MemberImageService(BaseService):
         if not mb_id:
             return MemberImageService.NO_IMAGE_PATH
 
-        member_directory = os.path.join(directory, mb_id[:2])
-        image_files = glob(os.path.join(member_directory, f"{mb_id}.*"))
-        if image_files:
-            mtime = os.path.getmtime(image_files[0])  # 캐시를 위해 파일 수정시간을 추가
-            return f"/{image_files[0]}?{int(mtime)}"
-
-        return MemberImageService.NO_IMAGE_PATH
+        return MemberImageIndex.get_path(directory, mb_id) or MemberImageService.NO_IMAGE_PATH
 
     def update_image_file(
             self,
@@ -400,12 +467,15 @@ class MemberImageService(BaseService):
 
             image_obj.save(save_path)
             image_obj.close()
+            MemberImageIndex.invalidate(directory, mb_id)
 
     def _delete_existing_images(self, directory: str, mb_id: str):
         """기존 이미지 파일 삭제 처리"""
         existing_images = glob(os.path.join(directory, f"{mb_id}.*"))
         for image in existing_images:
             os.remove(image)
+        if existing_images:
+            MemberImageIndex.invalidate(os.path.dirname(directory), mb_id)
 
     def _save_image_file(self, file: UploadFile, directory: str, mb_id: str, image_type: str):
         """이미지 파일 저장 처리"""
@@ -419,6 +489,7 @@ class MemberImageService(BaseService):
             # 이미지 저장
             image_obj.save(save_path)
             image_obj.close()
+            MemberImageIndex.invalidate(directory, mb_id)
 
     def _validate_and_open_image(
             self,
@@ -619,8 +690,7 @@ class ValidateMember(BaseService):
 
         cf_prohibit_email = getattr(self.config, "cf_prohibit_email", "")
         if cf_prohibit_email:
-            prohibited_domains = [d.lower().strip() for d in cf_prohibit_email.split('\n')]
-            if domain.lower() in prohibited_domains:
+            if domain.lower() in get_word_set(cf_prohibit_email, "\n"):
                 return True
 
         return False
@@ -11,6 +11,7 @@ from core.database import db_session
 from core.exception import AlertException
 from core.models import Member, Memo
 from lib.common import get_client_ip, is_none_datetime
+from lib.member import MemberCache
 from service import BaseService
 from service.member_service import MemberService
 
@@ -118,6 +119,7 @@ class MemoService(BaseService):
                 .where(Member.mb_id == member.mb_id)
             )
             self.db.commit()
+            MemberCache.invalidate(member.mb_id)
         except SQLAlchemyError as e:
             self.db.rollback()
             self.raise_exception(500, str(e))
@@ -127,6 +129,7 @@ class MemoService(BaseService):
         target.mb_memo_call = member.mb_id
         target.mb_memo_cnt = self.fetch_non_read_memo(target.mb_id)
         self.db.commit()
+        MemberCache.invalidate(target.mb_id)
 
     def send_memo(self, member: Member, target: Member, memo: str) -> Memo:
         """쪽지를 전송합니다."""
@@ -200,6 +203,7 @@ class MemoService(BaseService):
                 if target_member:
                     target_member.mb_memo_call = ''
                     self.db.commit()
+                    MemberCache.invalidate(target_member.mb_id)
         except SQLAlchemyError as e:
             self.db.rollback()
             self.raise_exception(500, str(e))
@@ -1,15 +1,24 @@
-"""포인트 관련 기능을 제공하는 서비스 모듈입니다."""
+"""포인트 관련 기능을 제공하는 서비스 모듈입니다.
+
+회원 포인트 잔액과 포인트 내역 합계 비교:
+    python -m service.point_service [--fix]
+"""
+import argparse
+import logging
 import uuid
+from collections import Counter
 from datetime import datetime, timedelta
-from typing import List
+from typing import List, Tuple
 from typing_extensions import Annotated
 
 from fastapi import Depends, Request
 from sqlalchemy import delete, func, select, update
+from sqlalchemy.orm import Session
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.exception import AlertException
-from core.models import Member, Point
+from core.models import Config, Member, Point
+from lib.member import MemberCache
 from service import BaseService
 from service.member_service import MemberService
 
@@ -97,8 +106,8 @@ class PointService(BaseService):
             po_expired = 1
             po_expire_date = datetime.now()
 
-        mb_point = self.get_total_point(mb_id)
-        po_mb_point = mb_point + point
+        # 회원 포인트 갱신 (포인트 내역 전체를 합산하지 않고 증감분만 반영)
+        po_mb_point = PointBalanceService.add_balance(self.db, mb_id, point)
 
         new_point = Point(
             mb_id=mb_id,
@@ -113,9 +122,8 @@ class PointService(BaseService):
             po_rel_action=rel_action
         )
         self.db.add(new_point)
-
-        # 회원 포인트 갱신
-        self.member_service.update_member_point(mb_id, po_mb_point)
+        self.db.commit()
+        MemberCache.invalidate(mb_id)
 
     def get_config_point(self, cf_name: str) -> int:
         """
@@ -123,26 +131,6 @@ class PointService(BaseService):
         """
         return getattr(self.config, cf_name, 0)
 
-    def get_total_point(self, mb_id: str) -> int:
-        """
-        회원의 포인트 총합
-        """
-        # 만료된 포인트들을 소진 처리
-        expire_point = self._fetch_expire_points(mb_id)
-        if expire_point > 0:
-            self._insert_expire_point(mb_id, expire_point)
-
-        # 만료된 포인트 내역 업데이트
-        self._update_expired_points(mb_id)
-
-        # 포인트 총합
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point))
-            .where(Point.mb_id == mb_id)
-        )
-
-        return int(point_sum) if point_sum else 0
-
     def insert_use_point(self, mb_id: str, point: int, po_id: int = None) -> None:
         """
         사용한 포인트 내역 입력&업데이트
@@ -211,24 +199,23 @@ class PointService(BaseService):
                     Point.po_rel_action == rel_action
                 )
             )
-            self.db.commit()
 
+            # 내역 삭제, po_mb_point 반영, 회원 포인트 갱신을 한번에 commit합니다.
             if delete_result.rowcount > 0:
                 result = True
-
-                # po_mb_point에 반영
                 if row.po_point:
+                    # po_mb_point에 반영
                     self.db.execute(
                         update(Point).values(
                             po_mb_point=Point.po_mb_point - row.po_point
                         )
                         .where(Point.mb_id == mb_id, Point.po_id > row.po_id)
                     )
-                    self.db.commit()
-
-                # 회원 포인트 총합 갱신
-                sum_point = self.get_total_point(mb_id)
-                self.member_service.update_member_point(mb_id, sum_point)
+                    # 회원 포인트 갱신
+                    PointBalanceService.add_balance(self.db, mb_id, -row.po_point)
+            self.db.commit()
+            if result and row.po_point:
+                MemberCache.invalidate(mb_id)
 
         return result
 
@@ -336,61 +323,157 @@ class PointService(BaseService):
                     Point.po_rel_action == rel_action)
         )
 
-    def _fetch_expire_points(self, mb_id: str) -> int:
-        """
-        회원의 만료 예정 포인트 얻기
-        """
-        if self.point_term <= 0:
-            return 0
 
-        point_sum = self.db.scalar(
-            select(func.sum(Point.po_point - Point.po_use_point))
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired == 0,
-                   Point.po_expire_date < datetime.now())
+class PointBalanceService:
+    """
+    회원 포인트 잔액 관리 클래스
+    - 회원 포인트 잔액은 Member.mb_point를 기준으로 하며,
+      포인트가 적립/차감될 때 `mb_point = mb_point + n`으로 증감분만 반영합니다.
+    - 유효기간이 지난 포인트는 포인트를 적립할 때마다 확인하지 않고,
+      예약 작업(expire_points)에서 전체 회원을 한번에 소멸 처리합니다.
+    - reconcile()로 회원 포인트 잔액과 포인트 내역의 합계를 비교합니다.
+    """
+    BATCH_SIZE = 500
+
+    @staticmethod
+    def add_balance(db: Session, mb_id: str, point: int) -> int:
+        """회원 포인트 잔액을 point만큼 증감하고 변경된 잔액을 반환합니다.
+        - commit은 호출한 쪽에서 포인트 내역과 함께 합니다.
+        """
+        db.execute(
+            update(Member).values(mb_point=Member.mb_point + point)
+            .where(Member.mb_id == mb_id)
         )
-
-        return int(point_sum) if point_sum else 0
-
-    def _insert_expire_point(self, mb_id: str, point: int) -> None:
+        return db.scalar(select(Member.mb_point).where(Member.mb_id == mb_id)) or 0
+
+    @classmethod
+    def expire_points(cls) -> int:
+        """유효기간이 지난 포인트를 소멸 처리합니다.
+        - 회원 BATCH_SIZE명씩 하나의 트랜잭션에서 소멸할 포인트 내역을 잠그고(SELECT ... FOR UPDATE)
+          만료 처리한 내역의 합계만 차감하므로, 예약 작업이 동시에 실행되어도 중복 차감되지 않습니다.
+        - 잠금을 지원하지 않는 데이터베이스(SQLite)를 위해 만료 처리한 행 수가 조회한 행 수와 다르면
+          다른 작업이 먼저 처리한 것으로 보고 해당 배치를 취소합니다.
+
+        Returns:
+            int: 포인트가 소멸된 회원 수
         """
-        만료된 포인트만큼 포인트를 소멸시킵니다.
+        with DBConnect().sessionLocal() as db:
+            config = db.scalar(select(Config))
+            if not config or config.cf_point_term <= 0:
+                return 0
+
+            now = datetime.now()
+            # 소멸할 포인트 내역이 있는 회원
+            mb_ids = db.scalars(
+                select(Point.mb_id).distinct()
+                .where(Point.po_expired == 0, Point.po_expire_date < now)
+            ).all()
+            # 아래의 잠금 조회가 새 트랜잭션에서 최신 내역을 읽도록 조회 트랜잭션을 종료합니다.
+            db.rollback()
+
+            expired_count = 0
+            for i in range(0, len(mb_ids), cls.BATCH_SIZE):
+                batch_mb_ids = mb_ids[i:i + cls.BATCH_SIZE]
+                # 소멸할 포인트 내역을 잠그고 최신 값을 읽습니다.
+                rows = db.execute(
+                    select(Point.po_id, Point.mb_id, Point.po_point - Point.po_use_point)
+                    .where(Point.mb_id.in_(batch_mb_ids),
+                           Point.po_expired == 0, Point.po_expire_date < now)
+                    .with_for_update()
+                ).all()
+                if not rows:
+                    db.rollback()
+                    continue
+
+                # 소멸할 포인트가 없는 내역(모두 사용한 내역 등)도 함께 만료 처리
+                po_ids = [po_id for po_id, _, _ in rows]
+                flagged_count = 0
+                for j in range(0, len(po_ids), cls.BATCH_SIZE):
+                    flagged_count += db.execute(
+                        update(Point).values(po_expired=1)
+                        .where(Point.po_id.in_(po_ids[j:j + cls.BATCH_SIZE]), Point.po_expired == 0)
+                        .execution_options(synchronize_session=False)
+                    ).rowcount
+                if flagged_count != len(po_ids):
+                    # 다른 작업이 이미 만료 처리한 내역이 있으면 이 배치는 처리하지 않습니다.
+                    db.rollback()
+                    logging.warning("포인트 소멸: 다른 작업에서 처리 중인 내역이 있어 건너뜁니다.")
+                    continue
+
+                # 회원별 소멸할 포인트 (적립 후 사용하지 않은 포인트)
+                expire_points = Counter()
+                for _, mb_id, point in rows:
+                    expire_points[mb_id] += int(point or 0)
+                batch = [(mb_id, point) for mb_id, point in expire_points.items() if point > 0]
+                for mb_id, point in batch:
+                    mb_point = cls.add_balance(db, mb_id, -point)
+                    db.add(Point(
+                        mb_id=mb_id,
+                        po_content='포인트 소멸',
+                        po_point=-point,
+                        po_use_point=0,
+                        po_mb_point=mb_point,
+                        po_expired=1,
+                        po_rel_table='@expire',
+                        po_rel_id=str(mb_id),
+                        po_rel_action='expire-' + str(uuid.uuid4()),
+                    ))
+                db.commit()
+                expired_count += len(batch)
+                for mb_id, _ in batch:
+                    MemberCache.invalidate(mb_id)
+
+        if expired_count:
+            logging.info("포인트 소멸: %d명", expired_count)
+        return expired_count
+
+    @classmethod
+    def reconcile(cls, fix: bool = False) -> List[Tuple[str, int, int]]:
+        """회원 포인트 잔액과 포인트 내역 합계가 다른 회원을 찾습니다.
+
+        Args:
+            fix (bool, optional): True이면 회원 포인트 잔액을 포인트 내역 합계로 수정합니다.
+
+        Returns:
+            List[Tuple[str, int, int]]: (회원 아이디, 회원 포인트 잔액, 포인트 내역 합계) 목록
         """
-        member = self.member_service.fetch_member_by_id(mb_id)
-        mb_point = member.mb_point if member else 0
-        expired_point = point * (-1)
-        new_point = Point(
-            mb_id=mb_id,
-            po_content='포인트 소멸',
-            po_point=expired_point,
-            po_use_point=0,
-            po_mb_point=mb_point + expired_point,
-            po_expired=1,
-            po_rel_table='@expire',
-            po_rel_id=str(mb_id),
-            po_rel_action='expire-' + str(uuid.uuid4()),
-        )
-        self.db.add(new_point)
-        self.db.commit()
+        with DBConnect().sessionLocal() as db:
+            ledger = (
+                select(Point.mb_id, func.sum(Point.po_point).label("ledger_point"))
+                .group_by(Point.mb_id)
+                .subquery()
+            )
+            ledger_point = func.coalesce(ledger.c.ledger_point, 0)
+            mismatches = [
+                (mb_id, int(mb_point), int(point)) for mb_id, mb_point, point in db.execute(
+                    select(Member.mb_id, Member.mb_point, ledger_point)
+                    .outerjoin(ledger, ledger.c.mb_id == Member.mb_id)
+                    .where(Member.mb_point != ledger_point)
+                ).all()
+            ]
+
+            for mb_id, mb_point, point in mismatches:
+                logging.warning("포인트 불일치: %s (회원 포인트: %d, 포인트 내역 합계: %d)", mb_id, mb_point, point)
+                if fix:
+                    db.execute(
+                        update(Member).values(mb_point=point)
+                        .where(Member.mb_id == mb_id)
+                        .execution_options(synchronize_session=False)
+                    )
+            if fix and mismatches:
+                db.commit()
+                for mb_id, _, _ in mismatches:
+                    MemberCache.invalidate(mb_id)
 
-        # 포인트를 사용한 경우 포인트 내역에 사용금액 기록
-        # TODO: 주석처리된 이유를 확인해야 함
-        if expired_point < 0:
-            # insert_use_point(mb_id, point)
-            pass
+        return mismatches
 
-    def _update_expired_points(self, mb_id: str) -> None:
-        if self.point_term <= 0:
-            return None
 
-        self.db.execute(
-            update(Point).values(po_expired=1)
-            .where(Point.mb_id == mb_id,
-                   Point.po_expired != 1,
-                   Point.po_expire_date != self.MAX_DATE,
-                   Point.po_expire_date < datetime.now()
-            )
-        )
-        self.db.commit()
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="회원 포인트 잔액과 포인트 내역 합계를 비교합니다.")
+    parser.add_argument("--fix", action="store_true", help="회원 포인트 잔액을 포인트 내역 합계로 수정")
+    args = parser.parse_args()
 
-        return None
\ No newline at end of file
+    results = PointBalanceService.reconcile(fix=args.fix)
+    for result_mb_id, result_mb_point, result_ledger_point in results:
+        print(f"{result_mb_id}\t{result_mb_point}\t{result_ledger_point}")
+    print(f"불일치 회원 수: {len(results)}" + (" (수정됨)" if args.fix and results else ""))
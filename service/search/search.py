@@ -1,19 +1,60 @@
 """전체검색 관련 기능을 제공하는 서비스 모듈입니다."""
-from typing_extensions import Annotated, List
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import contextmanager
+
+from typing_extensions import Annotated, Dict, List, Set, Tuple
 from fastapi import Depends, Query, Request, HTTPException
-from sqlalchemy import select, func
+from sqlalchemy import select, func, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session, selectinload
 
 from api.v1.dependencies.member import get_current_member_optional
 from core.models import Member, Board, Group, GroupMember
-from core.database import db_session
+from core.database import DBConnect, async_db_session, db_session
 from core.exception import AlertException
+from core.settings import settings
 from lib.board_lib import BoardConfig, write_search_filter, get_list
 from lib.common import dynamic_create_write_table
 from lib.member import MemberDetails
-from service import BaseService
+from service import AsyncReadMixin, BaseService
+
+logger = logging.getLogger(__name__)
+
+# 게시판별 검색을 동시에 실행하는 스레드 풀
+# 모든 요청이 함께 사용하므로 동시에 사용하는 DB 커넥션 수가 제한됩니다.
+search_executor = ThreadPoolExecutor(max_workers=max(settings.SEARCH_MAX_WORKERS, 1),
+                                     thread_name_prefix="board-search")
 
 
-class SearchService(BaseService):
+@contextmanager
+def statement_timeout(db: Session, milliseconds: int):
+    """세션에서 실행하는 쿼리의 실행 시간을 제한합니다.
+    - PostgreSQL: SET LOCAL 이므로 트랜잭션이 끝나면 원래 값으로 돌아갑니다.
+    - MySQL: SELECT 쿼리만 제한되며, 끝나면 커넥션의 설정을 되돌립니다.
+    - SQLite는 실행 시간 제한을 지원하지 않습니다.
+    """
+    conn = db.connection()
+    dialect = conn.dialect.name
+    if dialect == "postgresql":
+        conn.execute(text(f"SET LOCAL statement_timeout = {int(milliseconds)}"))
+        yield
+    elif dialect == "mysql":
+        conn.execute(text(f"SET SESSION max_execution_time = {int(milliseconds)}"))
+        try:
+            yield
+        finally:
+            try:
+                conn.execute(text("SET SESSION max_execution_time = 0"))
+            except SQLAlchemyError:
+                # 설정을 되돌리지 못한 커넥션은 커넥션 풀에서 제외
+                conn.invalidate()
+    else:
+        yield
+
+
+class SearchService(AsyncReadMixin, BaseService):
     """
     게시판 검색 서비스 클래스
     """
@@ -41,10 +82,11 @@ class SearchService(BaseService):
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         gr_id: Annotated[str, Query()] = None,
         onetable: Annotated[str, Query()] = None,
     ):
-        instance = cls(request, db, gr_id, onetable)
+        instance = await cls.create(async_db, request, db, gr_id, onetable)
         return instance
 
     def raise_exception(self, status_code: int, detail: str = None):
@@ -62,6 +104,7 @@ class SearchService(BaseService):
         """게시판 목록 조회"""
         boards_query = (
             select(Board)
+            .options(selectinload(Board.group))
             .where(
                 Board.bo_use_search == 1,
                 Board.bo_list_level <= self.member.level,
@@ -82,65 +125,162 @@ class SearchService(BaseService):
         page: int = 1,
         per_page: int = 5
     ) -> dict:
-        """게시판 검색 데이터"""
+        """게시판 검색 데이터
+        - SEARCH_MAX_WORKERS 설정이 0보다 크면 게시판별 검색을 동시에 실행합니다.
+        - 검색 시간이 초과된 게시판은 timeout_boards로 반환합니다.
+        """
         if len(stx) < 2:
             self.raise_exception(status_code=400, detail="검색어는 2글자 이상 입력해 주세요.")
 
-        remove_boards = []
-        total_search_count = 0
         offset = (page - 1) * per_page
+        member_group_ids = self.get_member_group_ids()
+        board_configs = {}
         for board in boards:
             board_config = BoardConfig(self.request, board)
             board.subject = board_config.subject
-            # 그룹접근 사용이면서 그룹관리자도 아니고 그룹회원도 아닌 경우 boards에서 제외
+            # 그룹접근 사용이면서 그룹관리자도 아니고 그룹회원도 아닌 경우 검색에서 제외
             group = board.group
             if group.gr_use_access and not self.member.is_super_admin():
                 is_group_admin = group.gr_admin == self.member.mb_id
-                group_member = self.db.scalar(
-                    select(GroupMember).where(
-                        GroupMember.gr_id == group.gr_id,
-                        GroupMember.mb_id == self.member.mb_id
-                    )
-                )
-                if not (is_group_admin or group_member):
-                    remove_boards.append(board)
+                if not (is_group_admin or group.gr_id in member_group_ids):
                     continue
+            board_configs[board.bo_table] = board_config
+
+        timeout_tables = set()
+        if settings.SEARCH_MAX_WORKERS > 0 and len(board_configs) > 1:
+            results, timeout_tables = self.search_boards_parallel(board_configs, sfl, stx, sop, offset, per_page)
+        else:
+            results = {
+                bo_table: self.search_board(self.db, board_config, sfl, stx, sop, offset, per_page)
+                for bo_table, board_config in board_configs.items()
+            }
 
-            # 게시판 별 검색 Query 설정
-            write_model = dynamic_create_write_table(board.bo_table)
-            query = write_search_filter(write_model, search_field=sfl,
-                                        keyword=stx, operator=sop)
-            query = board_config.get_list_sort_query(write_model, query)
-            board.search_count = self.db.scalar(query.add_columns(func.count()).order_by(None))
-
-            if board.search_count > 0:
-                board.writes = self.db.scalars(query.add_columns(write_model).\
-                                offset(offset).limit(per_page)).all()
-                total_search_count += board.search_count
-                for write in board.writes:
-                    write = get_list(self.request, self.db, write, board_config)
-                    if write.wr_is_comment:
-                        word = "댓글"
-                        parent_write = self.db.get(write_model, write.wr_parent)
-                        if parent_write:
-                            write.subject = parent_write.wr_subject
-                            write.href = f"/board/{board.bo_table}/{parent_write.wr_id}?{self.request.query_params}#c_{write.wr_id}"
-                    else:
-                        word = "글"
-                        write.href = f"/board/{board.bo_table}/{write.wr_id}?{self.request.query_params}"
-
-                    if "secret" in write.wr_option:
-                        write.wr_content = f"[비밀{word} 입니다.]"
+        remove_boards = []
+        timeout_boards = [board for board in boards if board.bo_table in timeout_tables]
+        total_search_count = 0
+        for board in boards:
+            search_count, writes = results.get(board.bo_table, (0, []))
+            if search_count > 0:
+                board.search_count = search_count
+                board.writes = writes
+                total_search_count += search_count
             else:
                 # 검색 결과가 없으면 remove_boards 추가
                 remove_boards.append(board)
-                continue
 
         # boards에서 제외된 게시판 제거
         for board in remove_boards:
             boards.remove(board)
 
-        return {"total_search_count": total_search_count, "boards": boards}
+        return {"total_search_count": total_search_count, "boards": boards, "timeout_boards": timeout_boards}
+
+    def get_member_group_ids(self) -> Set[str]:
+        """로그인 회원이 속한 게시판 그룹 아이디 목록 조회"""
+        if not self.member.mb_id:
+            return set()
+        return set(self.db.scalars(
+            select(GroupMember.gr_id).where(GroupMember.mb_id == self.member.mb_id)
+        ).all())
+
+    def search_boards_parallel(
+        self,
+        board_configs: Dict[str, BoardConfig],
+        sfl: str,
+        stx: str,
+        sop: str,
+        offset: int,
+        per_page: int
+    ) -> Tuple[Dict[str, Tuple[int, list]], Set[str]]:
+        """게시판별 검색을 스레드 풀에서 동시에 실행하고 결과를 합칩니다.
+        - 게시판마다 별도의 세션을 사용합니다.
+        - 모든 게시판의 검색은 SEARCH_BOARD_TIMEOUT(초) 안에 끝나야 하며,
+          시간 안에 끝나지 않은 게시판은 시간 초과된 게시판 목록으로 함께 반환합니다.
+        - 시간이 초과된 후에 시작하는 검색은 실행하지 않고,
+          실행 중인 쿼리는 데이터베이스의 실행 시간 제한으로 중단합니다. (MySQL, PostgreSQL)
+        """
+        deadline = time.monotonic() + settings.SEARCH_BOARD_TIMEOUT
+
+        def search_with_session(board_config: BoardConfig):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return None
+            with DBConnect().sessionLocal() as db, statement_timeout(db, int(remaining * 1000)):
+                return self.search_board(db, board_config, sfl, stx, sop, offset, per_page)
+
+        futures = {
+            bo_table: search_executor.submit(search_with_session, board_config)
+            for bo_table, board_config in board_configs.items()
+        }
+        wait(futures.values(), timeout=max(deadline - time.monotonic(), 0))
+
+        results = {}
+        timeout_tables = set()
+        for bo_table, future in futures.items():
+            result = None
+            if future.done():
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    logger.warning("게시판 검색에 실패했습니다. (%s) %s", bo_table, exc)
+            else:
+                future.cancel()
+            if result is None:
+                timeout_tables.add(bo_table)
+            else:
+                results[bo_table] = result
+        if timeout_tables:
+            logger.warning("게시판 검색 시간이 초과되었습니다. (%s)", ", ".join(sorted(timeout_tables)))
+        return results, timeout_tables
+
+    def search_board(
+        self,
+        db: Session,
+        board_config: BoardConfig,
+        sfl: str,
+        stx: str,
+        sop: str,
+        offset: int,
+        per_page: int
+    ) -> Tuple[int, list]:
+        """게시판 1개의 검색 결과 수와 게시글 목록을 조회합니다."""
+        board = board_config.board
+        write_model = dynamic_create_write_table(board.bo_table)
+        query = write_search_filter(write_model, search_field=sfl,
+                                    keyword=stx, operator=sop)
+        query = board_config.get_list_sort_query(write_model, query)
+        search_count = db.scalar(query.add_columns(func.count()).order_by(None))
+        if not search_count:
+            return 0, []
+
+        writes = db.scalars(query.add_columns(write_model).\
+                            offset(offset).limit(per_page)).all()
+
+        # 댓글의 원글은 한번에 조회
+        parent_ids = {write.wr_parent for write in writes if write.wr_is_comment}
+        parent_writes = {}
+        if parent_ids:
+            parent_writes = {
+                parent.wr_id: parent for parent in db.scalars(
+                    select(write_model).where(write_model.wr_id.in_(parent_ids))
+                ).all()
+            }
+
+        for write in writes:
+            write = get_list(self.request, db, write, board_config)
+            if write.wr_is_comment:
+                word = "댓글"
+                parent_write = parent_writes.get(write.wr_parent)
+                if parent_write:
+                    write.subject = parent_write.wr_subject
+                    write.href = f"/board/{board.bo_table}/{parent_write.wr_id}?{self.request.query_params}#c_{write.wr_id}"
+            else:
+                word = "글"
+                write.href = f"/board/{board.bo_table}/{write.wr_id}?{self.request.query_params}"
+
+            if "secret" in write.wr_option:
+                write.wr_content = f"[비밀{word} 입니다.]"
+
+        return search_count, writes
 
 
 class SearchServiceAPI(SearchService):
@@ -165,11 +305,12 @@ class SearchServiceAPI(SearchService):
         cls,
         request: Request,
         db: db_session,
+        async_db: async_db_session,
         member: Annotated[Member, Depends(get_current_member_optional)],
         gr_id: str = None,
         onetable: str = None,
     ):
-        instance = cls(request, db, member, gr_id, onetable)
+        instance = await cls.create(async_db, request, db, member, gr_id, onetable)
         return instance
 
     def raise_exception(self, status_code: int, detail: str = None):
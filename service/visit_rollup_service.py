@@ -0,0 +1,230 @@
+"""방문자 집계 테이블을 관리하고 접속자집계 통계를 계산하는 모듈입니다.
+
+접속 이력과 방문자 집계 비교 및 재집계:
+    python -m service.visit_rollup_service [--from YYYY-MM-DD --to YYYY-MM-DD]
+"""
+import argparse
+import logging
+import re
+from collections import Counter
+from datetime import date, datetime, timedelta
+from typing import Iterable, List, Mapping, Optional, Tuple, Union
+from urllib.parse import urlsplit
+
+import pandas as pd
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.orm import Session
+
+from core.database import DBConnect
+from core.models import Visit, VisitRollup
+from lib.user_agent import get_browser, get_os
+
+RollupKey = Tuple[date, int, str, str, str, str]  # (날짜, 시간, 브라우저, OS, 접속기기, 유입 도메인)
+ROLLUP_COLUMNS = ["vr_date", "vr_hour", "vr_browser", "vr_os", "vr_device", "vr_domain"]
+DOMAIN_PREFIX_PATTERN = re.compile(r"^(www\.|search\.|dirsearch\.|dir\.search\.|dir\.|kr\.search\.|myhome\.)")
+
+
+def get_referer_domain(referer: str) -> str:
+    """유입 경로(referer)의 도메인을 반환합니다.
+    - http(s) 주소가 아니면 직접 접속으로 보고 빈 문자열을 반환합니다.
+    """
+    if not referer or not re.match(r"^https?://", referer, re.IGNORECASE):
+        return ""
+    try:
+        netloc = urlsplit(referer.strip()).netloc.lower()
+    except ValueError:
+        return ""
+    netloc = netloc.rsplit("@", 1)[-1]
+    return DOMAIN_PREFIX_PATTERN.sub("", netloc)[:255]
+
+
+class VisitRollupService:
+    """
+    방문자 집계 테이블(VisitRollup)을 관리하는 클래스
+    - 접속 이력이 기록될 때 같은 트랜잭션에서 집계 테이블의 방문자 수를 증가시킵니다.
+    - 통계는 집계 테이블의 행만 pandas DataFrame으로 읽어서 계산합니다.
+    - 집계되지 않은 기존 접속 이력과 집계가 맞지 않는 날짜는 스케줄러(backfill)에서
+      접속 이력으로 다시 집계합니다.
+    """
+    _table_checked = False
+
+    @classmethod
+    def create_table(cls, db: Session) -> None:
+        """집계 테이블이 없으면 생성합니다. (기존 설치 환경)"""
+        if cls._table_checked:
+            return
+        VisitRollup.__table__.create(bind=db.get_bind(), checkfirst=True)
+        cls._table_checked = True
+
+    @staticmethod
+    def make_key(visit: Mapping) -> RollupKey:
+        """접속 이력(vi_* 필드)에서 집계 조건을 만듭니다."""
+        user_agent = visit["vi_agent"] or ""
+        return (
+            visit["vi_date"],
+            visit["vi_time"].hour if visit["vi_time"] else 0,
+            (visit["vi_browser"] or get_browser(user_agent))[:255],
+            (visit["vi_os"] or get_os(user_agent))[:255],
+            (visit["vi_device"] or "")[:255],
+            get_referer_domain(visit["vi_referer"]),
+        )
+
+    @classmethod
+    def add_visits(cls, db: Session, visits: Iterable[Mapping]) -> None:
+        """새로 기록된 접속 이력만큼 집계 테이블의 방문자 수를 증가시킵니다.
+        - commit은 접속 이력을 기록한 쪽에서 합니다.
+        """
+        counts = Counter(cls.make_key(visit) for visit in visits)
+        # 잠금 순서를 일정하게 유지하기 위해 정렬
+        for key, count in sorted(counts.items()):
+            values = dict(zip(ROLLUP_COLUMNS, key))
+            result = db.execute(
+                update(VisitRollup)
+                .where(*[getattr(VisitRollup, column) == value for column, value in values.items()])
+                .values(vr_count=VisitRollup.vr_count + count)
+            )
+            if not result.rowcount:
+                db.execute(insert(VisitRollup).values(**values, vr_count=count))
+
+    @classmethod
+    def rebuild(cls, db: Session, visit_date: date) -> None:
+        """해당 날짜의 집계를 접속 이력에서 다시 계산합니다.
+        - ORM 객체를 만들지 않고 필요한 컬럼만 나누어 읽습니다.
+        """
+        rows = db.execute(
+            select(Visit.vi_date, Visit.vi_time, Visit.vi_referer, Visit.vi_agent,
+                   Visit.vi_browser, Visit.vi_os, Visit.vi_device)
+            .where(Visit.vi_date == visit_date)
+            .execution_options(yield_per=5000)
+        )
+        counts = Counter(cls.make_key(row._mapping) for row in rows)
+
+        db.execute(delete(VisitRollup).where(VisitRollup.vr_date == visit_date))
+        if counts:
+            db.execute(
+                insert(VisitRollup),
+                [{**dict(zip(ROLLUP_COLUMNS, key)), "vr_count": count} for key, count in counts.items()]
+            )
+
+    @classmethod
+    def sync(cls, db: Session, from_date: date, to_date: date) -> List[date]:
+        """기간 중 접속 이력과 방문자 수가 다른 날짜를 다시 집계합니다.
+        - 접속 이력 전체를 집계하므로 통계 조회 중에는 호출하지 않습니다.
+        - 날짜마다 commit합니다.
+
+        Returns:
+            List[date]: 다시 집계한 날짜 목록
+        """
+        visit_counts = dict(db.execute(
+            select(Visit.vi_date, func.count(Visit.vi_id))
+            .where(Visit.vi_date.between(from_date, to_date))
+            .group_by(Visit.vi_date)
+        ).all())
+        rollup_counts = dict(db.execute(
+            select(VisitRollup.vr_date, func.sum(VisitRollup.vr_count))
+            .where(VisitRollup.vr_date.between(from_date, to_date))
+            .group_by(VisitRollup.vr_date)
+        ).all())
+        stale_dates = [
+            visit_date for visit_date in set(visit_counts) | set(rollup_counts)
+            if visit_counts.get(visit_date, 0) != (rollup_counts.get(visit_date) or 0)
+        ]
+        for visit_date in sorted(stale_dates):
+            cls.rebuild(db, visit_date)
+            db.commit()
+        return sorted(stale_dates)
+
+    @classmethod
+    def backfill(cls, from_date: Optional[date] = None, to_date: Optional[date] = None) -> List[date]:
+        """접속 이력으로 방문자 집계를 다시 계산합니다. (스케줄러, 명령행)
+        - 기간을 지정하지 않으면 집계 테이블의 첫 날짜보다 이전의 접속 이력(집계 테이블 도입 이전 데이터)과
+          어제의 집계를 확인합니다. 오늘은 방문자가 계속 기록되므로 확인하지 않습니다.
+
+        Args:
+            from_date (Optional[date], optional): 시작일. Defaults to None.
+            to_date (Optional[date], optional): 종료일. Defaults to None.
+
+        Returns:
+            List[date]: 다시 집계한 날짜 목록
+        """
+        with DBConnect().sessionLocal() as db:
+            cls.create_table(db)
+            if from_date and to_date:
+                rebuilt_dates = cls.sync(db, from_date, to_date)
+            else:
+                today = date.today()
+                first_rollup_date = db.scalar(select(func.min(VisitRollup.vr_date)))
+                legacy_to_date = min(first_rollup_date, today) if first_rollup_date else today
+                legacy_dates = db.scalars(
+                    select(Visit.vi_date).distinct()
+                    .where(Visit.vi_date < legacy_to_date)
+                    .order_by(Visit.vi_date)
+                ).all()
+                for visit_date in legacy_dates:
+                    cls.rebuild(db, visit_date)
+                    db.commit()
+
+                yesterday = today - timedelta(days=1)
+                rebuilt_dates = list(legacy_dates) + [
+                    visit_date for visit_date in cls.sync(db, yesterday, yesterday)
+                    if visit_date not in legacy_dates
+                ]
+
+        if rebuilt_dates:
+            logging.info("방문자 재집계: %d일", len(rebuilt_dates))
+        return rebuilt_dates
+
+    @classmethod
+    def load_frame(cls, db: Session,
+                   from_date: Union[str, date], to_date: Union[str, date]) -> pd.DataFrame:
+        """조회 기간의 집계 테이블을 DataFrame으로 반환합니다."""
+        if isinstance(from_date, str):
+            from_date = datetime.strptime(from_date, "%Y-%m-%d").date()
+        if isinstance(to_date, str):
+            to_date = datetime.strptime(to_date, "%Y-%m-%d").date()
+
+        cls.create_table(db)
+        rows = db.execute(
+            select(*[getattr(VisitRollup, column) for column in ROLLUP_COLUMNS], VisitRollup.vr_count)
+            .where(VisitRollup.vr_date.between(from_date, to_date))
+        ).all()
+        frame = pd.DataFrame(rows, columns=ROLLUP_COLUMNS + ["vr_count"])
+        frame["vr_date"] = pd.to_datetime(frame["vr_date"])
+        return frame
+
+    @staticmethod
+    def count_by(frame: pd.DataFrame, by: Union[str, pd.Series],
+                 field_name: str, sort_by_count: bool = True) -> List[dict]:
+        """방문자 수를 by 기준으로 합산하여 {field_name, count, percent} 목록으로 반환합니다.
+
+        Args:
+            frame (pd.DataFrame): load_frame()의 결과
+            by (Union[str, pd.Series]): 합산 기준 컬럼 이름 또는 frame과 같은 길이의 Series
+            field_name (str): 합산 기준을 저장할 필드 이름
+            sort_by_count (bool, optional): 방문자 수 내림차순 정렬 여부. False이면 기준값 오름차순.
+        """
+        if frame.empty:
+            return []
+
+        counts = frame.groupby(by)["vr_count"].sum()
+        if sort_by_count:
+            counts = counts.sort_values(ascending=False, kind="stable")
+        percents = (counts / counts.sum() * 100).round(2)
+        return [
+            {field_name: key, "count": int(count), "percent": float(percent)}
+            for key, count, percent in zip(counts.index, counts.to_numpy(), percents.to_numpy())
+        ]
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="접속 이력과 방문자 집계를 비교하여 다시 집계합니다.")
+    parser.add_argument("--from", dest="from_date", type=date.fromisoformat, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--to", dest="to_date", type=date.fromisoformat, help="종료일 (YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    if bool(args.from_date) != bool(args.to_date):
+        parser.error("--from과 --to를 함께 지정해야 합니다.")
+    results = VisitRollupService.backfill(args.from_date, args.to_date)
+    for result_date in results:
+        print(result_date.isoformat())
+    print(f"재집계한 날짜 수: {len(results)}")
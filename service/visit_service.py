@@ -1,15 +1,21 @@
 """방문자 서비스를 제공하는 모듈입니다."""
 from datetime import date, datetime, timedelta
+import logging
 import re
-from typing import Union
+import threading
+from typing import Dict, List, Union
 
 from fastapi import Request
-from sqlalchemy import exists, func, select
-from user_agents import parse
+from sqlalchemy import exists, func, insert, select, update
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
 
-from core.database import db_session
+from core.database import DBConnect, db_session
 from core.models import Config, Visit, VisitSum
 from lib.common import get_client_ip
+from lib.config_cache import ConfigCache
+from lib.user_agent import classify_user_agent
+from service.visit_rollup_service import VisitRollupService
 
 
 class VisitService:
@@ -41,6 +47,7 @@ class VisitService:
         """
         방문자 접속 이력 생성 함수
         - 새로운 접속 이력 생성
+        - 방문자 집계 테이블 갱신
         - 방문자 합계 테이블 갱신
         - 기본설정 테이블에 방문자 수 기록
         """
@@ -50,18 +57,21 @@ class VisitService:
 
         referer = self.request.headers.get("referer", "")
         user_agent = self.request.headers.get("User-Agent", "")
-        browser, os, device = self._parse_user_agent(user_agent)
-        visit = Visit(
-            vi_ip=vi_ip,
-            vi_date=self.today,
-            vi_time=datetime.now().time(),
-            vi_referer=referer,
-            vi_agent=user_agent,
-            vi_browser=browser,
-            vi_os=os,
-            vi_device=device,
-        )
+        browser, os, device = self.parse_user_agent(user_agent)
+        values = {
+            "vi_ip": vi_ip,
+            "vi_date": self.today,
+            "vi_time": datetime.now().time(),
+            "vi_referer": referer,
+            "vi_agent": user_agent,
+            "vi_browser": browser,
+            "vi_os": os,
+            "vi_device": device,
+        }
+        VisitRollupService.create_table(self.db)
+        visit = Visit(**values)
         self.db.add(visit)
+        VisitRollupService.add_visits(self.db, [values])
         self.db.commit()
         self.db.refresh(visit)
 
@@ -79,13 +89,11 @@ class VisitService:
             ).select()
         )
 
-    def _parse_user_agent(self, user_agent: str):
+    @staticmethod
+    def parse_user_agent(user_agent: str):
         """User-Agent 문자열을 파싱하여 브라우저, OS, 디바이스 정보를 반환합니다."""
-        ua = parse(user_agent)
-        browser = getattr(ua.browser, 'family', 'unknown')
-        os = getattr(ua.os, 'family', 'unknown')
-        device = 'pc' if ua.is_pc else 'mobile' if ua.is_mobile else 'tablet' if ua.is_tablet else 'unknown'
-        return browser, os, device
+        info = classify_user_agent(user_agent)
+        return info.browser, info.os, info.device
 
     def _update_config(self) -> None:
         """기본설정 테이블 > 방문자 수 갱신 함수"""
@@ -103,6 +111,9 @@ class VisitService:
         config.cf_visit = f"오늘:{today},어제:{yesterday},최대:{visit_max},전체:{visit_total}"
         self.db.commit()
 
+        # 방문자 수는 자주 변경되므로 현재 워커의 캐시만 갱신
+        ConfigCache.update_local(cf_visit=config.cf_visit)
+
     def _update_visit_sum(self) -> None:
         """방문자 합계 테이블 갱신 함수"""
         visit_count_today = self.db.scalar(
@@ -111,3 +122,131 @@ class VisitService:
         )
         self.db.merge(VisitSum(vs_date=self.today, vs_count=visit_count_today))
         self.db.commit()
+
+
+class VisitRecorder:
+    """
+    방문자 접속 이력을 모아서 기록하는 클래스
+    - 요청 중에는 접속 정보를 메모리에 추가만 하고,
+      flush()가 주기적으로 호출될 때 한번에 데이터베이스에 기록합니다.
+    - 방문자 집계, 방문자 합계와 기본설정의 방문자 수(cf_visit)는
+      전체를 다시 집계하지 않고 새로 기록된 방문자 수만큼 증가시킵니다.
+    - 워커(프로세스)마다 별도로 동작합니다.
+    """
+    _queue: List[dict] = []
+    # 오늘 이미 추가된 IP (같은 날 중복 기록 방지)
+    _seen_date: date = None
+    _seen_ips = set()
+    _lock = threading.Lock()
+    _flush_lock = threading.Lock()
+
+    @classmethod
+    def record(cls, request: Request) -> None:
+        """방문자 접속 정보를 기록 대기열에 추가합니다."""
+        today = date.today()
+        vi_ip = get_client_ip(request)
+        with cls._lock:
+            if cls._seen_date != today:
+                cls._seen_date = today
+                cls._seen_ips = set()
+            if vi_ip in cls._seen_ips:
+                return
+            cls._seen_ips.add(vi_ip)
+            cls._queue.append({
+                "vi_ip": vi_ip,
+                "vi_date": today,
+                "vi_time": datetime.now().time(),
+                "vi_referer": request.headers.get("referer", ""),
+                "vi_agent": request.headers.get("User-Agent", ""),
+            })
+
+    @classmethod
+    def flush(cls) -> int:
+        """대기열의 접속 정보를 데이터베이스에 기록합니다.
+
+        Returns:
+            int: 새로 기록된 방문자 수
+        """
+        with cls._flush_lock:
+            with cls._lock:
+                queue, cls._queue = cls._queue, []
+            if not queue:
+                return 0
+
+            visits_by_date: Dict[date, List[dict]] = {}
+            for visit in queue:
+                visits_by_date.setdefault(visit["vi_date"], []).append(visit)
+
+            inserted_count = 0
+            cf_visit = None
+            with DBConnect().sessionLocal() as db:
+                try:
+                    VisitRollupService.create_table(db)
+                    for visit_date, visits in visits_by_date.items():
+                        inserted_count += cls._insert_visits(db, visit_date, visits)
+                    if inserted_count:
+                        cf_visit = cls._update_config(db, inserted_count)
+                    db.commit()
+                except SQLAlchemyError as exc:
+                    db.rollback()
+                    logging.error("방문자 기록 실패: %s", exc)
+                    # 다음 flush()에서 다시 기록하도록 대기열에 되돌림
+                    with cls._lock:
+                        cls._queue[:0] = queue
+                    return 0
+
+            # 방문자 수는 자주 변경되므로 현재 워커의 캐시만 갱신
+            if cf_visit:
+                ConfigCache.update_local(cf_visit=cf_visit)
+            return inserted_count
+
+    @classmethod
+    def _insert_visits(cls, db: Session, visit_date: date, visits: List[dict]) -> int:
+        """같은 날짜의 접속 이력을 추가하고 방문자 집계, 방문자 합계를 증가시킵니다."""
+        # 다른 워커에서 이미 기록한 IP는 제외
+        exists_ips = set(db.scalars(
+            select(Visit.vi_ip).where(
+                Visit.vi_date == visit_date,
+                Visit.vi_ip.in_([visit["vi_ip"] for visit in visits])
+            )
+        ).all())
+        new_visits = []
+        for visit in visits:
+            if visit["vi_ip"] in exists_ips:
+                continue
+            exists_ips.add(visit["vi_ip"])
+            browser, os, device = VisitService.parse_user_agent(visit["vi_agent"])
+            new_visits.append({**visit, "vi_browser": browser, "vi_os": os, "vi_device": device})
+        if not new_visits:
+            return 0
+
+        db.execute(insert(Visit), new_visits)
+        VisitRollupService.add_visits(db, new_visits)
+        result = db.execute(
+            update(VisitSum)
+            .where(VisitSum.vs_date == visit_date)
+            .values(vs_count=VisitSum.vs_count + len(new_visits))
+        )
+        if not result.rowcount:
+            db.execute(insert(VisitSum).values(vs_date=visit_date, vs_count=len(new_visits)))
+        return len(new_visits)
+
+    @classmethod
+    def _update_config(cls, db: Session, inserted_count: int) -> str:
+        """기본설정 테이블 > 방문자 수를 새로 기록된 방문자 수만큼 갱신합니다.
+        - 최대, 전체 방문자 수는 방문자 합계 테이블 전체를 집계하지 않고 기존 값에서 계산합니다.
+        """
+        today = date.today()
+        config = db.scalar(select(Config).with_for_update())
+        visit = VisitService.parse_visit_data(config.cf_visit)
+        visit_today = db.scalar(
+            select(VisitSum.vs_count).where(VisitSum.vs_date == today)
+        ) or 0
+        visit_yesterday = db.scalar(
+            select(VisitSum.vs_count).where(VisitSum.vs_date == today - timedelta(days=1))
+        ) or 0
+        visit_max = max(visit["max"], visit_today)
+        visit_total = visit["total"] + inserted_count
+
+        config.cf_visit = f"오늘:{visit_today},어제:{visit_yesterday},최대:{visit_max},전체:{visit_total}"
+        return config.cf_visit
@@ -0,0 +1,74 @@
+"""게시글 삭제 API의 의존성(DeletePostServiceAPI.async_init) 테스트"""
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.dependencies.member import get_current_member_optional
+from api.v1.routers import board as board_router
+from api.v1.service import board as board_service
+from api.v1.service.point import PointServiceAPI
+from core.database import get_db
+from service.board.delete_post import DeletePostService
+from service.board_file_service import BoardFileService
+
+
+@pytest.fixture
+def client(monkeypatch):
+    """데이터베이스 없이 게시글 삭제 API를 호출하는 클라이언트"""
+    calls = []
+
+    def fake_init(self, request, db, file_service, point_service, bo_table, wr_id):
+        self.request = request
+        self.db = db
+        self.bo_table = bo_table
+        self.wr_id = wr_id
+        self.board = SimpleNamespace(bo_table=bo_table)
+        self.write = SimpleNamespace(wr_id=wr_id, mb_id="")
+
+    monkeypatch.setattr(DeletePostService, "__init__", fake_init)
+    monkeypatch.setattr(board_service, "MemberDetails", lambda *args, **kwargs: None)
+    for name in ("validate_level", "validate_exists_reply", "validate_exists_comment", "delete_write"):
+        monkeypatch.setattr(
+            DeletePostService, name,
+            lambda self, *args, _name=name, **kwargs: calls.append((_name, self.bo_table, self.wr_id))
+        )
+
+    async def fake_validate_author(self, *args, **kwargs):
+        calls.append(("validate_author", self.bo_table, self.wr_id))
+
+    monkeypatch.setattr(DeletePostService, "validate_author", fake_validate_author)
+
+    async def fake_get_db():
+        yield None
+
+    app = FastAPI()
+    app.include_router(board_router.router, prefix="/boards")
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_current_member_optional] = lambda: None
+    app.dependency_overrides[BoardFileService] = lambda: None
+    app.dependency_overrides[PointServiceAPI] = lambda: None
+
+    with TestClient(app) as test_client:
+        test_client.calls = calls
+        yield test_client
+
+
+def test_delete_post(client):
+    """회원 글 삭제 API가 서비스를 생성하고 글을 삭제한다."""
+    response = client.delete("/boards/free/writes/1")
+
+    assert response.status_code == 200
+    assert response.json() == {"result": "deleted"}
+    assert ("delete_write", "free", 1) in client.calls
+
+
+def test_delete_guest_post(client):
+    """비회원 글 삭제 API가 비밀번호를 확인한 후 글을 삭제한다."""
+    response = client.post("/boards/free/writes/1/delete", json="password")
+
+    assert response.status_code == 200
+    assert response.json() == {"result": "deleted"}
+    assert client.calls[0] == ("validate_author", "free", 1)
+    assert ("delete_write", "free", 1) in client.calls
@@ -0,0 +1,83 @@
+"""게시글 목록 API의 비동기 엔진 조회(ListPostServiceAPI.async_init, AsyncReadMixin) 테스트"""
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.v1.dependencies.member import get_current_member_optional
+from api.v1.models.board import ResponseBoardModel
+from api.v1.routers import board as board_router
+from api.v1.service import board as board_service
+from core.database import get_async_db, get_db
+from service.board.list_post import ListPostService
+from service.board_file_service import BoardFileService
+
+
+class FakeAsyncSession:
+    """AsyncSession.run_sync()를 흉내내는 비동기 세션"""
+
+    def __init__(self):
+        self.sync_session = object()
+        self.run_sync_count = 0
+
+    async def run_sync(self, func, *args, **kwargs):
+        self.run_sync_count += 1
+        return func(self.sync_session, *args, **kwargs)
+
+
+@pytest.fixture
+def async_db():
+    return FakeAsyncSession()
+
+
+@pytest.fixture
+def client(monkeypatch, async_db):
+    """데이터베이스 없이 비동기 세션으로 게시글 목록 API를 호출하는 클라이언트"""
+    def fake_init(self, request, db, bo_table, file_service, search_params):
+        self.request = request
+        self.db = db
+        self.bo_table = bo_table
+        self.board = {name: field.annotation() for name, field in ResponseBoardModel.model_fields.items()}
+        self.board["bo_table"] = bo_table
+        self.categories = []
+        self.search_params = {**search_params, "current_page": 1}
+        self.prev_spt = None
+        self.next_spt = None
+        self.prev_cursor = None
+        self.next_cursor = None
+
+    def fake_get_writes(self, **kwargs):
+        # 비동기 엔진을 사용하면 run_sync()로 전달된 동기 세션으로 조회해야 한다.
+        assert self.db is async_db.sync_session
+        return []
+
+    monkeypatch.setattr(ListPostService, "__init__", fake_init)
+    monkeypatch.setattr(ListPostService, "get_writes", fake_get_writes)
+    monkeypatch.setattr(ListPostService, "get_total_count", lambda self: 0)
+    monkeypatch.setattr(board_service, "MemberDetails", lambda *args, **kwargs: None)
+
+    async def fake_get_db():
+        yield None
+
+    async def fake_get_async_db():
+        yield async_db
+
+    app = FastAPI()
+    app.include_router(board_router.router, prefix="/boards")
+    app.dependency_overrides[get_db] = fake_get_db
+    app.dependency_overrides[get_async_db] = fake_get_async_db
+    app.dependency_overrides[get_current_member_optional] = lambda: None
+    app.dependency_overrides[BoardFileService] = lambda: None
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+def test_list_post_with_async_db(client, async_db):
+    """비동기 세션이 있으면 서비스 생성과 목록 조회를 run_sync()로 실행한다."""
+    response = client.get("/boards/free/writes")
+
+    assert response.status_code == 200
+    assert response.json()["board"]["bo_table"] == "free"
+    assert response.json()["writes"] == []
+    # 서비스 생성, 목록 조회, 게시글 수 조회
+    assert async_db.run_sync_count == 3